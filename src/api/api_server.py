@@ -461,36 +461,37 @@ async def get_regime_classification(
         df['volatility'] = df['returns'].rolling(20).std()
         df['sma_20'] = df['close'].rolling(20).mean()
         
-        # Classify regimes
-        regimes = []
+        # Classify regimes (NaN masks computed once per column, not per row)
         regime_names = {0: "High Volatility", 1: "Bearish", 2: "Neutral", 3: "Bullish"}
         
-        for idx, row in df.iterrows():
-            if pd.isna(row['volatility']) or pd.isna(row['sma_20']):
-                regime = 2  # Neutral
-            else:
-                # High volatility regime
-                if row['volatility'] > df['volatility'].quantile(0.75):
-                    regime = 0
-                # Bullish: price above SMA and positive returns
-                elif row['close'] > row['sma_20'] and row['returns'] > 0:
-                    regime = 3
-                # Bearish: price below SMA and negative returns
-                elif row['close'] < row['sma_20'] and row['returns'] < 0:
-                    regime = 1
-                # Neutral
-                else:
-                    regime = 2
-            
-            regimes.append({
-                'timestamp': row['timestamp'].isoformat(),
+        close = df['close'].to_numpy()
+        returns = df['returns'].to_numpy()
+        volatility = df['volatility'].to_numpy()
+        sma_20 = df['sma_20'].to_numpy()
+        
+        regime_codes = np.select(
+            [
+                np.isnan(volatility) | np.isnan(sma_20),                    # Neutral
+                volatility > np.nanquantile(volatility, 0.75),              # High volatility regime
+                (close > sma_20) & (returns > 0),                           # Bullish: price above SMA and positive returns
+                (close < sma_20) & (returns < 0),                           # Bearish: price below SMA and negative returns
+            ],
+            [2, 0, 3, 1],
+            default=2                                                       # Neutral
+        )
+        
+        regimes = [
+            {
+                'timestamp': ts.isoformat(),
                 'regime': regime,
                 'regime_name': regime_names[regime],
                 'probability': 0.85  # Mock probability
-            })
+            }
+            for ts, regime in zip(df['timestamp'], regime_codes.tolist())
+        ]
         
         # Calculate distribution
-        regime_counts = pd.Series([r['regime'] for r in regimes]).value_counts()
+        regime_counts = pd.Series(regime_codes).value_counts()
         total = len(regimes)
         distribution = {regime_names[k]: float(v) / total for k, v in regime_counts.items()}
         
@@ -588,23 +589,15 @@ async def get_technical_indicators(
         df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
         df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
         
-        # Convert to response
-        indicators = []
-        for idx, row in df.iterrows():
-            indicators.append({
-                'timestamp': row['timestamp'].isoformat(),
-                'sma_20': float(row['sma_20']) if not pd.isna(row['sma_20']) else None,
-                'sma_50': float(row['sma_50']) if not pd.isna(row['sma_50']) else None,
-                'ema_12': float(row['ema_12']) if not pd.isna(row['ema_12']) else None,
-                'ema_26': float(row['ema_26']) if not pd.isna(row['ema_26']) else None,
-                'rsi': float(row['rsi']) if not pd.isna(row['rsi']) else None,
-                'macd': float(row['macd']) if not pd.isna(row['macd']) else None,
-                'macd_signal': float(row['macd_signal']) if not pd.isna(row['macd_signal']) else None,
-                'macd_histogram': float(row['macd_histogram']) if not pd.isna(row['macd_histogram']) else None,
-                'bb_upper': float(row['bb_upper']) if not pd.isna(row['bb_upper']) else None,
-                'bb_middle': float(row['bb_middle']) if not pd.isna(row['bb_middle']) else None,
-                'bb_lower': float(row['bb_lower']) if not pd.isna(row['bb_lower']) else None
-            })
+        # Convert to response: NaN -> None via one mask per column
+        indicator_cols = [
+            'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi',
+            'macd', 'macd_signal', 'macd_histogram',
+            'bb_upper', 'bb_middle', 'bb_lower'
+        ]
+        values = df[indicator_cols].astype(object).where(df[indicator_cols].notna(), None)
+        values.insert(0, 'timestamp', [ts.isoformat() for ts in df['timestamp']])
+        indicators = values.to_dict('records')
         
         return {'indicators': indicators}
     
@@ -3,17 +3,22 @@ Bitcoin Market Intelligence REST API - REAL DATA VERSION
 FastAPI server with REAL Binance price data (no database required).
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import asyncio
 import random
 import logging
 import json
+import os
+import time
 import urllib.request
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
 
 logging.basicConfig(level=logging.INFO)
@@ -25,11 +30,32 @@ DATA_DIR = PROJECT_ROOT / "data" / "hot"
 
 logger.info(f"📁 Data directory: {DATA_DIR}")
 
+# Timestamp format emitted by the historical endpoints
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Leading rows left NaN by the rolling windows (longest window - 1)
+INDICATOR_WARMUP = 20 - 1   # Bollinger Bands (20)
+REGIME_WARMUP = 50 - 1      # ma_long (50)
+
+# Regime category codes for the demo classifier
+REGIME_NEUTRAL, REGIME_BULLISH, REGIME_BEARISH = 0, 1, 2
+REGIME_LABELS = ['neutral', 'bullish', 'bearish']
+
+# Media type for Arrow IPC stream responses (?format=arrow)
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# os.stat results (or None for missing files): path -> (checked_at, stat_result)
+_stat_cache: Dict[Path, tuple] = {}
+
+# Normalised Parquet frames: "{symbol}_{interval}" -> (mtime_ns, frame, timestamp_ns)
+_frame_cache: Dict[str, tuple] = {}
+
 # Create FastAPI app
 app = FastAPI(
     title="Bitcoin Market Intelligence API (Real Data)",
     description="Real-time API with live Binance price data",
-    version="1.0.0-real"
+    version="1.0.0-real",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS
@@ -163,6 +189,118 @@ class BinanceDataFetcher:
 # Global data fetcher
 binance_fetcher = BinanceDataFetcher()
 
+def _stat_cached(path: Path, ttl: float = 1.0):
+    """
+    Return os.stat(path), or None if the file is missing.
+
+    Results (including misses) are memoised for `ttl` seconds so existence
+    and mtime checks cost at most one syscall per file per TTL window.
+    """
+    now = time.monotonic()
+    cached = _stat_cache.get(path)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        stat_result = None
+    
+    _stat_cache[path] = (now, stat_result)
+    return stat_result
+
+
+def load_market_frame(symbol: str, interval: str):
+    """
+    Load a Parquet file, normalising timestamps once at cache-insert time.
+
+    The 'time' column is renamed to 'timestamp' and stored as pre-formatted
+    ISO strings, alongside a parallel int64 nanosecond array used for
+    searchsorted slicing. Entries are invalidated when the file's mtime changes.
+
+    Returns:
+        (frame, timestamp_ns) tuple, or None if the file does not exist
+    """
+    data_path = DATA_DIR / f"{symbol}_{interval}.parquet"
+    stat_result = _stat_cached(data_path)
+    if stat_result is None:
+        return None
+    mtime_ns = stat_result.st_mtime_ns
+    
+    cache_key = f"{symbol}_{interval}"
+    cached = _frame_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+    
+    df = pd.read_parquet(data_path)
+    
+    # Rename 'time' to 'timestamp' for page compatibility
+    if 'time' in df.columns:
+        df = df.rename(columns={'time': 'timestamp'})
+    
+    timestamps = pd.to_datetime(df['timestamp'])
+    if not timestamps.is_monotonic_increasing:
+        order = np.argsort(timestamps.to_numpy(), kind='stable')
+        df = df.iloc[order].reset_index(drop=True)
+        timestamps = timestamps.iloc[order].reset_index(drop=True)
+    
+    timestamp_ns = timestamps.to_numpy().astype('datetime64[ns]').view('int64')
+    seconds = pc.cast(pa.array(timestamps), pa.timestamp('s'), safe=False)
+    df['timestamp'] = pd.array(
+        pc.strftime(seconds, format=ISO_FORMAT),
+        dtype=pd.ArrowDtype(pa.string())
+    )
+    
+    _frame_cache[cache_key] = (mtime_ns, df, timestamp_ns)
+    logger.info(f"Loaded {len(df)} rows from {data_path}")
+    return df, timestamp_ns
+
+
+def slice_time_range(
+    df: pd.DataFrame,
+    timestamp_ns: np.ndarray,
+    start: Optional[str],
+    end: Optional[str]
+) -> pd.DataFrame:
+    """Slice a cached frame to [start, end] by binary search on the ns keys."""
+    lo = np.searchsorted(timestamp_ns, pd.Timestamp(start).value, side='left') if start else 0
+    hi = np.searchsorted(timestamp_ns, pd.Timestamp(end).value, side='right') if end else len(df)
+    return df.iloc[lo:hi]
+
+
+def frame_response(df: pd.DataFrame, format: str):
+    """
+    Serialise a result frame in the requested wire format.
+
+    - json:    {"success", "count", "data": [{...}, ...]} (row records)
+    - columns: {"success", "count", "columns": {col: [...], ...}}
+    - arrow:   Arrow IPC stream bytes
+    """
+    if format == "arrow":
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return Response(sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE)
+    
+    # Pre-built ORJSONResponse: skips jsonable_encoder on the large data list
+    if format == "columns":
+        return ORJSONResponse({
+            "success": True,
+            "count": len(df),
+            "columns": df.to_dict(orient='list')
+        })
+    
+    # Convert to dict (timestamps are pre-formatted ISO strings)
+    data = df.to_dict('records')
+    
+    return ORJSONResponse({
+        "success": True,
+        "count": len(data),
+        "data": data
+    })
+
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
@@ -306,61 +444,35 @@ async def websocket_endpoint(websocket: WebSocket, symbol: str):
 # MARKET DATA ENDPOINTS (for historical analysis pages)
 # ============================================================
 
-@app.get("/api/v1/market-data/")
+@app.get("/api/v1/market-data/", response_model=None)
 async def get_market_data(
     symbol: str = Query("BTCUSDT", description="Trading pair symbol"),
     start: Optional[str] = Query(None, description="Start date ISO format"),
     end: Optional[str] = Query(None, description="End date ISO format"),
     interval: str = Query("1h", description="Candle interval"),
-    limit: int = Query(1000, description="Max records")
+    limit: int = Query(1000, description="Max records"),
+    format: str = Query("json", pattern="^(json|columns|arrow)$", description="Response format: json, columns or arrow")
 ):
     """
     Get historical market data from Parquet files.
     Used by Market Overview, Technical Analysis, Risk Analysis pages.
     """
     try:
-        # Load from Parquet
-        data_path = DATA_DIR / f"{symbol}_{interval}.parquet"
+        loaded = load_market_frame(symbol, interval)
         
-        if not data_path.exists():
+        if loaded is None:
             return {
                 "success": False,
                 "message": f"No data file found for {symbol} {interval}",
                 "data": []
             }
         
-        # Read Parquet
-        df = pd.read_parquet(data_path)
-        
-        # Rename 'time' to 'timestamp' for page compatibility
-        if 'time' in df.columns:
-            df = df.rename(columns={'time': 'timestamp'})
-        
-        # Filter by date range if provided
-        if start:
-            start_dt = pd.to_datetime(start)
-            df = df[df['timestamp'] >= start_dt]
-        
-        if end:
-            end_dt = pd.to_datetime(end)
-            df = df[df['timestamp'] <= end_dt]
-        
-        # Limit
-        df = df.tail(limit)
-        
-        # Convert to dict
-        data = df.to_dict('records')
+        df, timestamp_ns = loaded
         
-        # Convert timestamps to ISO format
-        for record in data:
-            if isinstance(record['timestamp'], pd.Timestamp):
-                record['timestamp'] = record['timestamp'].isoformat()
+        # Filter by date range and limit (timestamps are already ISO strings)
+        df = slice_time_range(df, timestamp_ns, start, end).tail(limit)
         
-        return {
-            "success": True,
-            "count": len(data),
-            "data": data
-        }
+        return frame_response(df, format)
     
     except Exception as e:
         logger.error(f"Error loading market data: {e}")
@@ -370,12 +482,13 @@ async def get_market_data(
             "data": []
         }
 
-@app.get("/api/v1/analysis/indicators")
+@app.get("/api/v1/analysis/indicators", response_model=None)
 async def get_indicators(
     symbol: str = Query("BTCUSDT", description="Trading pair symbol"),
     start: Optional[str] = Query(None, description="Start date ISO format"),
     end: Optional[str] = Query(None, description="End date ISO format"),
-    interval: str = Query("1h", description="Candle interval")
+    interval: str = Query("1h", description="Candle interval"),
+    format: str = Query("json", pattern="^(json|columns|arrow)$", description="Response format: json, columns or arrow")
 ):
     """
     Calculate technical indicators (RSI, MACD, Bollinger Bands) from historical data.
@@ -383,30 +496,18 @@ async def get_indicators(
     """
     try:
         # Load market data
-        data_path = DATA_DIR / f"{symbol}_{interval}.parquet"
+        loaded = load_market_frame(symbol, interval)
         
-        if not data_path.exists():
+        if loaded is None:
             return {
                 "success": False,
                 "message": f"No data file found for {symbol} {interval}",
                 "data": []
             }
         
-        # Read Parquet
-        df = pd.read_parquet(data_path)
-        
-        # Rename 'time' to 'timestamp'
-        if 'time' in df.columns:
-            df = df.rename(columns={'time': 'timestamp'})
-        
-        # Filter by date range if provided
-        if start:
-            start_dt = pd.to_datetime(start)
-            df = df[df['timestamp'] >= start_dt]
-        
-        if end:
-            end_dt = pd.to_datetime(end)
-            df = df[df['timestamp'] <= end_dt]
+        # Filter by date range if provided (copy: the cached frame is shared)
+        df, timestamp_ns = loaded
+        df = slice_time_range(df, timestamp_ns, start, end).copy()
         
         # Calculate RSI
         delta = df['close'].diff()
@@ -429,22 +530,10 @@ async def get_indicators(
         df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
         df['bb_width'] = df['bb_upper'] - df['bb_lower']
         
-        # Drop NaN rows
-        df = df.dropna()
-        
-        # Convert to dict
-        data = df.to_dict('records')
+        # Skip the rolling-window warmup rows (the only NaN region)
+        df = df.iloc[INDICATOR_WARMUP:]
         
-        # Convert timestamps to ISO format
-        for record in data:
-            if isinstance(record['timestamp'], pd.Timestamp):
-                record['timestamp'] = record['timestamp'].isoformat()
-        
-        return {
-            "success": True,
-            "count": len(data),
-            "data": data
-        }
+        return frame_response(df, format)
     
     except Exception as e:
         logger.error(f"Error calculating indicators: {e}")
@@ -454,12 +543,13 @@ async def get_indicators(
             "data": []
         }
 
-@app.get("/api/v1/analysis/regimes")
+@app.get("/api/v1/analysis/regimes", response_model=None)
 async def get_regimes(
     symbol: str = Query("BTCUSDT", description="Trading pair symbol"),
     start: Optional[str] = Query(None, description="Start date ISO format"),
     end: Optional[str] = Query(None, description="End date ISO format"),
-    interval: str = Query("1h", description="Candle interval")
+    interval: str = Query("1h", description="Candle interval"),
+    format: str = Query("json", pattern="^(json|columns|arrow)$", description="Response format: json, columns or arrow")
 ):
     """
     Classify market regimes (Bullish, Bearish, Neutral) using simple logic.
@@ -467,30 +557,18 @@ async def get_regimes(
     """
     try:
         # Load market data
-        data_path = DATA_DIR / f"{symbol}_{interval}.parquet"
+        loaded = load_market_frame(symbol, interval)
         
-        if not data_path.exists():
+        if loaded is None:
             return {
                 "success": False,
                 "message": f"No data file found for {symbol} {interval}",
                 "data": []
             }
         
-        # Read Parquet
-        df = pd.read_parquet(data_path)
-        
-        # Rename 'time' to 'timestamp'
-        if 'time' in df.columns:
-            df = df.rename(columns={'time': 'timestamp'})
-        
-        # Filter by date range if provided
-        if start:
-            start_dt = pd.to_datetime(start)
-            df = df[df['timestamp'] >= start_dt]
-        
-        if end:
-            end_dt = pd.to_datetime(end)
-            df = df[df['timestamp'] <= end_dt]
+        # Filter by date range if provided (copy: the cached frame is shared)
+        df, timestamp_ns = loaded
+        df = slice_time_range(df, timestamp_ns, start, end).copy()
         
         # Calculate moving averages for regime detection
         df['ma_short'] = df['close'].rolling(window=20).mean()
@@ -507,54 +585,33 @@ async def get_regimes(
         df['returns'] = df['close'].pct_change()
         df['volatility'] = df['returns'].rolling(window=20).std()
         
-        # Classify regimes
-        def classify_regime(row):
-            if pd.isna(row['ma_short']) or pd.isna(row['ma_long']) or pd.isna(row['rsi']):
-                return 'neutral'
-            
-            # Bullish: MA short > MA long, RSI > 50
-            if row['ma_short'] > row['ma_long'] and row['rsi'] > 50:
-                return 'bullish'
-            # Bearish: MA short < MA long, RSI < 50
-            elif row['ma_short'] < row['ma_long'] and row['rsi'] < 50:
-                return 'bearish'
-            else:
-                return 'neutral'
+        # Classify regimes as int8 codes (warmup rows compare False -> neutral)
+        ma_short = df['ma_short'].to_numpy()
+        ma_long = df['ma_long'].to_numpy()
+        rsi = df['rsi'].to_numpy()
         
-        df['regime'] = df.apply(classify_regime, axis=1)
+        bullish = (ma_short > ma_long) & (rsi > 50)
+        bearish = (ma_short < ma_long) & (rsi < 50)
+        codes = np.select(
+            [bullish, bearish],
+            [REGIME_BULLISH, REGIME_BEARISH],
+            default=REGIME_NEUTRAL
+        ).astype(np.int8)
         
-        # Calculate regime probability (confidence score)
-        def calculate_probability(row):
-            if pd.isna(row['rsi']):
-                return 0.5
-            
-            if row['regime'] == 'bullish':
-                # Higher RSI = higher confidence
-                return min(0.5 + (row['rsi'] - 50) / 100, 0.95)
-            elif row['regime'] == 'bearish':
-                # Lower RSI = higher confidence
-                return min(0.5 + (50 - row['rsi']) / 100, 0.95)
-            else:
-                return 0.5
-        
-        df['regime_probability'] = df.apply(calculate_probability, axis=1)
-        
-        # Drop NaN rows
-        df = df.dropna()
+        df['regime'] = pd.Categorical.from_codes(codes, categories=REGIME_LABELS)
         
-        # Convert to dict
-        data = df.to_dict('records')
+        # Calculate regime probability (confidence score)
+        # Higher RSI = higher bullish confidence, lower RSI = higher bearish confidence
+        df['regime_probability'] = np.select(
+            [bullish, bearish],
+            [np.minimum(0.5 + (rsi - 50) / 100, 0.95), np.minimum(0.5 + (50 - rsi) / 100, 0.95)],
+            default=0.5
+        )
         
-        # Convert timestamps to ISO format
-        for record in data:
-            if isinstance(record['timestamp'], pd.Timestamp):
-                record['timestamp'] = record['timestamp'].isoformat()
+        # Skip the rolling-window warmup rows (the only NaN region)
+        df = df.iloc[REGIME_WARMUP:]
         
-        return {
-            "success": True,
-            "count": len(data),
-            "data": data
-        }
+        return frame_response(df, format)
     
     except Exception as e:
         logger.error(f"Error classifying regimes: {e}")
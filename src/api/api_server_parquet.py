@@ -4,19 +4,35 @@ Simple API Server using Parquet files (no database required)
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import bisect
+import functools
 import logging
+import os
 import sys
-import requests
+import threading
+import time
+import aiohttp
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.indicators.indicators_numba import IndicatorStream
+from src.api.scoring_numba import encode_signals, factors_for, score as composite_score
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,7 +41,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Bitcoin Market Intelligence API (Parquet)",
     description="API using Parquet files - No database required",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS
@@ -37,6 +54,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses (indicator/regime payloads shrink several-fold);
+# level 4 keeps CPU cost low for hot endpoints
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 
 # Startup event - Auto update data
 @app.on_event("startup")
@@ -48,37 +69,119 @@ async def startup_event():
         from services.auto_update_data import auto_update_all_intervals
         
         logger.info("🔄 Running auto-update on startup...")
-        updated_count = auto_update_all_intervals()
+        updated_count = await asyncio.to_thread(auto_update_all_intervals)
         
         if updated_count > 0:
             logger.info(f"✅ Auto-update complete: {updated_count} intervals updated")
             # Clear cache to reload updated data
-            global _data_cache
-            _data_cache.clear()
+            clear_data_cache()
         else:
             logger.info("ℹ️  Data is already up-to-date")
     
     except Exception as e:
         logger.warning(f"⚠️  Auto-update failed (will use existing data): {e}")
     
+    # Warm the frame cache so the first requests skip Parquet decoding
+    for symbol, interval in WARMUP_SERIES:
+        df = await asyncio.to_thread(load_parquet_data, symbol, interval)
+        if df is not None:
+            logger.info(f"🔥 Warmed {symbol} {interval}: {len(df)} rows")
+    
+    # Compile the Numba kernels (no-op without numba) before the first request
+    await asyncio.to_thread(compile_kernels)
+    
     logger.info("✅ Server ready!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP session"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
 # Data directory
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "hot"
 
-# Cache for loaded data
-_data_cache = {}
+# Bounded LRU caches for loaded frames and opened pyarrow datasets
+# (datasets serve filtered range reads). Guarded by _cache_lock since
+# endpoints run in the threadpool.
+DATA_CACHE_SIZE = 16
+_data_cache = OrderedDict()
+_dataset_cache = OrderedDict()
+_cache_lock = threading.RLock()
+
+# Pandas/numpy work for the heavy endpoints runs on a pool bounded to the
+# CPU count instead of Starlette's 40-thread default, so concurrent requests
+# queue rather than thrash. Threads (not processes) keep the frame and
+# indicator caches shared. Only part of the work runs in parallel: Arrow
+# reads, numpy array ops, pandas rolling/ewm loops and the Numba kernels
+# (when installed) release the GIL, while the Python glue around them and
+# the interpreted indicator loop (few appended rows) hold it.
+_compute_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="compute")
+
+# (symbol, interval) pairs loaded into the cache at startup
+WARMUP_SERIES = [('BTCUSDT', '1h'), ('BTCUSDT', '4h'), ('BTCUSDT', '1d')]
+
+
+def compile_kernels() -> None:
+    """Call each Numba kernel once on dummy input so it is compiled (or loaded from cache)"""
+    composite_score(0, 0, 0, 0, 0, 0)
+    IndicatorStream().update(np.ones(2))
+
+
+# Incremental indicator state: "{symbol}_{interval}" -> (last_timestamp, IndicatorStream)
+_indicator_cache = {}
+_indicator_lock = threading.Lock()
+
+# Shared HTTP session for Binance calls (created lazily on the event loop)
+_http_session: Optional[aiohttp.ClientSession] = None
+BINANCE_TIMEOUT = aiohttp.ClientTimeout(total=2)
+
+# Live price TTL cache: symbol -> (fetched_at monotonic seconds, price)
+PRICE_TTL_SECONDS = 2.0
+# Extra wait for the live price once other work is done, before using the
+# latest candle close instead
+LIVE_PRICE_WAIT_SECONDS = 0.5
+_price_cache: Dict[str, Tuple[float, float]] = {}
 
+# Parquet columns used by the API (symbol/interval are implied by the file name)
+PARQUET_COLUMNS = ['time', 'timestamp', 'open', 'high', 'low', 'close', 'volume', 'quote_volume', 'trades']
 
-def get_live_price(symbol: str = "BTCUSDT") -> float:
-    """Fetch live price from Binance API"""
+# Timestamp format used in JSON responses
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+async def run_compute(func, *args, **kwargs):
+    """Run a CPU-bound function on the shared compute pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_compute_pool, functools.partial(func, *args, **kwargs))
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(timeout=BINANCE_TIMEOUT)
+    return _http_session
+
+
+async def get_live_price(symbol: str = "BTCUSDT") -> float:
+    """Fetch live price from Binance API (cached for PRICE_TTL_SECONDS)"""
+    symbol = symbol.upper()
+    cached = _price_cache.get(symbol)
+    if cached is not None and time.monotonic() - cached[0] < PRICE_TTL_SECONDS:
+        return cached[1]
+    
     try:
-        url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol.upper()}"
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        data = response.json()
+        url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}"
+        async with _get_http_session().get(url) as response:
+            response.raise_for_status()
+            data = await response.json()
         price = float(data['price'])
+        _price_cache[symbol] = (time.monotonic(), price)
         logger.info(f"Fetched live {symbol} price: ${price:,.2f}")
         return price
     except Exception as e:
@@ -87,12 +190,170 @@ def get_live_price(symbol: str = "BTCUSDT") -> float:
         return None
 
 
+def frame_to_records(df: pd.DataFrame, columns: List[str]) -> List[dict]:
+    """
+    Convert numeric columns to JSON-ready records in one vectorized pass.
+
+    Prepends an ISO 'timestamp' field and maps NaN to None using one
+    precomputed mask per column.
+    """
+    return columns_to_records(frame_to_columns(df, columns))
+
+
+def columns_to_records(columns: dict) -> List[dict]:
+    """
+    Zip a dict of equal-length lists into row dicts.
+    
+    Lists from ndarray.tolist() hold plain Python scalars, so rows are built
+    without DataFrame.to_dict()'s per-cell boxing and dtype dispatch.
+    """
+    keys = tuple(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def frame_to_columns(df: pd.DataFrame, columns: List[str]) -> dict:
+    """
+    Convert numeric columns to a JSON-ready dict of lists (columnar layout).
+    
+    Same values as frame_to_records() without repeating keys per row.
+    """
+    result = {'timestamp': df['timestamp'].dt.strftime(ISO_FORMAT).tolist()}
+    for column in columns:
+        values = df[column].to_numpy(dtype=np.float64)
+        result[column] = np.where(np.isnan(values), None, values).tolist()
+    return result
+
+
+def _cache_get(cache: OrderedDict, key: str):
+    """LRU lookup: return the cached value (or None) and mark it recently used"""
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key: str, value) -> None:
+    """LRU insert, evicting the least recently used entries beyond DATA_CACHE_SIZE"""
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > DATA_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def clear_data_cache() -> None:
+    """
+    Drop all cached frames, datasets and indicator streams.
+    
+    The caches are swapped for new empty ones rather than cleared in place,
+    so requests already holding a frame keep a consistent object.
+    """
+    global _data_cache, _dataset_cache
+    with _cache_lock:
+        _data_cache = OrderedDict()
+        _dataset_cache = OrderedDict()
+    with _indicator_lock:
+        _indicator_cache.clear()
+
+
+def _table_to_frame(table) -> pd.DataFrame:
+    """Convert an Arrow table to pandas and add the 'timestamp' column"""
+    df = table.to_pandas(self_destruct=True, split_blocks=True)
+    del table
+    # Use 'time' column if exists, else 'timestamp'
+    time_col = 'time' if 'time' in df.columns else 'timestamp'
+    time_values = df[time_col]
+    if pd.api.types.is_datetime64_dtype(time_values):
+        # Parquet TIMESTAMP columns arrive as datetime64 already
+        df['timestamp'] = time_values
+    elif pd.api.types.is_integer_dtype(time_values):
+        # Binance-native epoch milliseconds
+        df['timestamp'] = pd.to_datetime(time_values, unit='ms')
+    else:
+        df['timestamp'] = pd.to_datetime(time_values, cache=True)
+    return df
+
+
+def time_range_mask(df: pd.DataFrame, start: datetime, end: datetime) -> np.ndarray:
+    """
+    Boolean mask of rows with start <= timestamp <= end.
+    
+    Bounds are converted to epoch nanoseconds once and compared against the
+    int64 view of the timestamp column. Timezone info is dropped since
+    stored timestamps are naive.
+    """
+    times = np.asarray(df['timestamp'], dtype='datetime64[ns]').view(np.int64)
+    lo = np.datetime64(start.replace(tzinfo=None), 'ns').astype(np.int64)
+    hi = np.datetime64(end.replace(tzinfo=None), 'ns').astype(np.int64)
+    return (times >= lo) & (times <= hi)
+
+
+def _open_dataset(symbol: str, interval: str):
+    """Open (and cache) a pyarrow dataset over the Parquet file"""
+    cache_key = f"{symbol}_{interval}"
+    
+    dataset = _cache_get(_dataset_cache, cache_key)
+    if dataset is not None:
+        return dataset
+    
+    file_path = DATA_DIR / f"{symbol}_{interval}.parquet"
+    
+    if not file_path.exists():
+        logger.warning(f"File not found: {file_path}")
+        return None
+    
+    dataset = ds.dataset(file_path, format="parquet")
+    _cache_put(_dataset_cache, cache_key, dataset)
+    return dataset
+
+
+def load_parquet_range(
+    symbol: str,
+    interval: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """
+    Load rows within [start, end] from Parquet.
+    
+    The time filter is pushed down to the Parquet reader so row groups
+    outside the range are skipped using footer statistics. Without a
+    range this is the cached full load.
+    """
+    if start is None and end is None:
+        return load_parquet_data(symbol, interval)
+    
+    dataset = _open_dataset(symbol, interval)
+    if dataset is None:
+        return None
+    
+    try:
+        names = dataset.schema.names
+        time_col = 'time' if 'time' in names else 'timestamp'
+        
+        # Stored timestamps are naive
+        time_filter = None
+        if start is not None:
+            time_filter = ds.field(time_col) >= start.replace(tzinfo=None)
+        if end is not None:
+            end_filter = ds.field(time_col) <= end.replace(tzinfo=None)
+            time_filter = end_filter if time_filter is None else time_filter & end_filter
+        
+        columns = [c for c in PARQUET_COLUMNS if c in names]
+        return _table_to_frame(dataset.to_table(filter=time_filter, columns=columns))
+    except Exception as e:
+        logger.error(f"Error loading {symbol} {interval} range: {e}")
+        return None
+
+
 def load_parquet_data(symbol: str = "BTCUSDT", interval: str = "1h"):
     """Load data from Parquet file"""
     cache_key = f"{symbol}_{interval}"
     
-    if cache_key in _data_cache:
-        return _data_cache[cache_key]
+    df = _cache_get(_data_cache, cache_key)
+    if df is not None:
+        return df
     
     file_path = DATA_DIR / f"{symbol}_{interval}.parquet"
     
@@ -101,11 +362,14 @@ def load_parquet_data(symbol: str = "BTCUSDT", interval: str = "1h"):
         return None
     
     try:
-        df = pd.read_parquet(file_path)
-        # Use 'time' column if exists, else 'timestamp'
-        time_col = 'time' if 'time' in df.columns else 'timestamp'
-        df['timestamp'] = pd.to_datetime(df[time_col])
-        _data_cache[cache_key] = df
+        # Memory-mapped read with column projection, converted straight to pandas.
+        # OHLCV stays float64: float32 keeps ~7 significant digits, which would
+        # leak into responses (89699.56 -> 89699.5625), and pandas rolling/ewm
+        # upcast to float64 internally so the math would not get cheaper.
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        columns = [c for c in PARQUET_COLUMNS if c in parquet_file.schema_arrow.names]
+        df = _table_to_frame(parquet_file.read(columns=columns))
+        _cache_put(_data_cache, cache_key, df)
         logger.info(f"Loaded {len(df)} rows from {file_path}")
         return df
     except Exception as e:
@@ -113,6 +377,120 @@ def load_parquet_data(symbol: str = "BTCUSDT", interval: str = "1h"):
         return None
 
 
+def load_parquet_tail(symbol: str, interval: str, limit: int):
+    """
+    Load the last `limit` rows from Parquet.
+    
+    Uses the cached full frame when present; otherwise decodes row groups
+    from the end of the file backwards until `limit` rows are covered, so
+    "latest N" requests on a cold cache skip the older row groups.
+    """
+    df = _cache_get(_data_cache, f"{symbol}_{interval}")
+    if df is not None:
+        return df.tail(limit)
+    
+    file_path = DATA_DIR / f"{symbol}_{interval}.parquet"
+    
+    if not file_path.exists():
+        logger.warning(f"File not found: {file_path}")
+        return None
+    
+    try:
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        columns = [c for c in PARQUET_COLUMNS if c in parquet_file.schema_arrow.names]
+        
+        tables = []
+        total = 0
+        for row_group in range(parquet_file.num_row_groups - 1, -1, -1):
+            table = parquet_file.read_row_group(row_group, columns=columns)
+            tables.append(table)
+            total += table.num_rows
+            if total >= limit:
+                break
+        
+        if not tables:
+            return _table_to_frame(parquet_file.schema_arrow.empty_table().select(columns))
+        
+        table = pa.concat_tables(reversed(tables))
+        return _table_to_frame(table.slice(max(total - limit, 0)))
+    except Exception as e:
+        logger.error(f"Error loading tail of {file_path}: {e}")
+        return None
+
+
+def get_cached_indicators(symbol: str, interval: str, df: pd.DataFrame) -> dict:
+    """
+    Indicator arrays aligned with the full loaded frame `df`.
+    
+    Only candles appended since the previous call (and a rewritten last
+    candle) are computed. The stream is rebuilt if the cached history no
+    longer lines up with `df`.
+    """
+    cache_key = f"{symbol}_{interval}"
+    
+    with _indicator_lock:
+        stream = None
+        cached = _indicator_cache.get(cache_key)
+        if cached is not None:
+            last_time, stream = cached
+            if stream.length > len(df) or df['timestamp'].iloc[stream.length - 1] != last_time:
+                stream = None
+        
+        if stream is None:
+            stream = IndicatorStream()
+        
+        stream.update(df['close'])
+        _indicator_cache[cache_key] = (df['timestamp'].iloc[-1], stream)
+        
+        return stream.arrays()
+
+
+def _partition_percentile(values: np.ndarray, q: float) -> float:
+    """np.percentile(values, q) (linear interpolation) via an O(n) partial sort"""
+    h = (len(values) - 1) * q / 100.0
+    lo = int(h)
+    hi = min(lo + 1, len(values) - 1)
+    part = np.partition(values, [lo, hi])
+    return part[lo] + (h - lo) * (part[hi] - part[lo])
+
+
+def risk_pass(close: np.ndarray) -> dict:
+    """
+    Compute return / drawdown series and return statistics in one pass.
+    
+    Row 0 has no previous close, so its series values are NaN, matching
+    pct_change(). Statistics are taken over the remaining returns.
+    
+    Returns:
+        Dict with 'returns', 'cumulative', 'drawdown' arrays and
+        'mean', 'std' (ddof=1), 'var_95', 'var_99' scalars
+    """
+    n = len(close)
+    returns = np.empty(n)
+    cumulative = np.empty(n)
+    drawdown = np.empty(n)
+    returns[0] = cumulative[0] = drawdown[0] = np.nan
+    
+    step = returns[1:]
+    np.divide(close[1:], close[:-1], out=step)
+    np.cumprod(step, out=cumulative[1:])
+    step -= 1.0
+    
+    running_max = np.maximum.accumulate(cumulative[1:])
+    np.divide(cumulative[1:], running_max, out=drawdown[1:])
+    drawdown[1:] -= 1.0
+    
+    return {
+        'returns': returns,
+        'cumulative': cumulative,
+        'drawdown': drawdown,
+        'mean': step.mean(),
+        'std': step.std(ddof=1),
+        'var_95': _partition_percentile(step, 5),
+        'var_99': _partition_percentile(step, 1),
+    }
+
+
 @app.get("/")
 async def root():
     return {
@@ -124,7 +502,7 @@ async def root():
 
 @app.get("/health")
 @app.get("/api/v1/health")
-async def health():
+def health():
     """Health check endpoint for Docker and monitoring"""
     try:
         # Check if data files exist
@@ -158,7 +536,7 @@ async def health():
 
 
 @app.post("/api/v1/refresh-data")
-async def refresh_data():
+def refresh_data():
     """
     Manually trigger data refresh.
     Fetches new candles from Binance and updates parquet files.
@@ -170,8 +548,7 @@ async def refresh_data():
         updated_count = auto_update_all_intervals()
         
         # Clear cache to reload updated data
-        global _data_cache
-        _data_cache.clear()
+        clear_data_cache()
         
         return {
             "success": True,
@@ -185,7 +562,7 @@ async def refresh_data():
 
 
 @app.get("/api/v1/candles/{symbol}")
-async def get_candles(
+def get_candles(
     symbol: str,
     interval: str = Query("1h"),
     limit: int = Query(100, ge=1, le=1000),
@@ -193,41 +570,40 @@ async def get_candles(
     end_time: Optional[datetime] = None
 ):
     """Get candlestick data from Parquet"""
-    df = load_parquet_data(symbol.upper(), interval)
+    # Time range is filtered inside the Parquet scan; without one only the
+    # trailing row groups are read
+    if start_time is None and end_time is None:
+        df = load_parquet_tail(symbol.upper(), interval, limit)
+    else:
+        df = load_parquet_range(symbol.upper(), interval, start_time, end_time)
     
-    if df is None or df.empty:
+    if df is None:
         raise HTTPException(status_code=404, detail=f"No data found for {symbol} {interval}")
     
-    # Filter by time range
-    if start_time:
-        df = df[df['timestamp'] >= start_time]
-    if end_time:
-        df = df[df['timestamp'] <= end_time]
-    
     # Limit results
     df = df.tail(limit)
     
     # Convert to JSON
-    result = []
-    for _, row in df.iterrows():
-        result.append({
-            "time": row['timestamp'].isoformat(),
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "open": float(row['open']),
-            "high": float(row['high']),
-            "low": float(row['low']),
-            "close": float(row['close']),
-            "volume": float(row['volume']),
-            "quote_volume": float(row.get('quote_volume', row['volume'] * row['close'])),
-            "trades": int(row.get('trades', 0))
-        })
-    
-    return result
+    n = len(df)
+    quote_volume = df['quote_volume'] if 'quote_volume' in df.columns else df['volume'] * df['close']
+    candles = columns_to_records({
+        "time": df['timestamp'].dt.strftime(ISO_FORMAT).tolist(),
+        "symbol": [symbol.upper()] * n,
+        "interval": [interval] * n,
+        "open": df['open'].to_numpy(dtype=float).tolist(),
+        "high": df['high'].to_numpy(dtype=float).tolist(),
+        "low": df['low'].to_numpy(dtype=float).tolist(),
+        "close": df['close'].to_numpy(dtype=float).tolist(),
+        "volume": df['volume'].to_numpy(dtype=float).tolist(),
+        "quote_volume": quote_volume.to_numpy(dtype=float).tolist(),
+        "trades": df['trades'].to_numpy(dtype=int).tolist() if 'trades' in df.columns else [0] * n
+    })
+    
+    return ORJSONResponse(candles)
 
 
 @app.get("/api/v1/market-data/")
-async def get_market_data(
+def get_market_data(
     symbol: str = Query("BTCUSDT"),
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
@@ -235,39 +611,25 @@ async def get_market_data(
     limit: int = Query(500)
 ):
     """Get market data for calculations"""
-    df = load_parquet_data(symbol.upper(), interval)
+    # Time range is filtered inside the Parquet scan
+    df = load_parquet_range(symbol.upper(), interval, start, end)
     
-    if df is None or df.empty:
+    if df is None:
         # Try other intervals
         for alt_interval in ["1h", "4h", "1d"]:
-            df = load_parquet_data(symbol.upper(), alt_interval)
-            if df is not None and not df.empty:
+            df = load_parquet_range(symbol.upper(), alt_interval, start, end)
+            if df is not None:
                 interval = alt_interval
                 break
     
-    if df is None or df.empty:
+    if df is None:
         raise HTTPException(status_code=404, detail="No data available")
     
-    # Filter by time
-    if start:
-        df = df[df['timestamp'] >= start]
-    if end:
-        df = df[df['timestamp'] <= end]
-    
     df = df.tail(limit)
     
-    result = []
-    for _, row in df.iterrows():
-        result.append({
-            "timestamp": row['timestamp'].isoformat(),
-            "open": float(row['open']),
-            "high": float(row['high']),
-            "low": float(row['low']),
-            "close": float(row['close']),
-            "volume": float(row['volume'])
-        })
+    result = frame_to_records(df, ['open', 'high', 'low', 'close', 'volume'])
     
-    return {"data": result, "count": len(result)}
+    return ORJSONResponse({"data": result, "count": len(result)})
 
 
 @app.get("/api/v1/analysis/regimes")
@@ -278,6 +640,11 @@ async def get_regimes(
     interval: str = Query("1h")
 ):
     """Calculate regime classification"""
+    return await run_compute(build_regimes, symbol, start, end, interval)
+
+
+def build_regimes(symbol: str, start: datetime, end: datetime, interval: str):
+    """Regime classification response (runs on the compute pool)"""
     df = load_parquet_data(symbol.upper(), interval)
     
     if df is None or df.empty:
@@ -293,12 +660,8 @@ async def get_regimes(
             detail=f"Insufficient data. Need 30+ points, found {len(df) if df is not None else 0}"
         )
     
-    # Convert timezone-aware datetimes to naive
-    start_naive = start.replace(tzinfo=None) if start.tzinfo else start
-    end_naive = end.replace(tzinfo=None) if end.tzinfo else end
-    
     # Filter by date range
-    df = df[(df['timestamp'] >= start_naive) & (df['timestamp'] <= end_naive)]
+    df = df[time_range_mask(df, start, end)]
     
     if len(df) < 30:
         raise HTTPException(status_code=400, detail=f"Need at least 30 candles in range, found {len(df)}")
@@ -307,56 +670,54 @@ async def get_regimes(
     df['returns'] = df['close'].pct_change()
     df['volatility'] = df['returns'].rolling(20).std()
     df['sma_20'] = df['close'].rolling(20).mean()
-    df['sma_50'] = df['close'].rolling(50).mean()
     
     # Classify regimes using trend + volatility
-    regimes = []
     regime_names = {0: "High Volatility", 1: "Bearish", 2: "Sideways", 3: "Bullish"}
     regime_colors = {0: "#f59e0b", 1: "#ef4444", 2: "#6b7280", 3: "#22c55e"}
     
-    for idx, row in df.iterrows():
-        if pd.isna(row['volatility']) or pd.isna(row['sma_20']):
-            regime = 2
-        else:
-            vol_threshold = df['volatility'].quantile(0.75)
-            
-            # High volatility regime
-            if row['volatility'] > vol_threshold:
-                regime = 0
-            # Bullish: price above SMA20 and positive returns
-            elif row['close'] > row['sma_20'] and row['returns'] > 0:
-                regime = 3
-            # Bearish: price below SMA20 and negative returns
-            elif row['close'] < row['sma_20'] and row['returns'] < 0:
-                regime = 1
-            # Sideways: everything else
-            else:
-                regime = 2
-        
-        regimes.append({
-            'timestamp': row['timestamp'].isoformat(),
-            'regime': regime,
-            'regime_name': regime_names[regime],
-            'regime_color': regime_colors[regime],
-            'close': float(row['close']),
-            'volatility': float(row['volatility']) if not pd.isna(row['volatility']) else None
-        })
-    
-    # Calculate distribution
-    regime_counts = pd.Series([r['regime'] for r in regimes]).value_counts()
+    close = df['close'].to_numpy(dtype=float)
+    returns = df['returns'].to_numpy(dtype=float)
+    volatility = df['volatility'].to_numpy(dtype=float)
+    sma_20 = df['sma_20'].to_numpy(dtype=float)
+    vol_threshold = np.nanquantile(volatility, 0.75)
+    
+    regime_codes = np.select(
+        [
+            np.isnan(volatility) | np.isnan(sma_20),    # Warmup: sideways
+            volatility > vol_threshold,                 # High volatility regime
+            (close > sma_20) & (returns > 0),           # Bullish: above SMA20, positive returns
+            (close < sma_20) & (returns < 0),           # Bearish: below SMA20, negative returns
+        ],
+        [2, 0, 3, 1],
+        default=2                                       # Sideways: everything else
+    )
+    
+    regime_labels = pd.Categorical.from_codes(regime_codes, categories=list(regime_names.values()))
+    regime_swatches = pd.Categorical.from_codes(regime_codes, categories=list(regime_colors.values()))
+    regimes = pd.DataFrame({
+        'timestamp': df['timestamp'].dt.strftime(ISO_FORMAT),
+        'regime': regime_codes,
+        'regime_name': regime_labels,
+        'regime_color': regime_swatches,
+        'close': close,
+        'volatility': df['volatility'].astype(object).where(df['volatility'].notna(), None)
+    }).to_dict('records')
+    
+    # Calculate distribution (most frequent regime first)
+    regime_counts = np.bincount(regime_codes, minlength=len(regime_names))
     total = len(regimes)
     distribution = {
         regime_names[k]: {
-            'count': int(v),
-            'percentage': float(v / total * 100),
+            'count': int(regime_counts[k]),
+            'percentage': float(regime_counts[k] / total * 100),
             'color': regime_colors[k]
-        } for k, v in regime_counts.items()
+        } for k in np.argsort(-regime_counts, kind='stable').tolist() if regime_counts[k]
     }
     
     # Current regime
     current = regimes[-1] if regimes else None
     
-    return {
+    return ORJSONResponse({
         'regimes': regimes,
         'stats': {
             'total_periods': len(regimes),
@@ -364,11 +725,11 @@ async def get_regimes(
             'current_regime': current['regime_name'] if current else 'Unknown',
             'current_regime_color': current['regime_color'] if current else '#6b7280'
         }
-    }
+    })
 
 
 @app.get("/api/v1/summary/{symbol}")
-async def get_summary(symbol: str, interval: str = Query("1h")):
+def get_summary(symbol: str, interval: str = Query("1h")):
     """Get market summary with latest metrics"""
     df = load_parquet_data(symbol.upper(), interval)
     
@@ -414,15 +775,34 @@ async def get_indicators(
     start: datetime = Query(...),
     end: datetime = Query(...),
     interval: str = Query("1h"),
-    limit: int = Query(1000, le=2000)  # Max 2000 points
+    limit: int = Query(1000, le=2000),  # Max 2000 points
+    format: str = Query("records", pattern="^(records|columnar)$")
 ):
-    """Calculate technical indicators"""
+    """
+    Calculate technical indicators
+    
+    format=records returns a list of per-candle objects; format=columnar
+    returns one array per field (smaller payload, preferred by chart clients).
+    """
+    return await run_compute(build_indicators, symbol, start, end, interval, limit, format)
+
+
+def build_indicators(
+    symbol: str,
+    start: datetime,
+    end: datetime,
+    interval: str,
+    limit: int,
+    format: str
+):
+    """Technical indicators response (runs on the compute pool)"""
     df = load_parquet_data(symbol.upper(), interval)
     
     if df is None or df.empty:
         for alt_interval in ["1h", "4h", "1d"]:
             df = load_parquet_data(symbol.upper(), alt_interval)
             if df is not None and not df.empty:
+                interval = alt_interval
                 break
     
     if df is None or df.empty or len(df) < 50:
@@ -431,73 +811,38 @@ async def get_indicators(
             detail=f"Insufficient data. Need 50+ points, found {len(df) if df is not None else 0}"
         )
     
-    # Convert timezone-aware datetimes to naive (remove timezone info)
-    start_naive = start.replace(tzinfo=None) if start.tzinfo else start
-    end_naive = end.replace(tzinfo=None) if end.tzinfo else end
-    
-    # Filter by date range FIRST to reduce data
-    df = df[(df['timestamp'] >= start_naive) & (df['timestamp'] <= end_naive)]
-    
-    # Take latest N points if still too many
-    if len(df) > limit:
-        df = df.tail(limit)
+    # Row positions in the date range, latest N points if still too many
+    positions = np.flatnonzero(time_range_mask(df, start, end))
+    positions = positions[-limit:]
     
-    if len(df) < 50:
+    if len(positions) < 50:
         raise HTTPException(
             status_code=400,
-            detail=f"Not enough data in date range. Found {len(df)}, need 50+"
+            detail=f"Not enough data in date range. Found {len(positions)}, need 50+"
         )
     
-    logger.info(f"Processing {len(df)} candles for indicators")
+    logger.info(f"Processing {len(positions)} candles for indicators")
     
-    # Calculate indicators
-    df['sma_20'] = df['close'].rolling(20).mean()
-    df['sma_50'] = df['close'].rolling(50).mean()
-    df['ema_12'] = df['close'].ewm(span=12).mean()
-    df['ema_26'] = df['close'].ewm(span=26).mean()
-    
-    # RSI
-    delta = df['close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-    rs = gain / loss
-    df['rsi'] = 100 - (100 / (1 + rs))
-    
-    # MACD
-    df['macd'] = df['ema_12'] - df['ema_26']
-    df['macd_signal'] = df['macd'].ewm(span=9).mean()
-    df['macd_histogram'] = df['macd'] - df['macd_signal']
-    
-    # Bollinger Bands
-    df['bb_middle'] = df['close'].rolling(20).mean()
-    bb_std = df['close'].rolling(20).std()
-    df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
-    df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
+    # Indicators (SMA, EMA, RSI, MACD, Bollinger Bands) over the full history,
+    # cached and extended incrementally as new candles arrive
+    indicators = get_cached_indicators(symbol.upper(), interval, df)
+    df = df.iloc[positions].assign(**{
+        name: values[positions] for name, values in indicators.items()
+    })
     
     # Convert to response
-    indicators = []
-    for idx, row in df.iterrows():
-        indicators.append({
-            'timestamp': row['timestamp'].isoformat(),
-            'close': float(row['close']),
-            'high': float(row['high']),
-            'low': float(row['low']),
-            'open': float(row['open']),
-            'volume': float(row['volume']),
-            'sma_20': float(row['sma_20']) if not pd.isna(row['sma_20']) else None,
-            'sma_50': float(row['sma_50']) if not pd.isna(row['sma_50']) else None,
-            'ema_12': float(row['ema_12']) if not pd.isna(row['ema_12']) else None,
-            'ema_26': float(row['ema_26']) if not pd.isna(row['ema_26']) else None,
-            'rsi': float(row['rsi']) if not pd.isna(row['rsi']) else None,
-            'macd': float(row['macd']) if not pd.isna(row['macd']) else None,
-            'macd_signal': float(row['macd_signal']) if not pd.isna(row['macd_signal']) else None,
-            'macd_histogram': float(row['macd_histogram']) if not pd.isna(row['macd_histogram']) else None,
-            'bb_upper': float(row['bb_upper']) if not pd.isna(row['bb_upper']) else None,
-            'bb_middle': float(row['bb_middle']) if not pd.isna(row['bb_middle']) else None,
-            'bb_lower': float(row['bb_lower']) if not pd.isna(row['bb_lower']) else None
-        })
-    
-    return {'indicators': indicators}
+    columns = [
+        'close', 'high', 'low', 'open', 'volume',
+        'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi',
+        'macd', 'macd_signal', 'macd_histogram',
+        'bb_upper', 'bb_middle', 'bb_lower'
+    ]
+    if format == "columnar":
+        indicators = frame_to_columns(df, columns)
+    else:
+        indicators = frame_to_records(df, columns)
+    
+    return ORJSONResponse({'indicators': indicators})
 
 
 @app.get("/api/v1/analysis/risk")
@@ -508,65 +853,51 @@ async def get_risk_metrics(
     interval: str = Query("1h")
 ):
     """Calculate risk metrics: VaR, Sharpe, Drawdown"""
+    return await run_compute(build_risk_metrics, symbol, start, end, interval)
+
+
+def build_risk_metrics(symbol: str, start: datetime, end: datetime, interval: str):
+    """Risk metrics response (runs on the compute pool)"""
     df = load_parquet_data(symbol.upper(), interval)
     
     if df is None or df.empty:
         raise HTTPException(status_code=404, detail="No data found")
     
-    # Convert timezone-aware datetimes to naive
-    start_naive = start.replace(tzinfo=None) if start.tzinfo else start
-    end_naive = end.replace(tzinfo=None) if end.tzinfo else end
-    
     # Filter by date range
-    df = df[(df['timestamp'] >= start_naive) & (df['timestamp'] <= end_naive)]
+    df = df[time_range_mask(df, start, end)]
     
     if len(df) < 30:
         raise HTTPException(status_code=400, detail=f"Need at least 30 candles, found {len(df)}")
     
-    # Calculate returns
-    df['returns'] = df['close'].pct_change()
-    df['log_returns'] = np.log(df['close'] / df['close'].shift(1))
-    
-    # Calculate cumulative returns for drawdown
-    df['cumulative'] = (1 + df['returns']).cumprod()
-    df['running_max'] = df['cumulative'].expanding().max()
-    df['drawdown'] = (df['cumulative'] - df['running_max']) / df['running_max']
-    
-    # VaR calculations (95% and 99% confidence)
-    returns_clean = df['returns'].dropna()
-    var_95 = np.percentile(returns_clean, 5)
-    var_99 = np.percentile(returns_clean, 1)
+    # Returns, drawdown and VaR (95% / 99% confidence) in one pass
+    close = df['close'].to_numpy(dtype=np.float64)
+    risk = risk_pass(close)
+    var_95 = risk['var_95']
+    var_99 = risk['var_99']
     
     # Sharpe Ratio (annualized, assuming 365*24 hourly periods per year)
     periods_per_year = 365 * 24 if interval == "1h" else 365
-    mean_return = returns_clean.mean()
-    std_return = returns_clean.std()
+    mean_return = risk['mean']
+    std_return = risk['std']
     sharpe_ratio = (mean_return / std_return) * np.sqrt(periods_per_year) if std_return > 0 else 0
     
-    # Max Drawdown
-    max_drawdown = df['drawdown'].min()
-    max_drawdown_idx = df['drawdown'].idxmin()
-    max_drawdown_date = df.loc[max_drawdown_idx, 'timestamp'].isoformat() if pd.notna(max_drawdown_idx) else None
+    # Max Drawdown (row 0 is NaN)
+    max_drawdown_pos = int(np.argmin(risk['drawdown'][1:])) + 1
+    max_drawdown = risk['drawdown'][max_drawdown_pos]
+    max_drawdown_date = df['timestamp'].iloc[max_drawdown_pos].isoformat()
     
     # Volatility (annualized)
     volatility = std_return * np.sqrt(periods_per_year)
     
     # Current metrics
-    current_price = float(df['close'].iloc[-1])
-    price_change_pct = float(((df['close'].iloc[-1] - df['close'].iloc[0]) / df['close'].iloc[0]) * 100)
+    current_price = float(close[-1])
+    price_change_pct = float(((close[-1] - close[0]) / close[0]) * 100)
     
     # Historical data for charts
-    risk_data = []
-    for idx, row in df.iterrows():
-        risk_data.append({
-            'timestamp': row['timestamp'].isoformat(),
-            'close': float(row['close']),
-            'returns': float(row['returns']) if not pd.isna(row['returns']) else None,
-            'drawdown': float(row['drawdown']) if not pd.isna(row['drawdown']) else None,
-            'cumulative': float(row['cumulative']) if not pd.isna(row['cumulative']) else None
-        })
+    df = df.assign(returns=risk['returns'], drawdown=risk['drawdown'], cumulative=risk['cumulative'])
+    risk_data = frame_to_records(df, ['close', 'returns', 'drawdown', 'cumulative'])
     
-    return {
+    return ORJSONResponse({
         'metrics': {
             'var_95': float(var_95) * 100,  # Convert to percentage
             'var_99': float(var_99) * 100,
@@ -579,11 +910,11 @@ async def get_risk_metrics(
             'total_periods': len(df),
         },
         'data': risk_data
-    }
+    })
 
 
 @app.get("/api/v1/decisions/{symbol}")
-async def get_investment_decision(symbol: str, interval: str = Query("1h")):
+def get_investment_decision(symbol: str, interval: str = Query("1h")):
     """Get investment decision based on multiple factors"""
     df = load_parquet_data(symbol.upper(), interval)
     
@@ -591,22 +922,20 @@ async def get_investment_decision(symbol: str, interval: str = Query("1h")):
         for alt_interval in ["1h", "4h", "1d"]:
             df = load_parquet_data(symbol.upper(), alt_interval)
             if df is not None and not df.empty:
+                interval = alt_interval
                 break
     
     if df is None or df.empty or len(df) < 30:
         raise HTTPException(status_code=404, detail="Insufficient data for decision")
     
     # Calculate indicators
-    df['returns'] = df['close'].pct_change()
-    df['sma_20'] = df['close'].rolling(20).mean()
-    df['sma_50'] = df['close'].rolling(50).mean()
-    
-    # RSI
-    delta = df['close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-    rs = gain / loss
-    df['rsi'] = 100 - (100 / (1 + rs))
+    indicators = get_cached_indicators(symbol.upper(), interval, df)
+    df = df.assign(
+        returns=df['close'].pct_change(),
+        sma_20=indicators['sma_20'],
+        sma_50=indicators['sma_50'],
+        rsi=indicators['rsi']
+    )
     
     # Get latest values
     latest = df.iloc[-1]
@@ -676,7 +1005,7 @@ async def get_investment_decision(symbol: str, interval: str = Query("1h")):
 
 
 @app.get("/api/v1/signals/regime")
-async def get_regime_signal(
+def get_regime_signal(
     symbol: str = Query(default="BTCUSDT", description="Trading pair symbol"),
     interval: str = Query(default="1h", description="Timeframe (1h/4h/1d)")
 ):
@@ -727,7 +1056,7 @@ async def get_regime_signal(
 
 
 @app.get("/api/v1/signals/kama")
-async def get_kama_signals(
+def get_kama_signals(
     symbol: str = Query(default="BTCUSDT", description="Trading pair symbol"),
     interval: str = Query(default="1h", description="Timeframe (1h/4h/1d)"),
     period: int = Query(default=10, description="KAMA period")
@@ -746,7 +1075,8 @@ async def get_kama_signals(
             raise HTTPException(status_code=404, detail="No data available")
         
         # Calculate KAMA
-        df['kama'] = calculate_kama(df['close'], n=period)
+        # Work on a copy - the cached frame is shared across requests
+        df = df.assign(kama=calculate_kama(df['close'], n=period))
         df['atr'] = calculate_atr(df, period=14)
         
         # Generate signals
@@ -790,7 +1120,7 @@ async def get_kama_signals(
 
 
 @app.get("/api/v1/signals/onchain")
-async def get_onchain_data():
+def get_onchain_data():
     """
     Get on-chain metrics from free sources.
     
@@ -828,6 +1158,89 @@ async def get_onchain_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Composite score buckets: bisect_right(SCORE_BUCKETS, score) indexes
+# SCORE_LABELS, so each bound belongs to the bucket above it (score >= bound)
+SCORE_BUCKETS = (-60, -30, 30, 60)
+SCORE_LABELS = (
+    ("STRONG SELL", "High"),
+    ("SELL", "Medium"),
+    ("HOLD", "Low"),
+    ("BUY", "Medium"),
+    ("STRONG BUY", "High"),
+)
+
+
+def build_comprehensive_signals(symbol: str, interval: str) -> dict:
+    """
+    Compute regime, KAMA and on-chain signals with the composite score.
+    
+    Blocking (model training, pandas, on-chain HTTP) - run via asyncio.to_thread.
+    'current_price' is the latest candle close.
+    """
+    # Get signals directly (don't call other endpoints to avoid Query issues)
+    from src.models.regime_detector import RegimeDetector
+    from src.indicators.adaptive import calculate_kama, generate_kama_signals, calculate_atr
+    from src.data.free_onchain import get_comprehensive_onchain_data
+    
+    # Load data
+    df = load_parquet_data(symbol.upper(), interval)
+    if df is None or df.empty:
+        raise HTTPException(status_code=404, detail="No data available")
+    
+    # Get regime
+    detector = RegimeDetector(n_states=3, lookback_days=90)
+    train_size = min(360, int(len(df) * 0.7))
+    detector.train(df.iloc[-train_size:])
+    regime = detector.predict_current_regime(df.iloc[-30:])
+    
+    # Get KAMA
+    # Work on a copy - the cached frame is shared across requests
+    df = df.assign(kama=calculate_kama(df['close'], n=10))
+    df['atr'] = calculate_atr(df, period=14)
+    df_signals = generate_kama_signals(df, kama_period=10)
+    latest = df_signals.iloc[-1]
+    
+    # Get on-chain data
+    onchain_data = get_comprehensive_onchain_data()
+    
+    # Calculate composite score from integer signal codes
+    codes = encode_signals(
+        regime['regime'], regime['probability'],
+        latest['kama_cross'], latest['signal'],
+        onchain_data['funding_rate']['signal'], onchain_data['mvrv']['signal']
+    )
+    score = int(composite_score(*codes))
+    factors, kama_signal = factors_for(codes)
+    
+    # Generate recommendation
+    recommendation, confidence = SCORE_LABELS[bisect.bisect_right(SCORE_BUCKETS, score)]
+    
+    return {
+        "symbol": symbol.upper(),
+        "interval": interval,
+        "timestamp": datetime.now().isoformat(),
+        "current_price": float(latest['close']),
+        "recommendation": recommendation,
+        "confidence": confidence,
+        "composite_score": score,
+        "regime": {
+            "regime": regime['regime'],
+            "probability": regime['probability'],
+            "confidence": regime['confidence']
+        },
+        "kama": {
+            "value": float(latest['kama']),
+            "signal": kama_signal,
+            "distance_pct": float(((latest['close'] - latest['kama']) / latest['kama']) * 100)
+        },
+        "onchain": {
+            "funding_rate": onchain_data['funding_rate']['signal'],
+            "market_cap_signal": onchain_data['mvrv']['signal']
+        },
+        "factors": factors
+    }
+
+
 @app.get("/api/v1/signals/comprehensive")
 async def get_comprehensive_signals(
     symbol: str = Query(default="BTCUSDT", description="Trading pair symbol"),
@@ -838,141 +1251,26 @@ async def get_comprehensive_signals(
     
     Returns complete market analysis with trading recommendation.
     """
+    # Live price is fetched concurrently with the signal computation
+    price_task = asyncio.create_task(get_live_price(symbol.upper()))
     try:
-        # Get signals directly (don't call other endpoints to avoid Query issues)
-        from src.models.regime_detector import RegimeDetector
-        from src.indicators.adaptive import calculate_kama, generate_kama_signals, calculate_atr
-        from src.data.free_onchain import get_comprehensive_onchain_data
+        # Heavy work runs on the compute pool so the event loop stays free
+        signals = await run_compute(build_comprehensive_signals, symbol, interval)
         
-        # Load data
-        df = load_parquet_data(symbol.upper(), interval)
-        if df is None or df.empty:
-            raise HTTPException(status_code=404, detail="No data available")
-        
-        # Get regime
-        detector = RegimeDetector(n_states=3, lookback_days=90)
-        train_size = min(360, int(len(df) * 0.7))
-        detector.train(df.iloc[-train_size:])
-        regime = detector.predict_current_regime(df.iloc[-30:])
-        
-        # Get KAMA
-        df['kama'] = calculate_kama(df['close'], n=10)
-        df['atr'] = calculate_atr(df, period=14)
-        df_signals = generate_kama_signals(df, kama_period=10)
-        latest = df_signals.iloc[-1]
-        
-        # Get on-chain data
-        onchain_data = get_comprehensive_onchain_data()
-        
-        # Calculate composite score
-        score = 0
-        factors = []
-        
-        # Regime factor (30% weight)
-        if regime['regime'] == 'Bull' and regime['probability'] > 0.7:
-            score += 30
-            factors.append({"name": "Regime", "signal": "Bull (High Confidence)", "weight": 30})
-        elif regime['regime'] == 'Bull':
-            score += 15
-            factors.append({"name": "Regime", "signal": "Bull (Medium Confidence)", "weight": 15})
-        elif regime['regime'] == 'Bear' and regime['probability'] > 0.7:
-            score -= 30
-            factors.append({"name": "Regime", "signal": "Bear (High Confidence)", "weight": -30})
-        elif regime['regime'] == 'Bear':
-            score -= 15
-            factors.append({"name": "Regime", "signal": "Bear (Medium Confidence)", "weight": -15})
-        else:
-            factors.append({"name": "Regime", "signal": "Sideways", "weight": 0})
-        
-        # KAMA factor (30% weight)
-        kama_signal = "NEUTRAL"
-        if latest['kama_cross'] == 1:
-            score += 30
-            factors.append({"name": "KAMA", "signal": "Golden Cross", "weight": 30})
-            kama_signal = "BUY"
-        elif latest['kama_cross'] == -1:
-            score -= 30
-            factors.append({"name": "KAMA", "signal": "Death Cross", "weight": -30})
-            kama_signal = "SELL"
-        elif latest['signal'] == 1:
-            score += 15
-            factors.append({"name": "KAMA", "signal": "Bullish Trend", "weight": 15})
-            kama_signal = "BULLISH"
-        elif latest['signal'] == -1:
-            score -= 15
-            factors.append({"name": "KAMA", "signal": "Bearish Trend", "weight": -15})
-            kama_signal = "BEARISH"
-        else:
-            factors.append({"name": "KAMA", "signal": "Neutral", "weight": 0})
-        
-        # Funding rate factor (20% weight)
-        if onchain_data['funding_rate']['signal'] == 'EXTREME_SHORT':
-            score += 20
-            factors.append({"name": "Funding", "signal": "Extreme Short (Squeeze Risk)", "weight": 20})
-        elif onchain_data['funding_rate']['signal'] == 'EXTREME_LONG':
-            score -= 20
-            factors.append({"name": "Funding", "signal": "Extreme Long (Squeeze Risk)", "weight": -20})
-        elif onchain_data['funding_rate']['signal'] == 'NEUTRAL':
-            score += 5
-            factors.append({"name": "Funding", "signal": "Neutral (Healthy)", "weight": 5})
-        
-        # Market cap factor (20% weight)
-        if onchain_data['mvrv']['signal'] == 'ACCUMULATION':
-            score += 20
-            factors.append({"name": "Market Cap", "signal": "Accumulation Zone", "weight": 20})
-        elif onchain_data['mvrv']['signal'] == 'OVERVALUED':
-            score -= 10
-            factors.append({"name": "Market Cap", "signal": "Overvalued", "weight": -10})
-        else:
-            factors.append({"name": "Market Cap", "signal": "Fair Value", "weight": 0})
-        
-        # Generate recommendation
-        if score >= 60:
-            recommendation = "STRONG BUY"
-            confidence = "High"
-        elif score >= 30:
-            recommendation = "BUY"
-            confidence = "Medium"
-        elif score >= -30:
-            recommendation = "HOLD"
-            confidence = "Low"
-        elif score >= -60:
-            recommendation = "SELL"
-            confidence = "Medium"
-        else:
-            recommendation = "STRONG SELL"
-            confidence = "High"
-        
-        # Get live price (fallback to parquet if API fails)
-        live_price = get_live_price(symbol.upper())
-        current_price = live_price if live_price is not None else float(latest['close'])
+        # Get live price (fallback to parquet if API fails or is slow)
+        try:
+            live_price = await asyncio.wait_for(price_task, timeout=LIVE_PRICE_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            live_price = None
+        if live_price is not None:
+            signals['current_price'] = live_price
         
-        return {
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "timestamp": datetime.now().isoformat(),
-            "current_price": current_price,
-            "recommendation": recommendation,
-            "confidence": confidence,
-            "composite_score": score,
-            "regime": {
-                "regime": regime['regime'],
-                "probability": regime['probability'],
-                "confidence": regime['confidence']
-            },
-            "kama": {
-                "value": float(latest['kama']),
-                "signal": kama_signal,
-                "distance_pct": float(((latest['close'] - latest['kama']) / latest['kama']) * 100)
-            },
-            "onchain": {
-                "funding_rate": onchain_data['funding_rate']['signal'],
-                "market_cap_signal": onchain_data['mvrv']['signal']
-            },
-            "factors": factors
-        }
+        # Plain floats/strings only - serialized by orjson directly,
+        # skipping FastAPI's jsonable_encoder walk over the nested dict
+        return ORJSONResponse(signals)
         
     except Exception as e:
+        price_task.cancel()
         logger.error(f"Error getting comprehensive signals: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
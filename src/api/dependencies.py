@@ -5,8 +5,16 @@ This provides dependency injection for application services,
 making them available to API route handlers.
 """
 
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import Tuple
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+import os
+import queue
+import threading
+
+import duckdb
+from fastapi import HTTPException
 
 from src.application.services.market_data_service import MarketDataService
 from src.application.services.analysis_service import AnalysisService
@@ -22,85 +30,51 @@ from src.domain.services.risk_calculator import RiskCalculatorService
 from src.shared.config.settings import Settings
 
 
-class ServiceContainer:
-    """Container for application services (singleton)."""
-    
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
-    
-    def _initialize(self):
-        """Initialize all services."""
-        # Settings
-        self.settings = Settings()
-        
-        # Infrastructure
-        self.binance = BinanceDataClient()
-        
-        # Keep parquet repository for backward compatibility
-        self.repository = ParquetMarketDataRepository(self.settings.STORAGE_PATH)
-        
-        # Domain services
-        self.ta_service = TechnicalAnalysisService()
-        self.regime_classifier = RegimeClassifierService(self.ta_service)
-        self.risk_calculator = RiskCalculatorService()
-        
-        # Application services
-        self.market_service = MarketDataService(
-            self.repository,
-            self.binance
-        )
-        self.analysis_service = AnalysisService(
-            self.market_service,
-            self.ta_service,
-            self.risk_calculator,
-            self.regime_classifier
-        )
-        self.scheduler_service = SchedulerService(
-            self.market_service,
-            self.analysis_service
-        )
-        self.orchestrator = PipelineOrchestrator(
-            self.market_service,
-            self.analysis_service
-        )
-
-
-# Global service container
-_container: ServiceContainer = None
-
-
-def get_container() -> ServiceContainer:
-    """Get or create service container."""
-    global _container
-    if _container is None:
-        _container = ServiceContainer()
-    return _container
-
-
-# Dependency functions for FastAPI
+# Each provider is built once on first use and cached; FastAPI's Depends()
+# then resolves to the same instance on every request.
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get application settings."""
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_ta_service() -> TechnicalAnalysisService:
+    """Get technical analysis service instance."""
+    return TechnicalAnalysisService()
+
+
+@lru_cache(maxsize=1)
 def get_market_service() -> MarketDataService:
     """Get market data service instance."""
-    return get_container().market_service
+    # Keep parquet repository for backward compatibility
+    repository = ParquetMarketDataRepository(get_settings().STORAGE_PATH)
+    return MarketDataService(repository, BinanceDataClient())
 
 
+@lru_cache(maxsize=1)
 def get_analysis_service() -> AnalysisService:
     """Get analysis service instance."""
-    return get_container().analysis_service
+    ta_service = get_ta_service()
+    return AnalysisService(
+        get_market_service(),
+        ta_service,
+        RiskCalculatorService(),
+        RegimeClassifierService(ta_service)
+    )
 
 
+@lru_cache(maxsize=1)
 def get_scheduler_service() -> SchedulerService:
     """Get scheduler service instance."""
-    return get_container().scheduler_service
+    return SchedulerService(get_market_service(), get_analysis_service())
 
 
+@lru_cache(maxsize=1)
 def get_orchestrator() -> PipelineOrchestrator:
     """Get pipeline orchestrator instance."""
-    return get_container().orchestrator
+    return PipelineOrchestrator(get_market_service(), get_analysis_service())
 
 
 def get_services() -> Tuple[MarketDataService, AnalysisService]:
@@ -110,5 +84,137 @@ def get_services() -> Tuple[MarketDataService, AnalysisService]:
     Returns:
         Tuple of (market_service, analysis_service)
     """
-    container = get_container()
-    return container.market_service, container.analysis_service
+    return get_market_service(), get_analysis_service()
+
+
+# One read-only DuckDB connection per process, shared through a bounded
+# pool of cursors. A connection must not run statements from several
+# threads at once, so each query borrows a cursor (shares the database
+# and its buffer cache); at most DB_POOL_SIZE queries run together and
+# further callers wait for a free cursor.
+DB_POOL_SIZE = 8
+DB_CURSOR_TIMEOUT = 10  # seconds a query waits for a free cursor
+_db_engine = None
+_db_cursors = None
+_db_engine_lock = threading.Lock()
+
+# The database file is attached READ_ONLY under this alias; the connection's
+# own in-memory catalog holds the views queries run against
+MARKET_DB_ALIAS = "market"
+_market_views = {}  # (symbol, interval) -> view name
+
+
+def _create_market_views(engine: duckdb.DuckDBPyConnection) -> dict:
+    """
+    Create the market_data view and one market_<symbol>_<interval> view
+    per stored pair.
+    
+    A pair view fixes the symbol/interval filter in its definition, so
+    queries against it bind only the timestamp range.
+    
+    Returns:
+        Dict of (symbol, interval) -> view name
+    """
+    source = f"{MARKET_DB_ALIAS}.main.market_data"
+    engine.execute(f"CREATE VIEW market_data AS SELECT * FROM {source}")
+    
+    views = {}
+    pairs = engine.execute(f"SELECT DISTINCT symbol, interval FROM {source}").fetchall()
+    for symbol, interval in pairs:
+        # Names and literals are built from the values, so only plain ones get a view
+        if not (symbol.isalnum() and interval.isalnum()):
+            continue
+        name = f"market_{symbol}_{interval}"
+        engine.execute(f"""
+            CREATE VIEW "{name}" AS
+            SELECT timestamp, open, high, low, close, volume
+            FROM {source}
+            WHERE symbol = '{symbol}'
+            AND interval = '{interval}'
+        """)
+        views[(symbol, interval)] = name
+    return views
+
+
+def get_db_engine() -> duckdb.DuckDBPyConnection:
+    """Get the shared read-only DuckDB connection (opened on first use)."""
+    global _db_engine, _db_cursors
+    if _db_engine is None:
+        with _db_engine_lock:
+            if _db_engine is None:
+                db_path = Path(get_settings().STORAGE_PATH) / "bitcoin_market.db"
+                # Every statement sorts explicitly, so insertion order need not
+                # be preserved; the object cache keeps Parquet/file metadata
+                # between the many small API queries
+                engine = duckdb.connect(config={
+                    'threads': os.cpu_count() or 4,
+                    'memory_limit': get_settings().DUCKDB_MEMORY_LIMIT,
+                    'enable_object_cache': True,
+                    'preserve_insertion_order': False,
+                })
+                path = str(db_path).replace("'", "''")
+                engine.execute(f"ATTACH '{path}' AS {MARKET_DB_ALIAS} (READ_ONLY)")
+                _market_views.update(_create_market_views(engine))
+                cursors = queue.Queue(maxsize=DB_POOL_SIZE)
+                for _ in range(DB_POOL_SIZE):
+                    cursors.put(engine.cursor())
+                _db_cursors = cursors
+                _db_engine = engine
+    return _db_engine
+
+
+def get_market_view(symbol: str, interval: str) -> Optional[str]:
+    """View holding only symbol/interval rows (None if the pair has none)."""
+    get_db_engine()
+    return _market_views.get((symbol, interval))
+
+
+@contextmanager
+def get_db_cursor() -> Iterator[duckdb.DuckDBPyConnection]:
+    """
+    Borrow a cursor on the shared DuckDB connection.
+    
+    Use as a context manager; the cursor goes back to the pool on exit.
+    
+    Raises:
+        HTTPException: 503 if no cursor is free within DB_CURSOR_TIMEOUT
+    """
+    get_db_engine()
+    cursors = _db_cursors
+    try:
+        cursor = cursors.get(timeout=DB_CURSOR_TIMEOUT)
+    except queue.Empty:
+        raise HTTPException(status_code=503, detail="Database busy, retry later")
+    try:
+        yield cursor
+    finally:
+        cursors.put(cursor)
+
+
+@contextmanager
+def get_stream_cursor() -> Iterator[duckdb.DuckDBPyConnection]:
+    """
+    Open a cursor outside the pool for a long-lived read.
+    
+    Streaming responses hold their cursor for as long as the client takes
+    to read; a dedicated cursor keeps slow clients from starving the
+    pooled queries. The cursor is closed on exit.
+    """
+    cursor = get_db_engine().cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
+def close_db_engine() -> None:
+    """Close the shared DuckDB connection and its cursors (application shutdown)."""
+    global _db_engine, _db_cursors
+    with _db_engine_lock:
+        if _db_engine is not None:
+            while not _db_cursors.empty():
+                _db_cursors.get_nowait().close()
+            _db_engine.close()
+            _db_engine = None
+            _db_cursors = None
+            _market_views.clear()
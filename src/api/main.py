@@ -11,15 +11,18 @@ This provides RESTful endpoints for:
 
 from datetime import datetime
 from typing import Optional
+import asyncio
 import logging
 
+import pandas as pd
+
 from fastapi import FastAPI, HTTPException, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from src.api.routes import market_data_router, analysis_router, scheduler_router
-from src.api.dependencies import get_services
-from src.shared.config.settings import Settings
+from src.api.routes.analysis import query_and_classify_regimes
+from src.api.dependencies import get_services, get_settings, close_db_engine
 
 # Configure logging
 logging.basicConfig(
@@ -28,8 +31,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize settings
-settings = Settings()
+# Cached settings instance shared with the dependency providers
+settings = get_settings()
+
+# Copy-on-write (always on from pandas 3): column selections and
+# set_index on the request path share column data instead of copying it
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Series classified at startup to warm the DB engine and regime model
+WARMUP_SYMBOL = "BTCUSDT"
+WARMUP_INTERVAL = "1h"
 
 # Create FastAPI app
 app = FastAPI(
@@ -149,6 +161,16 @@ async def startup_event():
     logger.info("🚀 Starting Bitcoin Market Intelligence API")
     logger.info(f"📁 Storage path: {settings.STORAGE_PATH}")
     logger.info(f"🌍 Environment: {settings.ENVIRONMENT}")
+    
+    # Open DuckDB, compute indicators and load/fit the regime model now so
+    # the first request doesn't pay for it (same call as /analysis/regimes)
+    try:
+        await asyncio.to_thread(
+            query_and_classify_regimes, WARMUP_SYMBOL, WARMUP_INTERVAL, None, None, 100
+        )
+        logger.info(f"🔥 Warmed regime classification for {WARMUP_SYMBOL} {WARMUP_INTERVAL}")
+    except Exception as e:
+        logger.warning(f"⚠️  Warmup skipped (no data yet?): {e}")
 
 
 # Shutdown event
@@ -156,6 +178,7 @@ async def startup_event():
 async def shutdown_event():
     """Run on application shutdown."""
     logger.info("🛑 Shutting down Bitcoin Market Intelligence API")
+    close_db_engine()
 
 
 if __name__ == "__main__":
@@ -5,8 +5,9 @@ Pydantic Models - Request/Response schemas for API.
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
+import sys
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # ==================== Enums ====================
@@ -23,6 +24,18 @@ class IntervalEnum(str, Enum):
     ONE_WEEK = "1w"
 
 
+# Interned value string per member; a dict lookup is cheaper than the
+# Enum .value descriptor on hot request paths
+INTERVAL_STR = {member: sys.intern(member.value) for member in IntervalEnum}
+
+# Bar length per interval value (weekly bars open on Mondays, which
+# fixed-length flooring from the epoch does not give, so 1w is left out)
+INTERVAL_SECONDS = {
+    "1m": 60, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "4h": 4 * 3600, "1d": 24 * 3600,
+}
+
+
 class RegimeTypeEnum(str, Enum):
     """Market regime types."""
     BULL = "bull"
@@ -42,17 +55,16 @@ class OHLCVResponse(BaseModel):
     close: float
     volume: float
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "timestamp": "2024-01-01T00:00:00",
-                "open": 45000.0,
-                "high": 45500.0,
-                "low": 44800.0,
-                "close": 45200.0,
-                "volume": 123.45
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "timestamp": "2024-01-01T00:00:00",
+            "open": 45000.0,
+            "high": 45500.0,
+            "low": 44800.0,
+            "close": 45200.0,
+            "volume": 123.45
         }
+    })
 
 
 class MarketDataResponse(BaseModel):
@@ -72,15 +84,14 @@ class DownloadRequest(BaseModel):
     end: datetime = Field(description="End datetime")
     interval: IntervalEnum = Field(default=IntervalEnum.ONE_HOUR, description="Timeframe")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "symbol": "BTCUSDT",
-                "start": "2024-01-01T00:00:00",
-                "end": "2024-02-01T00:00:00",
-                "interval": "1h"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "symbol": "BTCUSDT",
+            "start": "2024-01-01T00:00:00",
+            "end": "2024-02-01T00:00:00",
+            "interval": "1h"
         }
+    })
 
 
 class DownloadResponse(BaseModel):
@@ -91,6 +102,7 @@ class DownloadResponse(BaseModel):
     start: datetime
     end: datetime
     message: str
+    job_id: Optional[str] = None
 
 
 # ==================== Technical Analysis ====================
@@ -254,24 +266,23 @@ class InvestmentDecisionResponse(BaseModel):
     market_context: Optional[Dict[str, Any]] = Field(default=None, description="Market context analysis")
     insights: Optional[Dict[str, Any]] = Field(default=None, description="Actionable investment insights")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "symbol": "BTCUSDT",
-                "interval": "1h",
-                "timestamp": "2024-11-15T12:00:00",
-                "signal": "Mua",
-                "score": 67.5,
-                "confidence": 75.0,
-                "factors": {
-                    "trend": {"score": 72.0, "weight": 0.25, "contribution": 18.0},
-                    "technical": {"score": 65.0, "weight": 0.25, "contribution": 16.25},
-                    "risk": {"score": 58.0, "weight": 0.20, "contribution": 11.6},
-                    "regime": {"score": 80.0, "weight": 0.20, "contribution": 16.0},
-                    "drawdown": {"score": 55.0, "weight": 0.10, "contribution": 5.5}
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "symbol": "BTCUSDT",
+            "interval": "1h",
+            "timestamp": "2024-11-15T12:00:00",
+            "signal": "Mua",
+            "score": 67.5,
+            "confidence": 75.0,
+            "factors": {
+                "trend": {"score": 72.0, "weight": 0.25, "contribution": 18.0},
+                "technical": {"score": 65.0, "weight": 0.25, "contribution": 16.25},
+                "risk": {"score": 58.0, "weight": 0.20, "contribution": 11.6},
+                "regime": {"score": 80.0, "weight": 0.20, "contribution": 16.0},
+                "drawdown": {"score": 55.0, "weight": 0.10, "contribution": 5.5}
             }
         }
+    })
 
 
 # ==================== Error Responses ====================
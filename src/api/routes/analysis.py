@@ -4,18 +4,25 @@ Analysis API Routes.
 Endpoints for technical analysis, regime classification, and risk metrics.
 """
 
-from datetime import datetime
+from collections import OrderedDict
+import asyncio
+from datetime import datetime, timedelta
 from typing import Optional
+import threading
+import time
+import joblib
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
-from src.api.dependencies import get_analysis_service
+from src.api.dependencies import get_analysis_service, get_db_cursor, get_settings
 from src.api.models import (
     TechnicalIndicatorsResponse,
     FeaturesResponse,
-    MarketRegimeResponse,
     RegimeClassificationResponse,
     TrainRegimeRequest,
     DrawdownResponse,
@@ -26,89 +33,285 @@ from src.api.models import (
     InvestmentDecisionResponse,
     InvestmentFactorScore,
     IntervalEnum,
-    RegimeTypeEnum
+    INTERVAL_SECONDS
 )
 from src.application.services.analysis_service import AnalysisService
 from src.shared.exceptions.custom_exceptions import (
     DataNotFoundError,
-    AnalysisException
+    AnalysisException,
+    TechnicalIndicatorError
 )
 from src.infrastructure.storage.duckdb_query_engine import DuckDBQueryEngine
 from src.domain.services.technical_analysis import TechnicalAnalysisService
-from src.shared.config.settings import Settings
+from src.shared.utils.logging_utils import get_logger
 from pathlib import Path
 
 router = APIRouter()
+logger = get_logger(__name__)
 
-# Initialize TA service, Regime service, and DuckDB (lazy)
-settings = Settings()
-db_path = Path(settings.STORAGE_PATH) / "bitcoin_market.db"
+# Initialize TA service and Regime service
 ta_service = TechnicalAnalysisService()
 
 # Import regime services
+from src.domain.models.market_regime import RegimeType
 from src.domain.services.regime_classifier import RegimeClassifierService
+from src.domain.services.investment_advisor import InvestmentAdvisorService
 from src.domain.services.risk_calculator import RiskCalculatorService
 
-regime_service = RegimeClassifierService(n_regimes=4, n_hmm_states=4)  # 4 regimes: Bull/Bear/Neutral/HighVol
 risk_service = RiskCalculatorService()
 
-_db_engine = None
+# Fitted regime classifiers per (symbol, interval), kept in memory and
+# persisted with joblib so restarts skip HMM training. Models older than
+# REGIME_MODEL_MAX_AGE are refitted on the next request.
+REGIME_MODEL_DIR = Path(get_settings().STORAGE_PATH) / "models"
+REGIME_MODEL_MAX_AGE = 7 * 24 * 3600  # seconds
+_regime_models = {}
+_regime_models_lock = threading.Lock()
 
-def get_db_engine():
-    global _db_engine
-    if _db_engine is None:
-        import duckdb
-        _db_engine = duckdb.connect(str(db_path), read_only=True)
-    return _db_engine
 
+def _load_regime_model(symbol: str, interval: str) -> Optional[RegimeClassifierService]:
+    """In-memory or on-disk model that is still fresh (caller holds the lock)."""
+    key = (symbol, interval)
+    model, fitted_at = _regime_models.get(key, (None, 0.0))
+    if model is not None and time.time() - fitted_at < REGIME_MODEL_MAX_AGE:
+        return model
+    
+    model_path = REGIME_MODEL_DIR / f"hmm_{symbol}_{interval}.pkl"
+    if model_path.exists() and time.time() - model_path.stat().st_mtime < REGIME_MODEL_MAX_AGE:
+        try:
+            model = joblib.load(model_path)
+            _regime_models[key] = (model, model_path.stat().st_mtime)
+            return model
+        except Exception as e:
+            logger.warning(f"Could not load regime model {model_path}: {e}")
+    return None
 
-def query_and_calculate_indicators(
+
+def cached_regime_model(symbol: str, interval: str) -> Optional[RegimeClassifierService]:
+    """Fitted regime classifier for symbol/interval if one is available without training."""
+    with _regime_models_lock:
+        return _load_regime_model(symbol, interval)
+
+
+def get_regime_model(symbol: str, interval: str, train_df: pd.DataFrame) -> RegimeClassifierService:
+    """
+    Fitted regime classifier for symbol/interval.
+    
+    Uses the in-memory model, then a fresh enough model file on disk;
+    otherwise fits a new classifier on `train_df` and saves it.
+    """
+    key = (symbol, interval)
+    with _regime_models_lock:
+        model = _load_regime_model(symbol, interval)
+        if model is not None:
+            return model
+        
+        model_path = REGIME_MODEL_DIR / f"hmm_{symbol}_{interval}.pkl"
+        model = RegimeClassifierService(n_regimes=4, n_hmm_states=4).fit(train_df)
+        _regime_models[key] = (model, time.time())
+        try:
+            REGIME_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+            joblib.dump(model, model_path)
+        except Exception as e:
+            logger.warning(f"Could not save regime model {model_path}: {e}")
+        return model
+
+
+def _market_data_query(with_start: bool, with_end: bool) -> str:
+    """
+    OHLCV statement with a timestamp filter only for the bounds given.
+    
+    Plain `timestamp >= ?` filters reach the scan (row groups outside the
+    range are skipped); the "? IS NULL OR ..." form they replace kept every
+    row group. The limit keeps the latest rows in the range, returned in
+    ascending order; LIMIT NULL means "unbounded".
+    """
+    filters = ["symbol = ?", "interval = ?"]
+    if with_start:
+        filters.append("timestamp >= ?")
+    if with_end:
+        filters.append("timestamp <= ?")
+    where = "\n        AND ".join(filters)
+    return f"""
+    WITH latest AS (
+        SELECT timestamp, open, high, low, close, volume
+        FROM market_data
+        WHERE {where}
+        ORDER BY timestamp DESC
+        LIMIT ?
+    )
+    SELECT * FROM latest
+    ORDER BY timestamp ASC
+"""
+
+
+# Statement text per (has start, has end), built once at import.
+# Params: symbol, interval, [start], [end], limit
+MARKET_DATA_QUERIES = {
+    (with_start, with_end): _market_data_query(with_start, with_end)
+    for with_start in (False, True)
+    for with_end in (False, True)
+}
+
+
+# Columns of the /indicators response: OHLCV plus whichever of the
+# indicator columns the frame has, in this order
+OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+INDICATOR_RESPONSE_COLUMNS = (
+    'rsi', 'macd', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_width',
+    'sma_20', 'sma_50', 'ema_12', 'ema_26'
+)
+
+# Extra rows fetched ahead of a limited window so indicators are warmed up
+INDICATOR_WARMUP_BARS = 200
+
+# Freshness probe: the cached result is reused while these are unchanged
+MARKET_DATA_VERSION_QUERY = """
+    SELECT max(timestamp), count(*)
+    FROM market_data
+    WHERE symbol = ? AND interval = ?
+"""
+
+# LRU of indicator frames:
+# (symbol, interval, start, end, limit) -> ((max_timestamp, row_count), DataFrame)
+INDICATOR_CACHE_SIZE = 32
+_indicator_cache = OrderedDict()
+_indicator_cache_lock = threading.Lock()
+
+
+def clear_indicator_cache() -> None:
+    """Drop cached indicator frames (call after writing new market data)."""
+    with _indicator_cache_lock:
+        _indicator_cache.clear()
+
+
+def _probe_market_data_version(cursor, symbol: str, interval: str) -> tuple:
+    """Latest timestamp and row count stored for symbol/interval."""
+    return cursor.execute(MARKET_DATA_VERSION_QUERY, [symbol, interval]).fetchone()
+
+
+def floor_to_interval(ts: datetime, interval: str) -> datetime:
+    """
+    Start of the bar containing `ts` (unchanged for unknown intervals).
+    
+    Bars open on these boundaries, so a range ending at the floored time
+    holds the same rows as one ending at `ts`.
+    """
+    seconds = INTERVAL_SECONDS.get(interval)
+    if seconds is None:
+        return ts
+    return pd.Timestamp(ts).floor(pd.Timedelta(seconds=seconds)).to_pydatetime()
+
+
+# Same text as str(pd.Timestamp) for the second-resolution bars served here
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def format_timestamps(timestamps) -> np.ndarray:
+    """
+    Timestamps as TIMESTAMP_FORMAT strings (object array).
+    
+    Arrow formats them into one string buffer instead of boxing each value
+    as a Timestamp for str(). Cast to seconds first: Arrow's %S prints the
+    fractional part of the unit.
+    """
+    ts_arr = pa.array(pd.DatetimeIndex(timestamps)).cast(pa.timestamp('s'), safe=False)
+    return pc.strftime(ts_arr, format=TIMESTAMP_FORMAT).to_numpy(zero_copy_only=False)
+
+
+def fetch_market_data(
+    cursor,
     symbol: str,
     interval: str,
     start: Optional[datetime],
     end: Optional[datetime],
     limit: Optional[int] = None
 ) -> pd.DataFrame:
-    """Query data from DuckDB and calculate technical indicators."""
-    # Query data
-    query = f"""
-        SELECT timestamp, open, high, low, close, volume
-        FROM market_data
-        WHERE symbol = '{symbol}'
-        AND interval = '{interval}'
     """
+    Run the MARKET_DATA_QUERIES statement for the given bounds on `cursor`
+    and return the OHLCV rows.
     
-    if start:
-        query += f" AND timestamp >= '{start.isoformat()}'"
-    if end:
-        query += f" AND timestamp <= '{end.isoformat()}'"
+    Values are bound as parameters (never formatted into the SQL). DuckDB
+    hands back one numpy array per column (TIMESTAMP as datetime64, so no
+    re-parse is needed) and the frame wraps them without copying.
+    """
+    # Stored timestamps are naive; bounds are compared as wall-clock time
+    start = start.replace(tzinfo=None) if start else None
+    end = end.replace(tzinfo=None) if end else None
     
-    query += " ORDER BY timestamp ASC"
+    params = [symbol, interval]
+    if start is not None:
+        params.append(start)
+    if end is not None:
+        params.append(end)
+    params.append(limit)
     
-    if limit:
-        # Get more data for indicator calculation (need history)
-        query += f" LIMIT {limit + 200}"
+    columns = cursor.execute(
+        MARKET_DATA_QUERIES[start is not None, end is not None], params
+    ).fetchnumpy()
+    return pd.DataFrame(columns, copy=False)
+
+
+def query_and_calculate_indicators(
+    symbol: str,
+    interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Query data from DuckDB and calculate technical indicators.
     
-    conn = get_db_engine()
-    df = conn.execute(query).fetchdf()
+    Results are cached per (symbol, interval, start, end, limit) and reused
+    until the stored data for symbol/interval changes. The returned frame
+    may be shared between callers and must not be modified in place.
+    """
+    cache_key = (symbol, interval, start, end, limit)
+    
+    with get_db_cursor() as cursor:
+        version = _probe_market_data_version(cursor, symbol, interval)
+        
+        with _indicator_cache_lock:
+            cached = _indicator_cache.get(cache_key)
+            if cached is not None and cached[0] == version:
+                _indicator_cache.move_to_end(cache_key)
+                return cached[1]
+        
+        # Latest rows only, padded for indicator warmup (need history)
+        row_limit = limit + INDICATOR_WARMUP_BARS if limit else None
+        df = fetch_market_data(cursor, symbol, interval, start, end, row_limit)
     
     if df.empty:
         return pd.DataFrame()
     
-    # Ensure timestamp is datetime
-    if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-    
     # Calculate indicators
     df_with_indicators = ta_service.calculate_all_indicators(df)
     
     # Apply final limit if specified
     if limit and len(df_with_indicators) > limit:
-        df_with_indicators = df_with_indicators.iloc[-limit:]
+        df_with_indicators = df_with_indicators.tail(limit)
+    
+    with _indicator_cache_lock:
+        _indicator_cache[cache_key] = (version, df_with_indicators)
+        _indicator_cache.move_to_end(cache_key)
+        while len(_indicator_cache) > INDICATOR_CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
     
     return df_with_indicators
 
 
+# Regime name by HMM state label, and the matching probability column order
+REGIME_NAMES = np.array(["bull", "bear", "neutral", "high_volatility"], dtype=object)
+REGIME_TYPES = tuple(RegimeType(name) for name in REGIME_NAMES)
+# Bars fed to the classifier for a limited request
+REGIME_HISTORY_BARS = 1000
+# Per-regime probability columns of the classification frame
+REGIME_PROB_COLUMNS = ['bull_prob', 'bear_prob', 'neutral_prob', 'high_volatility_prob']
+# OHLCV columns feature extraction needs
+REGIME_REQUIRED_COLUMNS = frozenset({'timestamp', 'open', 'high', 'low', 'close', 'volume'})
+
+
 def query_and_classify_regimes(
     symbol: str,
     interval: str,
@@ -117,13 +320,14 @@ def query_and_classify_regimes(
     limit: Optional[int] = None
 ) -> dict:
     """Query data, calculate indicators, and classify regimes."""
-    # Get data with indicators
+    # Get data with indicators: enough recent history for regime
+    # classification rather than the full range
     df = query_and_calculate_indicators(
         symbol=symbol,
         interval=interval,
         start=start,
         end=end,
-        limit=None  # Need full history for regime classification
+        limit=max(limit, REGIME_HISTORY_BARS) if limit else None
     )
     
     if df.empty:
@@ -131,10 +335,9 @@ def query_and_classify_regimes(
     
     # Ensure we have the required columns for feature extraction
     # The DataFrame should have: timestamp, open, high, low, close, volume, + indicators
-    required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-    for col in required_cols:
-        if col not in df.columns:
-            raise HTTPException(status_code=500, detail=f"Missing required column: {col}")
+    missing = REGIME_REQUIRED_COLUMNS.difference(df.columns)
+    if missing:
+        raise HTTPException(status_code=500, detail=f"Missing required column: {', '.join(sorted(missing))}")
     
     # Check if we have enough data
     if len(df) < 100:
@@ -144,26 +347,18 @@ def query_and_classify_regimes(
     if 'timestamp' in df.columns and not isinstance(df.index, pd.DatetimeIndex):
         df = df.set_index('timestamp')
     
-    # Train regime classifier if not fitted (pass raw OHLCV data, it will extract features internally)
-    if not hasattr(regime_service, 'is_fitted') or not regime_service.is_fitted:
-        regime_service.fit(df)  # Pass df, not features_df
+    # Fitted classifier for this symbol/interval, trained on first use
+    # (pass raw OHLCV data, it will extract features internally)
+    model = get_regime_model(symbol, interval, df)
     
-    # Get probability predictions (returns DataFrame with prob_bull, prob_bear, etc.)
-    proba_df = regime_service.predict_proba(df)
+    # Probability matrix in bull/bear/neutral/high_volatility column order
+    # (regimes without a mapped cluster are zero columns)
+    probabilities, timestamps = model.predict_proba_array(df, REGIME_TYPES)
     
     # Validate outputs
-    if proba_df.empty:
+    if len(probabilities) == 0:
         raise HTTPException(status_code=500, detail="No regimes classified")
     
-    # Ensure all probability columns exist (fill with 0 if missing)
-    prob_cols = ['prob_bull', 'prob_bear', 'prob_neutral', 'prob_high_volatility']
-    for col in prob_cols:
-        if col not in proba_df.columns:
-            proba_df[col] = 0.0
-    
-    # Extract probabilities as numpy array for easier manipulation
-    probabilities = proba_df[prob_cols].values
-    
     if probabilities.ndim != 2:
         raise HTTPException(status_code=500, detail=f"Invalid probabilities shape: {probabilities.shape}")
     
@@ -175,23 +370,24 @@ def query_and_classify_regimes(
     if n_samples != len(regime_labels):
         raise HTTPException(status_code=500, detail=f"Length mismatch: {n_samples} probs vs {len(regime_labels)} labels")
     
-    # Get regime names
-    regime_names = []
-    for label in regime_labels:
-        if label == 0:
-            regime_names.append("bull")
-        elif label == 1:
-            regime_names.append("bear")
-        elif label == 2:
-            regime_names.append("neutral")
-        else:
-            regime_names.append("high_volatility")
-    
-    # Use timestamps from proba_df (it has the correct aligned timestamps after feature extraction)
-    # The index should be DatetimeIndex after feature extraction
-    result_timestamps = pd.to_datetime(proba_df.index).astype(str).values
-    
-    # Combine results into DataFrame
+    # Apply limit on the arrays before building any per-row output
+    if limit and n_samples > limit:
+        probabilities = probabilities[-limit:]
+        regime_labels = regime_labels[-limit:]
+        timestamps = timestamps[-limit:]
+        n_samples = limit
+    
+    # Clip probabilities to [0, 1] to handle floating point precision
+    # issues - one in-place pass over the (N, 4) block
+    np.clip(probabilities, 0.0, 1.0, out=probabilities)
+    
+    # Get regime names (labels past the table map to high_volatility)
+    regime_names = REGIME_NAMES[np.clip(regime_labels, 0, len(REGIME_NAMES) - 1)]
+    
+    # Timestamps are the feature index (aligned after feature extraction)
+    result_timestamps = format_timestamps(timestamps)
+    
+    # Combine results into DataFrame (columns wrap the numpy arrays)
     result_df = pd.DataFrame({
         'timestamp': result_timestamps,
         'regime': regime_names,
@@ -200,16 +396,12 @@ def query_and_classify_regimes(
         'bear_prob': probabilities[:, 1] if n_states > 1 else np.zeros(n_samples),
         'neutral_prob': probabilities[:, 2] if n_states > 2 else np.zeros(n_samples),
         'high_volatility_prob': probabilities[:, 3] if n_states > 3 else np.zeros(n_samples)
-    })
-    
-    # Apply limit if specified
-    if limit and len(result_df) > limit:
-        result_df = result_df.iloc[-limit:]
+    }, copy=False)
     
     return {
         "regimes": result_df,
         "model_type": "HMM",
-        "n_states": regime_service.n_components if hasattr(regime_service, 'n_components') else 4
+        "n_states": model.n_components if hasattr(model, 'n_components') else 4
     }
 
 
@@ -228,6 +420,7 @@ async def get_technical_indicators(
     end: Optional[datetime] = Query(default=None),
     interval: IntervalEnum = Query(default=IntervalEnum.ONE_HOUR),
     limit: Optional[int] = Query(default=1000, description="Max rows to return (default 1000)"),
+    format: str = Query(default="records", pattern="^(records|columnar)$", description="Payload layout"),
     analysis_service: AnalysisService = Depends(get_analysis_service)
 ):
     """
@@ -240,13 +433,17 @@ async def get_technical_indicators(
     - **start**: Start datetime
     - **end**: End datetime
     - **interval**: Timeframe
+    - **format**: `records` (list of per-row objects) or `columnar`
+      (object of per-column arrays)
     
     ## Returns
     Technical indicators for each timestamp.
     """
     try:
-        # Query data and calculate indicators directly
-        df = query_and_calculate_indicators(
+        # Query data and calculate indicators directly (worker thread, so
+        # the event loop keeps serving other requests)
+        df = await asyncio.to_thread(
+            query_and_calculate_indicators,
             symbol=symbol,
             interval=interval.value,
             start=start,
@@ -258,36 +455,47 @@ async def get_technical_indicators(
             raise HTTPException(status_code=404, detail="No data found")
         
         # Convert to records for response
-        # Get available columns (some indicators might be missing)
-        available_cols = df.columns.tolist()
-        cols_to_include = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        
-        # Add indicator columns if they exist
-        indicator_cols = ['rsi', 'macd', 'macd_signal', 'macd_hist',
-                         'bb_upper', 'bb_middle', 'bb_lower', 'bb_width',
-                         'sma_20', 'sma_50', 'ema_12', 'ema_26']
+        # Add indicator columns if they exist (some indicators might be
+        # missing); membership tests hit the column index hash table
+        cols_to_include = list(OHLCV_COLUMNS) + [
+            col for col in INDICATOR_RESPONSE_COLUMNS if col in df.columns
+        ]
         
-        for col in indicator_cols:
-            if col in available_cols:
-                cols_to_include.append(col)
+        if format == "columnar":
+            # Numeric columns go to orjson as numpy arrays (NaN/inf -> null)
+            data = {col: df[col].to_numpy() for col in cols_to_include}
+            data['timestamp'] = format_timestamps(df['timestamp']).tolist()
+            return ORJSONResponse({
+                "symbol": symbol,
+                "interval": interval.value,
+                "count": len(df),
+                "data": data
+            })
         
-        result_df = df[cols_to_include].copy()
+        # Column selection is a new frame; with copy-on-write the writes
+        # below never reach the shared cached frame, so no .copy() needed
+        result_df = df[cols_to_include]
         
         # Convert timestamps to strings for JSON serialization
-        result_df['timestamp'] = result_df['timestamp'].astype(str)
+        result_df['timestamp'] = format_timestamps(result_df['timestamp'])
         
-        # Replace NaN/inf with None for JSON compliance
-        result_df = result_df.replace([float('nan'), float('inf'), float('-inf')], None)
+        # Map inf to NaN in one isfinite pass over the float block (columns
+        # stay float64); orjson writes NaN as null for JSON compliance
+        float_cols = result_df.select_dtypes(include=[np.floating]).columns
+        values = result_df[float_cols].to_numpy(dtype=np.float64)
+        result_df[float_cols] = np.where(np.isfinite(values), values, np.nan)
         
         indicators = result_df.to_dict(orient="records")
         
-        return {
+        return ORJSONResponse({
             "symbol": symbol,
             "interval": interval.value,
             "count": len(indicators),
             "data": indicators
-        }
+        })
         
+    except HTTPException:
+        raise
     except DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except AnalysisException as e:
@@ -324,7 +532,8 @@ async def get_regime_features(
     Feature vectors for regime classification.
     """
     try:
-        df = analysis_service.extract_regime_features(
+        df = await asyncio.to_thread(
+            analysis_service.extract_regime_features,
             symbol=symbol,
             start=start,
             end=end,
@@ -383,8 +592,9 @@ async def classify_regimes(
     Regime predictions (bull/bear/neutral/high_volatility) with probabilities.
     """
     try:
-        # Query data and classify regimes
-        result = query_and_classify_regimes(
+        # Query data and classify regimes (worker thread)
+        result = await asyncio.to_thread(
+            query_and_classify_regimes,
             symbol=symbol,
             interval=interval.value,
             start=start,
@@ -397,36 +607,26 @@ async def classify_regimes(
         
         df = result["regimes"]
         
-        # Convert timestamps to strings
-        df['timestamp'] = df['timestamp'].astype(str)
-        
-        # Clip probabilities to [0, 1] to handle floating point precision issues
-        df['bull_prob'] = df['bull_prob'].clip(0.0, 1.0)
-        df['bear_prob'] = df['bear_prob'].clip(0.0, 1.0)
-        df['neutral_prob'] = df['neutral_prob'].clip(0.0, 1.0)
-        df['high_volatility_prob'] = df['high_volatility_prob'].clip(0.0, 1.0)
-        
+        # Timestamps are already formatted and probabilities clipped, so the
+        # records match RegimeClassificationResponse and go straight to
+        # orjson. Rows are zipped from per-column lists (plain Python values)
+        # rather than boxed row by row by pandas or Pydantic.
+        columns = list(df.columns)
         regimes = [
-            MarketRegimeResponse(
-                timestamp=row.timestamp,
-                regime=RegimeTypeEnum(row.regime),
-                regime_state=int(row.regime_state),
-                bull_prob=float(row.bull_prob),
-                bear_prob=float(row.bear_prob),
-                neutral_prob=float(row.neutral_prob),
-                high_volatility_prob=float(row.high_volatility_prob)
-            )
-            for row in df.itertuples(index=False)
+            dict(zip(columns, row))
+            for row in zip(*(df[col].tolist() for col in columns))
         ]
         
-        return RegimeClassificationResponse(
-            symbol=symbol,
-            interval=interval.value,
-            count=len(regimes),
-            model_score=None,  # Can add model score later
-            regimes=regimes
-        )
+        return ORJSONResponse({
+            "symbol": symbol,
+            "interval": interval.value,
+            "count": len(regimes),
+            "model_score": None,  # Can add model score later
+            "regimes": regimes
+        })
         
+    except HTTPException:
+        raise
     except DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except AnalysisException as e:
@@ -464,7 +664,8 @@ async def train_regime_classifier(
     Training confirmation with model score.
     """
     try:
-        result = analysis_service.train_regime_classifier(
+        result = await asyncio.to_thread(
+            analysis_service.train_regime_classifier,
             symbol=request.symbol,
             start=request.start,
             end=request.end,
@@ -493,6 +694,87 @@ async def train_regime_classifier(
 # RISK METRICS
 # ============================================================================
 
+# Risk results shared by the risk endpoints (a dashboard polls all of them):
+# (metric, symbol, interval, start, end, confidence_level) -> (computed_at, result);
+# metric is None for the full analyze_risk() result
+RISK_CACHE_SIZE = 256
+RISK_CACHE_TTL = 60  # seconds
+_risk_cache = OrderedDict()
+_risk_cache_lock = threading.Lock()
+
+
+def _cached_risk(key: tuple, compute):
+    """compute() memoized under `key` for RISK_CACHE_TTL seconds."""
+    now = time.monotonic()
+    with _risk_cache_lock:
+        cached = _risk_cache.get(key)
+        if cached is not None and now - cached[0] < RISK_CACHE_TTL:
+            _risk_cache.move_to_end(key)
+            return cached[1]
+    
+    result = compute()
+    
+    with _risk_cache_lock:
+        _risk_cache[key] = (now, result)
+        _risk_cache.move_to_end(key)
+        while len(_risk_cache) > RISK_CACHE_SIZE:
+            _risk_cache.popitem(last=False)
+    return result
+
+
+def cached_analyze_risk(
+    analysis_service: AnalysisService,
+    symbol: str,
+    interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    confidence_level: float = 0.95
+):
+    """
+    analysis_service.analyze_risk() memoized for RISK_CACHE_TTL seconds.
+    
+    The result is shared between callers and must not be modified.
+    """
+    return _cached_risk(
+        (None, symbol, interval, start, end, confidence_level),
+        lambda: analysis_service.analyze_risk(
+            symbol=symbol,
+            interval=interval,
+            start=start,
+            end=end,
+            confidence_level=confidence_level
+        )
+    )
+
+
+def cached_risk_metric(
+    analysis_service: AnalysisService,
+    metric: str,
+    symbol: str,
+    interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    confidence_level: float = 0.95
+) -> Optional[float]:
+    """
+    analysis_service.analyze_risk_metric() memoized for RISK_CACHE_TTL seconds.
+    
+    The single-metric endpoints compute only their own value instead of
+    the full analyze_risk() result.
+    """
+    return _cached_risk(
+        (metric, symbol, interval, start, end, confidence_level),
+        lambda: analysis_service.analyze_risk_metric(
+            symbol=symbol,
+            interval=interval,
+            start=start,
+            end=end,
+            metric=metric,
+            confidence_level=confidence_level
+        )
+    )
+
+
 @router.get(
     "/risk-metrics",
     summary="Calculate risk metrics",
@@ -528,12 +810,8 @@ async def get_risk_metrics(
     - **Value at Risk (VaR)**: Potential losses at confidence level
     """
     try:
-        result = analysis_service.analyze_risk(
-            symbol=symbol,
-            interval=interval.value,
-            start=start,
-            end=end,
-            confidence_level=confidence_level
+        result = await asyncio.to_thread(
+            cached_analyze_risk, analysis_service, symbol, interval.value, start, end, confidence_level
         )
         
         if not result:
@@ -570,15 +848,11 @@ async def get_drawdown(
 ):
     """Calculate drawdown metrics only."""
     try:
-        result = analysis_service.analyze_risk(
-            symbol=symbol,
-            interval=interval.value,
-            start=start,
-            end=end
+        max_drawdown = await asyncio.to_thread(
+            cached_risk_metric, analysis_service, 'max_drawdown', symbol, interval.value, start, end
         )
         
-        # Extract max_drawdown from result
-        return {"max_drawdown": result.max_drawdown if hasattr(result, 'max_drawdown') else result.get('max_drawdown')}
+        return {"max_drawdown": max_drawdown}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -599,15 +873,11 @@ async def get_volatility(
 ):
     """Calculate volatility metrics only."""
     try:
-        result = analysis_service.analyze_risk(
-            symbol=symbol,
-            interval=interval.value,
-            start=start,
-            end=end
+        volatility = await asyncio.to_thread(
+            cached_risk_metric, analysis_service, 'volatility', symbol, interval.value, start, end
         )
         
-        # Extract volatility from result
-        return {"volatility": result.volatility if hasattr(result, 'volatility') else result.get('volatility')}
+        return {"volatility": volatility}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -628,15 +898,11 @@ async def get_sharpe_ratio(
 ):
     """Calculate Sharpe ratio only."""
     try:
-        result = analysis_service.analyze_risk(
-            symbol=symbol,
-            interval=interval.value,
-            start=start,
-            end=end
+        sharpe_ratio = await asyncio.to_thread(
+            cached_risk_metric, analysis_service, 'sharpe_ratio', symbol, interval.value, start, end
         )
         
-        # Extract sharpe_ratio from result
-        return {"sharpe_ratio": result.sharpe_ratio if hasattr(result, 'sharpe_ratio') else result.get('sharpe_ratio')}
+        return {"sharpe_ratio": sharpe_ratio}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -657,17 +923,12 @@ async def get_value_at_risk(
 ):
     """Calculate Value at Risk only."""
     try:
-        result = analysis_service.analyze_risk(
-            symbol=symbol,
-            interval=interval.value,
-            start=start,
-            end=end,
-            confidence_level=confidence_level
+        var = await asyncio.to_thread(
+            cached_risk_metric, analysis_service, 'var', symbol, interval.value, start, end, confidence_level
         )
         
-        # Extract VaR from result based on confidence level
-        var_key = f'var_{int(confidence_level * 100)}'
-        return {var_key: result.__dict__.get(var_key) if hasattr(result, '__dict__') else result.get(var_key)}
+        # Key named after the confidence level (e.g. var_95)
+        return {f'var_{int(confidence_level * 100)}': var}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -675,6 +936,77 @@ async def get_value_at_risk(
 
 # ==================== Investment Decision ====================
 
+# (symbol, interval) -> time regime classification last failed. A failing
+# series is skipped (decision without regimes, no warning) for
+# REGIME_FAILURE_TTL seconds instead of retrying and logging per request.
+REGIME_FAILURE_TTL = 60  # seconds
+_regime_failures = {}
+
+
+def _regime_failed_recently(symbol: str, interval: str) -> bool:
+    """Whether classification failed for symbol/interval within REGIME_FAILURE_TTL."""
+    failed_at = _regime_failures.get((symbol, interval))
+    return failed_at is not None and time.monotonic() - failed_at < REGIME_FAILURE_TTL
+
+
+def _record_regime_failure(symbol: str, interval: str, error: Exception) -> None:
+    """Remember and log a regime classification failure."""
+    _regime_failures[(symbol, interval)] = time.monotonic()
+    logger.warning(
+        "Could not classify regimes for {symbol} {interval}: {error}",
+        symbol=symbol, interval=interval, error=str(error)
+    )
+
+
+def decision_regime_model(
+    symbol: str,
+    interval: str,
+    start: datetime,
+    end: datetime
+) -> Optional[RegimeClassifierService]:
+    """
+    Regime classifier for the decision endpoint.
+    
+    Uses the shared classifier for symbol/interval; when none is available
+    it is fitted on the range plus the 60 days before it. Returns None when
+    the regimes can't be classified; the decision then goes ahead without them.
+    """
+    if _regime_failed_recently(symbol, interval):
+        return None
+    
+    try:
+        model = cached_regime_model(symbol, interval)
+        if model is not None:
+            return model
+        
+        train_df = query_and_calculate_indicators(
+            symbol, interval, start - timedelta(days=60), end
+        )
+        if len(train_df) < 100:
+            return None
+        return get_regime_model(symbol, interval, train_df)
+    except Exception as e:
+        _record_regime_failure(symbol, interval, e)
+        return None
+
+
+def decision_regime_data(
+    symbol: str,
+    interval: str,
+    model: RegimeClassifierService,
+    df: pd.DataFrame
+) -> Optional[pd.DataFrame]:
+    """Clipped regime probabilities (REGIME_PROB_COLUMNS) for each row of `df`."""
+    # Only the positional probability rows are used, so `df` goes in as is
+    # instead of being re-indexed by timestamp
+    try:
+        probabilities, _ = model.predict_proba_array(df, REGIME_TYPES)
+        return pd.DataFrame(np.clip(probabilities, 0.0, 1.0), columns=REGIME_PROB_COLUMNS)
+    except Exception as e:
+        _record_regime_failure(symbol, interval, e)
+        return None
+
+
 @router.get("/decision", 
     response_model=InvestmentDecisionResponse,
     summary="Get investment recommendation",
@@ -701,12 +1033,10 @@ async def get_investment_decision(
     
     Requires at least 50 periods of data for accurate analysis.
     """
-    from src.domain.services.investment_advisor import InvestmentAdvisorService
-    from datetime import timedelta
-    
-    # Default date range (30 days)
+    # Default date range (30 days). "Now" is floored to the bar boundary
+    # so polling requests within one bar share cached indicators
     if end is None:
-        end = datetime.now()
+        end = floor_to_interval(datetime.now(), interval.value)
     if start is None:
         start = end - timedelta(days=30)
     
@@ -714,21 +1044,20 @@ async def get_investment_decision(
     advisor = InvestmentAdvisorService()
     
     try:
-        # Query market data with SQL
-        query = f"""
-            SELECT timestamp, open, high, low, close, volume
-            FROM market_data
-            WHERE symbol = '{symbol}'
-            AND interval = '{interval.value}'
-            AND timestamp >= '{start.isoformat()}'
-            AND timestamp <= '{end.isoformat()}'
-            ORDER BY timestamp ASC
-        """
-        
-        import duckdb
-        conn = duckdb.connect(str(db_path), read_only=True)
-        df = conn.execute(query).fetchdf()
-        conn.close()
+        # Market data with indicators (cached until new data is stored) and
+        # the regime model (trained on its own query if not cached) are
+        # independent, so both run at once; too few rows for the
+        # indicators counts as insufficient data
+        indicators_task = asyncio.to_thread(
+            query_and_calculate_indicators, symbol, interval.value, start, end
+        )
+        model_task = asyncio.to_thread(
+            decision_regime_model, symbol, interval.value, start, end
+        )
+        try:
+            df, regime_model = await asyncio.gather(indicators_task, model_task)
+        except TechnicalIndicatorError:
+            df, regime_model = pd.DataFrame(), None
         
         if df.empty or len(df) < 50:
             raise HTTPException(
@@ -736,56 +1065,15 @@ async def get_investment_decision(
                 detail=f"Insufficient data for analysis (need 50+, got {len(df) if df is not None else 0})"
             )
         
-        # Calculate technical indicators
-        df = ta_service.calculate_all_indicators(df)
-        
-        # Get regime data
+        # Get regime data (None if unavailable)
         regime_df = None
-        try:
-            # Fit regime classifier if needed
-            if not regime_service.is_fitted:
-                train_query = f"""
-                    SELECT timestamp, open, high, low, close, volume
-                    FROM market_data
-                    WHERE symbol = '{symbol}'
-                    AND interval = '{interval.value}'
-                    AND timestamp >= '{(start - timedelta(days=60)).isoformat()}'
-                    AND timestamp <= '{end.isoformat()}'
-                    ORDER BY timestamp ASC
-                """
-                
-                conn = duckdb.connect(str(db_path), read_only=True)
-                train_df = conn.execute(train_query).fetchdf()
-                conn.close()
-                
-                if train_df is not None and len(train_df) >= 100:
-                    train_df = ta_service.calculate_all_indicators(train_df)
-                    regime_service.fit(train_df)
-            
-            # Predict regimes
-            if regime_service.is_fitted:
-                df_for_regime = df.copy()
-                df_for_regime = df_for_regime.set_index('timestamp')
-                proba_df = regime_service.predict_proba(df_for_regime)
-                
-                prob_cols = ['prob_bull', 'prob_bear', 'prob_neutral', 'prob_high_volatility']
-                for col in prob_cols:
-                    if col not in proba_df.columns:
-                        proba_df[col] = 0.0
-                
-                regime_df = pd.DataFrame({
-                    'timestamp': pd.to_datetime(proba_df.index).astype(str).values,
-                    'bull_prob': proba_df['prob_bull'].clip(0.0, 1.0).values,
-                    'bear_prob': proba_df['prob_bear'].clip(0.0, 1.0).values,
-                    'neutral_prob': proba_df['prob_neutral'].clip(0.0, 1.0).values,
-                    'high_volatility_prob': proba_df['prob_high_volatility'].clip(0.0, 1.0).values
-                })
-        except Exception as e:
-            print(f"Warning: Could not classify regimes: {e}")
-            # Continue without regime data
+        if regime_model is not None:
+            regime_df = await asyncio.to_thread(
+                decision_regime_data, symbol, interval.value, regime_model, df
+            )
         
         # Generate investment recommendation
-        result = advisor.analyze(df, regime_data=regime_df)
+        result = await asyncio.to_thread(advisor.analyze, df, regime_data=regime_df)
         
         # Format factors for response
         formatted_factors = {
@@ -4,43 +4,122 @@ Market Data API Routes.
 Endpoints for querying and downloading market data.
 """
 
-from datetime import datetime
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+import asyncio
+import threading
+import time
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
-from src.api.dependencies import get_market_service
+from src.api.dependencies import (
+    get_market_service,
+    get_scheduler_service,
+    get_db_cursor,
+    get_market_view,
+    get_stream_cursor
+)
 from src.api.models import (
     MarketDataResponse,
     OHLCVResponse,
     DownloadRequest,
     DownloadResponse,
-    IntervalEnum
+    JobStatus,
+    IntervalEnum,
+    INTERVAL_SECONDS,
+    INTERVAL_STR
 )
 from src.application.services.market_data_service import MarketDataService
+from src.application.services.scheduler_service import SchedulerService
 from src.shared.exceptions.custom_exceptions import DataNotFoundError, DataDownloadError
 from src.infrastructure.storage.duckdb_query_engine import DuckDBQueryEngine
-from src.shared.config.settings import Settings
-from pathlib import Path
-import pandas as pd
+from src.shared.utils.logging_utils import get_logger
+import orjson
+import pyarrow as pa
+
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _ohlcv_query(view: Optional[str], with_start: bool, with_end: bool) -> str:
+    """
+    OHLCV statement text, built once per (view, bounds) and reused.
+    
+    A pair view already filters symbol/interval; without one the
+    market_data view is filtered. The timestamp filter is only added for
+    the bounds given; LIMIT NULL means "unbounded". Params: [symbol,
+    interval], [start], [end], limit.
+    """
+    filters = [] if view else ["symbol = ?", "interval = ?"]
+    if with_start:
+        filters.append("timestamp >= ?")
+    if with_end:
+        filters.append("timestamp <= ?")
+    where = "\n        AND ".join(filters) or "TRUE"
+    source = f'"{view}"' if view else "market_data"
+    return f"""
+        SELECT timestamp, open, high, low, close, volume
+        FROM {source}
+        WHERE {where}
+        ORDER BY timestamp ASC
+        LIMIT ?
+    """
 
-router = APIRouter()
 
-# DuckDB connection for fast queries (shared, read-only)
-settings = Settings()
-db_path = Path(settings.STORAGE_PATH) / "bitcoin_market.db"
+LATEST_CANDLE_QUERY = """
+    SELECT timestamp, open, high, low, close, volume
+    FROM market_data
+    WHERE symbol = ?
+    AND interval = ?
+    ORDER BY timestamp DESC
+    LIMIT 1
+"""
+
+# Latest candle per (symbol, interval) -> (fetched_at, row or None)
+LATEST_CANDLE_TTL = 60  # seconds
+_latest_candles = {}
+_latest_candles_lock = threading.Lock()
 
-# Lazy initialization to avoid conflicts
-_db_engine = None
+# Numeric OHLCVResponse fields
+PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
 
-def get_db_engine():
-    global _db_engine
-    if _db_engine is None:
-        import duckdb
-        # Use read-only connection to avoid lock conflicts
-        _db_engine = duckdb.connect(str(db_path), read_only=True)
-    return _db_engine
+# Rows per Arrow record batch (and NDJSON chunk) sent by /stream
+STREAM_BATCH_ROWS = 1024
+
+# Encoded GET / bodies per (symbol, interval, start, end, limit)
+# -> (fresh_until, body), least recently used first
+MARKET_CACHE_SIZE = 256
+MARKET_CACHE_RECENT_TTL = 60  # seconds; window may still gain candles
+MARKET_CACHE_HISTORICAL_TTL = 6 * 3600  # seconds; window ended 2+ bars ago
+MARKET_CACHE_MAX_STALE = 600  # seconds an expired body is served while refreshing
+_market_cache = OrderedDict()
+_market_cache_lock = threading.Lock()
+_market_refreshing = set()
+_refresh_tasks = set()  # strong refs so pending refreshes are not collected
+
+
+def _ohlcv_statement(
+    symbol: str,
+    interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: Optional[int]
+) -> Tuple[str, List]:
+    """_ohlcv_query() statement and bound parameters for a query."""
+    view = get_market_view(symbol, interval)
+    # Stored timestamps are naive; bounds are compared as wall-clock time
+    params = [] if view else [symbol, interval]
+    if start:
+        params.append(start.replace(tzinfo=None))
+    if end:
+        params.append(end.replace(tzinfo=None))
+    params.append(limit or None)
+    return _ohlcv_query(view, bool(start), bool(end)), params
 
 
 def query_duckdb(
@@ -49,32 +128,151 @@ def query_duckdb(
     start: Optional[datetime],
     end: Optional[datetime],
     limit: Optional[int] = None
-) -> pd.DataFrame:
-    """Query data directly from DuckDB."""
-    query = f"""
-        SELECT timestamp, open, high, low, close, volume
-        FROM market_data
-        WHERE symbol = '{symbol}'
-        AND interval = '{interval}'
+) -> pa.Table:
     """
+    Query data directly from DuckDB.
     
-    if start:
-        query += f" AND timestamp >= '{start.isoformat()}'"
-    if end:
-        query += f" AND timestamp <= '{end.isoformat()}'"
+    Values are bound as parameters, never formatted into the SQL. Rows
+    come back as an Arrow table (timestamps already typed, no pandas
+    DataFrame in between).
+    """
+    query, params = _ohlcv_statement(symbol, interval, start, end, limit)
+    with get_db_cursor() as cursor:
+        return cursor.execute(query, params).to_arrow_table()
+
+
+def stream_ndjson(
+    symbol: str,
+    interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Query rows as NDJSON, one chunk per Arrow record batch.
     
-    query += " ORDER BY timestamp ASC"
+    A dedicated cursor (not a pooled one) is held until the generator is
+    exhausted or closed, so rows are encoded while DuckDB produces the
+    next batch and the full result is never in memory at once.
+    """
+    query, params = _ohlcv_statement(symbol, interval, start, end, limit)
+    with get_stream_cursor() as cursor:
+        reader = cursor.execute(query, params).to_arrow_reader(STREAM_BATCH_ROWS)
+        for batch in reader:
+            yield b"".join(orjson.dumps(row) + b"\n" for row in batch.to_pylist())
+
+
+def market_data_body(
+    symbol: str,
+    interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: Optional[int] = None
+) -> Optional[bytes]:
+    """
+    Encoded GET / response body (None when no rows match).
     
-    if limit:
-        query += f" LIMIT {limit}"
+    Returned pre-encoded, so FastAPI skips per-row validation against
+    MarketDataResponse; OHLCVResponse fields are non-null floats, so the
+    one check left is for NULL prices/volumes.
+    """
+    table = query_duckdb(symbol=symbol, interval=interval, start=start, end=end, limit=limit)
+    if table.num_rows == 0:
+        return None
+    if any(table.column(name).null_count for name in PRICE_COLUMNS):
+        raise ValueError(f"NULL OHLCV values for {symbol} {interval}")
+    
+    # Arrow builds the row dicts; rows are in timestamp order
+    ohlcv_data = table.to_pylist()
+    return orjson.dumps({
+        "symbol": symbol,
+        "interval": interval,
+        "data": ohlcv_data,
+        "count": len(ohlcv_data),
+        "start": ohlcv_data[0]['timestamp'],
+        "end": ohlcv_data[-1]['timestamp']
+    }, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _market_cache_ttl(interval: str, end: Optional[datetime]) -> int:
+    """Seconds a body stays fresh: long once the window can no longer change."""
+    bar = timedelta(seconds=INTERVAL_SECONDS.get(interval, 7 * 24 * 3600))
+    if end is not None and end.replace(tzinfo=None) < datetime.now() - 2 * bar:
+        return MARKET_CACHE_HISTORICAL_TTL
+    return MARKET_CACHE_RECENT_TTL
+
+
+def _store_market_body(key: tuple, body: bytes) -> None:
+    """Cache an encoded body, evicting the least recently used entries."""
+    fresh_until = time.monotonic() + _market_cache_ttl(key[1], key[3])
+    with _market_cache_lock:
+        _market_cache[key] = (fresh_until, body)
+        _market_cache.move_to_end(key)
+        while len(_market_cache) > MARKET_CACHE_SIZE:
+            _market_cache.popitem(last=False)
+
+
+async def _refresh_market_body(key: tuple) -> None:
+    """Re-query a stale entry; on failure the stale body is left to expire."""
+    try:
+        body = await asyncio.to_thread(market_data_body, *key)
+        if body is None:
+            with _market_cache_lock:
+                _market_cache.pop(key, None)
+        else:
+            _store_market_body(key, body)
+    except Exception as e:
+        logger.warning("Market data refresh failed for {key}: {error}", key=key, error=str(e))
+    finally:
+        with _market_cache_lock:
+            _market_refreshing.discard(key)
+
+
+def _schedule_refresh(key: tuple) -> None:
+    """Start one background refresh per stale key."""
+    with _market_cache_lock:
+        if key in _market_refreshing:
+            return
+        _market_refreshing.add(key)
+    task = asyncio.create_task(_refresh_market_body(key))
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+async def cached_market_data_body(
+    symbol: str,
+    interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: Optional[int] = None
+) -> Optional[bytes]:
+    """
+    market_data_body() behind a stale-while-revalidate cache.
     
-    conn = get_db_engine()
-    df = conn.execute(query).fetchdf()
+    Fresh entries are returned as is. An entry up to MARKET_CACHE_MAX_STALE
+    seconds past its TTL is still returned while a background task
+    re-queries it; anything older is queried before responding. Empty
+    results and errors are not cached.
+    """
+    key = (symbol, interval, start, end, limit)
+    with _market_cache_lock:
+        entry = _market_cache.get(key)
+        if entry is not None:
+            _market_cache.move_to_end(key)
     
-    if not df.empty and 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+    if entry is not None:
+        fresh_until, body = entry
+        now = time.monotonic()
+        if now < fresh_until:
+            return body
+        if now < fresh_until + MARKET_CACHE_MAX_STALE:
+            _schedule_refresh(key)
+            return body
     
-    return df
+    body = await asyncio.to_thread(market_data_body, *key)
+    if body is not None:
+        _store_market_body(key, body)
+    return body
 
 
 @router.get(
@@ -110,49 +308,83 @@ async def get_market_data(
     ```
     """
     try:
-        # Query directly from DuckDB for fast access
-        df = query_duckdb(
+        # Served from the response cache; DuckDB is queried on a miss
+        body = await cached_market_data_body(
             symbol=symbol,
-            interval=interval.value,
+            interval=INTERVAL_STR[interval],
             start=start,
             end=end,
             limit=limit
         )
         
-        if df.empty:
+        if body is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No data found for {symbol} with given filters"
             )
         
-        # Convert DataFrame to response - use timestamp column, not index
-        ohlcv_data = [
-            OHLCVResponse(
-                timestamp=row.timestamp,
-                open=row.open,
-                high=row.high,
-                low=row.low,
-                close=row.close,
-                volume=row.volume
-            )
-            for row in df.itertuples()
-        ]
-        
-        return MarketDataResponse(
-            symbol=symbol,
-            interval=interval.value,
-            data=ohlcv_data,
-            count=len(ohlcv_data),
-            start=df['timestamp'].min() if not df.empty else None,
-            end=df['timestamp'].max() if not df.empty else None
-        )
+        return Response(content=body, media_type="application/json")
         
+    except HTTPException:
+        raise
     except DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
 
 
+def latest_candle(symbol: str, interval: str) -> Optional[dict]:
+    """
+    Most recent candle for symbol/interval (None if there is none).
+    
+    DuckDB reads only the newest rows for the descending LIMIT 1; the row
+    is cached for LATEST_CANDLE_TTL seconds.
+    """
+    key = (symbol, interval)
+    now = time.monotonic()
+    with _latest_candles_lock:
+        cached = _latest_candles.get(key)
+        if cached is not None and now - cached[0] < LATEST_CANDLE_TTL:
+            return cached[1]
+    
+    with get_db_cursor() as cursor:
+        rows = cursor.execute(LATEST_CANDLE_QUERY, [symbol, interval]).to_arrow_table().to_pylist()
+    row = rows[0] if rows else None
+    
+    with _latest_candles_lock:
+        _latest_candles[key] = (now, row)
+    return row
+
+
+@router.get(
+    "/stream",
+    summary="Stream market data",
+    description="Stream historical OHLCV data as newline-delimited JSON"
+)
+async def stream_market_data(
+    symbol: str = Query(default="BTCUSDT", description="Trading pair"),
+    start: Optional[datetime] = Query(default=None, description="Start datetime"),
+    end: Optional[datetime] = Query(default=None, description="End datetime"),
+    interval: IntervalEnum = Query(default=IntervalEnum.ONE_HOUR, description="Timeframe"),
+    limit: Optional[int] = Query(default=None, ge=1, description="Max rows")
+):
+    """
+    Stream historical market data.
+    
+    Same filters as `GET /market-data/`, without the row cap. Each line is
+    one candle object; no matching rows gives an empty body.
+    
+    ## Example
+    ```
+    GET /api/v1/market-data/stream?symbol=BTCUSDT&start=2024-01-01&interval=1h
+    ```
+    """
+    return StreamingResponse(
+        stream_ndjson(symbol, INTERVAL_STR[interval], start, end, limit),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get(
     "/latest",
     response_model=OHLCVResponse,
@@ -161,8 +393,7 @@ async def get_market_data(
 )
 async def get_latest_candle(
     symbol: str = Query(default="BTCUSDT", description="Trading pair"),
-    interval: IntervalEnum = Query(default=IntervalEnum.ONE_HOUR, description="Timeframe"),
-    market_service: MarketDataService = Depends(get_market_service)
+    interval: IntervalEnum = Query(default=IntervalEnum.ONE_HOUR, description="Timeframe")
 ):
     """
     Get the latest candle for a symbol.
@@ -175,31 +406,18 @@ async def get_latest_candle(
     The most recent OHLCV candle.
     """
     try:
-        # Query all data and get the last row
-        df = market_service.get_data_as_dataframe(
-            symbol=symbol,
-            interval=interval.value,
-            start=datetime(2020, 1, 1),  # Far past
-            end=datetime.now()
-        )
+        row = await asyncio.to_thread(latest_candle, symbol, INTERVAL_STR[interval])
         
-        if df.empty:
+        if row is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No data found for {symbol}"
             )
         
-        row = df.iloc[0]
-        
-        return OHLCVResponse(
-            timestamp=df.index[0],
-            open=row["open"],
-            high=row["high"],
-            low=row["low"],
-            close=row["close"],
-            volume=row["volume"]
-        )
+        return OHLCVResponse(**row)
         
+    except HTTPException:
+        raise
     except DataNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -209,17 +427,21 @@ async def get_latest_candle(
 @router.post(
     "/download",
     response_model=DownloadResponse,
+    status_code=202,
     summary="Download historical data",
-    description="Download and store historical data from Binance"
+    description="Download and store historical data from Binance in the background"
 )
 async def download_historical_data(
     request: DownloadRequest,
-    market_service: MarketDataService = Depends(get_market_service)
+    market_service: MarketDataService = Depends(get_market_service),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Download historical data from Binance.
     
     This fetches data from Binance API and stores it in the local repository.
+    The download runs as a background job; poll /download/{job_id} for its
+    status and, once completed, the number of rows added.
     
     ## Request Body
     ```json
@@ -232,31 +454,56 @@ async def download_historical_data(
     ```
     
     ## Returns
-    Download confirmation with row count.
+    Download confirmation with the job ID.
     """
     try:
-        rows_added = market_service.download_historical_data(
+        job_id = scheduler_service.submit_job(
+            "download",
+            market_service.download_historical_data,
             symbol=request.symbol,
             start=request.start,
             end=request.end,
-            interval=request.interval.value
+            interval=INTERVAL_STR[request.interval]
         )
         
         return DownloadResponse(
             symbol=request.symbol,
-            interval=request.interval.value,
-            rows_added=rows_added,
+            interval=INTERVAL_STR[request.interval],
+            rows_added=0,
             start=request.start,
             end=request.end,
-            message=f"Successfully downloaded {rows_added} candles"
+            message=f"Download queued as job {job_id}",
+            job_id=job_id
         )
         
-    except DataDownloadError as e:
-        raise HTTPException(status_code=502, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Download failed: {str(e)}")
 
 
+@router.get(
+    "/download/{job_id}",
+    response_model=JobStatus,
+    summary="Get download status",
+    description="Get the status of a background download"
+)
+async def get_download_status(
+    job_id: str = Path(..., description="Job ID returned by POST /download"),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
+):
+    """
+    Get background download status.
+    
+    ## Returns
+    Job status; once completed, metadata["result"] is the number of rows
+    added (metadata["error"] holds the message if it failed).
+    """
+    job = scheduler_service.get_submitted_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    return JobStatus(**asdict(job))
+
+
 @router.post(
     "/update",
     response_model=DownloadResponse,
@@ -283,9 +530,10 @@ async def update_latest_data(
     Update confirmation with row count.
     """
     try:
-        result = market_service.update_latest_data(
+        result = await asyncio.to_thread(
+            market_service.update_latest_data,
             symbol=symbol,
-            interval=interval.value,
+            interval=INTERVAL_STR[interval],
             limit=limit
         )
         
@@ -293,7 +541,7 @@ async def update_latest_data(
         
         return DownloadResponse(
             symbol=symbol,
-            interval=interval.value,
+            interval=INTERVAL_STR[interval],
             rows_added=rows,
             start=datetime.now(),
             end=datetime.now(),
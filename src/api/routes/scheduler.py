@@ -4,9 +4,14 @@ Scheduler API Routes.
 Endpoints for managing scheduler and triggering pipelines.
 """
 
-from typing import Dict, Any
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Any, List
+import asyncio
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from src.api.dependencies import get_scheduler_service, get_orchestrator
 from src.api.models import (
@@ -17,7 +22,9 @@ from src.api.models import (
 from src.application.services.scheduler_service import SchedulerService
 from src.application.services.pipeline_orchestrator import PipelineOrchestrator
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+JOB_STATUS_LIST = TypeAdapter(List[JobStatus])
 
 
 # ============================================================================
@@ -45,15 +52,10 @@ async def get_scheduler_status(
     try:
         status = scheduler_service.get_scheduler_status()
         
-        jobs = [
-            JobStatus(
-                job_id=job["job_id"],
-                name=job["name"],
-                next_run=job.get("next_run"),
-                trigger=job.get("trigger", "unknown")
-            )
-            for job in status.get("jobs", [])
-        ]
+        # One validation call for the whole list, reading ScheduledJob attributes
+        jobs = JOB_STATUS_LIST.validate_python(
+            scheduler_service.list_jobs(), from_attributes=True
+        )
         
         return SchedulerStatusResponse(
             running=status.get("running", False),
@@ -188,7 +190,9 @@ async def run_incremental_update(
     Pipeline execution result with metrics.
     """
     try:
-        result = orchestrator.run_incremental_update(
+        # Pipelines block for their full run, so they run in a worker thread
+        result = await asyncio.to_thread(
+            orchestrator.run_incremental_update,
             symbol=symbol,
             interval=interval,
             limit=limit
@@ -202,21 +206,24 @@ async def run_incremental_update(
 
 @router.post(
     "/pipeline/backfill",
-    response_model=PipelineResultResponse,
+    status_code=202,
     summary="Run historical backfill",
-    description="Run historical data backfill pipeline"
+    description="Start the historical data backfill pipeline in the background"
 )
 async def run_historical_backfill(
     symbol: str = Query(default="BTCUSDT"),
     start: str = Query(..., description="Start date (YYYY-MM-DD)"),
     end: str = Query(..., description="End date (YYYY-MM-DD)"),
     interval: str = Query(default="1h"),
-    orchestrator: PipelineOrchestrator = Depends(get_orchestrator)
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Run historical backfill pipeline.
     
-    Downloads historical data for a date range.
+    Downloads historical data for a date range. The pipeline can run for
+    a long time, so it is submitted as a background job and the response
+    only carries its ID.
     
     ## Parameters
     - **symbol**: Trading pair
@@ -225,22 +232,23 @@ async def run_historical_backfill(
     - **interval**: Timeframe
     
     ## Returns
-    Pipeline execution result with metrics.
+    Job ID and the URL to poll for its status.
     """
     try:
         # Parse dates
-        from datetime import datetime
         start_dt = datetime.fromisoformat(start)
         end_dt = datetime.fromisoformat(end)
         
-        result = orchestrator.run_historical_backfill(
+        job_id = scheduler_service.submit_job(
+            "historical_backfill",
+            orchestrator.run_backfill,
             symbol=symbol,
             start=start_dt,
             end=end_dt,
             interval=interval
         )
         
-        return _format_pipeline_result(result, "historical_backfill")
+        return _job_accepted(job_id)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid date format: {str(e)}")
@@ -250,55 +258,73 @@ async def run_historical_backfill(
 
 @router.post(
     "/pipeline/retrain",
-    response_model=PipelineResultResponse,
+    status_code=202,
     summary="Run model retraining",
-    description="Run regime classifier retraining pipeline"
+    description="Start retraining the regime classifier on the most recent days of data in the background"
 )
 async def run_model_retraining(
     symbol: str = Query(default="BTCUSDT"),
-    start: str = Query(..., description="Training start date (YYYY-MM-DD)"),
-    end: str = Query(..., description="Training end date (YYYY-MM-DD)"),
+    training_days: int = Query(default=365, ge=1, description="Days of data up to now to train on"),
     interval: str = Query(default="1h"),
-    n_states: int = Query(default=4, ge=2, le=10),
-    orchestrator: PipelineOrchestrator = Depends(get_orchestrator)
+    orchestrator: PipelineOrchestrator = Depends(get_orchestrator),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Run model retraining pipeline.
     
-    Retrains the regime classifier on specified date range.
+    Retrains the regime classifier on the last `training_days` days of
+    stored data (a window ending now) as a background job.
     
     ## Parameters
     - **symbol**: Trading pair
-    - **start**: Training start date (YYYY-MM-DD)
-    - **end**: Training end date (YYYY-MM-DD)
+    - **training_days**: Days of data up to now to train on (at least 1)
     - **interval**: Timeframe
-    - **n_states**: Number of HMM states (2-10)
     
     ## Returns
-    Pipeline execution result with model metrics.
+    Job ID and the URL to poll for its status.
     """
     try:
-        # Parse dates
-        from datetime import datetime
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
-        
-        result = orchestrator.run_model_retraining(
+        job_id = scheduler_service.submit_job(
+            "model_retraining",
+            orchestrator.run_retraining_pipeline,
             symbol=symbol,
-            start=start_dt,
-            end=end_dt,
-            interval=interval,
-            n_states=n_states
+            training_days=training_days,
+            interval=interval
         )
         
-        return _format_pipeline_result(result, "model_retraining")
+        return _job_accepted(job_id)
         
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid date format: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Pipeline failed: {str(e)}")
 
 
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobStatus,
+    summary="Get pipeline job status",
+    description="Get the status and result of a background pipeline job"
+)
+async def get_pipeline_job(
+    job_id: str = Path(..., description="Job ID returned when the pipeline was started"),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
+):
+    """
+    Get background pipeline job status.
+    
+    ## Parameters
+    - **job_id**: The ID returned by /pipeline/backfill or /pipeline/retrain
+    
+    ## Returns
+    Job status; once completed, metadata holds the pipeline result
+    (or the error if it failed).
+    """
+    job = scheduler_service.get_submitted_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    
+    return JobStatus(**asdict(job))
+
+
 @router.post(
     "/pipeline/full-update",
     response_model=PipelineResultResponse,
@@ -329,7 +355,8 @@ async def run_full_update(
     Pipeline execution result with all metrics.
     """
     try:
-        result = orchestrator.run_full_update_pipeline(
+        result = await asyncio.to_thread(
+            orchestrator.run_full_update_pipeline,
             symbol=symbol,
             interval=interval,
             limit=limit
@@ -345,6 +372,14 @@ async def run_full_update(
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _job_accepted(job_id: str) -> Dict[str, str]:
+    """Response body for a submitted background pipeline."""
+    return {
+        "job_id": job_id,
+        "status_url": f"/api/v1/scheduler/jobs/{job_id}"
+    }
+
+
 def _format_pipeline_result(result: Dict[str, Any], pipeline_type: str) -> PipelineResultResponse:
     """Format pipeline result into response model."""
     return PipelineResultResponse(
@@ -0,0 +1,168 @@
+"""
+Composite Signal Scoring
+Factor tables and score kernel for the comprehensive signals endpoint.
+
+Signal strings are translated to small integer codes once at the API
+boundary (encode_signals); score() then sums table weights. The kernel is
+compiled with Numba when it is installed, otherwise it runs as plain
+Python. score_batch() scores many symbols in one call.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def _factor(name: str, signal: str, weight: int) -> dict:
+    """Factor entry as reported in the 'factors' list"""
+    return {"name": name, "signal": signal, "weight": weight}
+
+
+# Factor tables are indexed by signal code; each factor's weight is its
+# score contribution. The dicts are shared across responses and must not
+# be mutated.
+
+# Regime (30% weight): code 0 = Sideways, 1 = Bull, 2 = Bear;
+# second index is probability > 0.7
+REGIME_CODES = {'Bull': 1, 'Bear': 2}
+REGIME_FACTORS = (
+    (_factor("Regime", "Sideways", 0), _factor("Regime", "Sideways", 0)),
+    (_factor("Regime", "Bull (Medium Confidence)", 15), _factor("Regime", "Bull (High Confidence)", 30)),
+    (_factor("Regime", "Bear (Medium Confidence)", -15), _factor("Regime", "Bear (High Confidence)", -30)),
+)
+
+# KAMA (30% weight): crossover takes precedence over trend; both indexed
+# by direction + 1 (-1 -> 0, none -> 1, +1 -> 2) as (factor, signal)
+KAMA_CROSS_FACTORS = (
+    (_factor("KAMA", "Death Cross", -30), "SELL"),
+    None,
+    (_factor("KAMA", "Golden Cross", 30), "BUY"),
+)
+KAMA_TREND_FACTORS = (
+    (_factor("KAMA", "Bearish Trend", -15), "BEARISH"),
+    (_factor("KAMA", "Neutral", 0), "NEUTRAL"),
+    (_factor("KAMA", "Bullish Trend", 15), "BULLISH"),
+)
+
+# Funding rate (20% weight): code 0 = unknown signal, adds no factor
+FUNDING_CODES = {'EXTREME_SHORT': 1, 'EXTREME_LONG': 2, 'NEUTRAL': 3}
+FUNDING_FACTORS = (
+    None,
+    _factor("Funding", "Extreme Short (Squeeze Risk)", 20),
+    _factor("Funding", "Extreme Long (Squeeze Risk)", -20),
+    _factor("Funding", "Neutral (Healthy)", 5),
+)
+
+# Market cap / MVRV (20% weight): code 0 = Fair Value
+MVRV_CODES = {'ACCUMULATION': 1, 'OVERVALUED': 2}
+MVRV_FACTORS = (
+    _factor("Market Cap", "Fair Value", 0),
+    _factor("Market Cap", "Accumulation Zone", 20),
+    _factor("Market Cap", "Overvalued", -10),
+)
+
+
+def _weights(factors) -> np.ndarray:
+    """Weight array for a factor table (missing factors weigh 0)"""
+    return np.array([
+        0 if f is None else (f[0] if isinstance(f, tuple) else f)['weight']
+        for f in factors
+    ], dtype=np.int32)
+
+
+REGIME_WEIGHTS = np.array([_weights(row) for row in REGIME_FACTORS])
+KAMA_CROSS_WEIGHTS = _weights(KAMA_CROSS_FACTORS)
+KAMA_TREND_WEIGHTS = _weights(KAMA_TREND_FACTORS)
+FUNDING_WEIGHTS = _weights(FUNDING_FACTORS)
+MVRV_WEIGHTS = _weights(MVRV_FACTORS)
+
+# Column order of the code rows passed to score_batch()
+CODE_FIELDS = ('regime', 'regime_high', 'kama_cross', 'kama_trend', 'funding', 'mvrv')
+
+
+def _direction(value) -> int:
+    """-1 / 0 / +1 for a crossover or trend flag (NaN and other values -> 0)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return 0
+    return int(value) if value in (1, -1) else 0
+
+
+def encode_signals(regime: str, probability: float, kama_cross, kama_trend,
+                   funding_signal: str, mvrv_signal: str) -> tuple:
+    """
+    Translate signal values to the integer codes used by score().
+
+    Returns:
+        Tuple in CODE_FIELDS order
+    """
+    return (
+        REGIME_CODES.get(regime, 0),
+        int(probability > 0.7),
+        _direction(kama_cross),
+        _direction(kama_trend),
+        FUNDING_CODES.get(funding_signal, 0),
+        MVRV_CODES.get(mvrv_signal, 0),
+    )
+
+
+def factors_for(codes: tuple):
+    """
+    Factor entries and KAMA signal label for encoded signals.
+
+    Returns:
+        Tuple of (factors list, kama_signal)
+    """
+    regime, regime_high, kama_cross, kama_trend, funding, mvrv = codes
+    kama_factor, kama_signal = (
+        KAMA_CROSS_FACTORS[kama_cross + 1] or KAMA_TREND_FACTORS[kama_trend + 1]
+    )
+    # One slot per factor category, built in a single list display;
+    # unknown funding leaves an empty slot that is dropped
+    factors = [
+        REGIME_FACTORS[regime][regime_high],
+        kama_factor,
+        FUNDING_FACTORS[funding],
+        MVRV_FACTORS[mvrv],
+    ]
+    if funding == 0:
+        del factors[2]
+    return factors, kama_signal
+
+
+@njit(cache=True)
+def score(regime, regime_high, kama_cross, kama_trend, funding, mvrv):
+    """Composite score for one set of signal codes (see encode_signals)."""
+    total = REGIME_WEIGHTS[regime, regime_high]
+    if kama_cross != 0:
+        total += KAMA_CROSS_WEIGHTS[kama_cross + 1]
+    else:
+        total += KAMA_TREND_WEIGHTS[kama_trend + 1]
+    total += FUNDING_WEIGHTS[funding]
+    total += MVRV_WEIGHTS[mvrv]
+    return total
+
+
+@njit(cache=True)
+def score_batch(codes):
+    """
+    Composite scores for many symbols.
+
+    Args:
+        codes: int array of shape (n, len(CODE_FIELDS))
+
+    Returns:
+        int32 array of n scores
+    """
+    n = codes.shape[0]
+    out = np.empty(n, dtype=np.int32)
+    for i in range(n):
+        out[i] = score(codes[i, 0], codes[i, 1], codes[i, 2],
+                       codes[i, 3], codes[i, 4], codes[i, 5])
+    return out
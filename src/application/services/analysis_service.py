@@ -13,6 +13,7 @@ Responsibilities:
 This service orchestrates domain services.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import pandas as pd
@@ -26,6 +27,27 @@ from src.shared.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Metrics analyze_risk_metric() can compute on their own
+RISK_METRICS = ('max_drawdown', 'volatility', 'sharpe_ratio', 'var')
+
+# Threads for the independent passes of analyze_full_report()
+ANALYSIS_WORKERS = 3
+
+# Report key -> indicator column for _get_latest_indicators()
+LATEST_INDICATORS = {
+    "rsi": "rsi",
+    "macd": "macd",
+    "macd_signal": "macd_signal",
+    "macd_histogram": "macd_histogram",
+    "bb_upper": "bb_upper",
+    "bb_middle": "bb_middle",
+    "bb_lower": "bb_lower",
+    "bb_width": "bb_bandwidth",
+    "atr": "atr",
+    "sma_20": "sma_20",
+    "ema_20": "ema_20",
+}
+
 
 class AnalysisService:
     """
@@ -58,6 +80,11 @@ class AnalysisService:
         self.risk_service = risk_service or RiskCalculatorService()
         self.regime_service = regime_service or RegimeClassifierService()
         
+        self._executor = ThreadPoolExecutor(
+            max_workers=ANALYSIS_WORKERS,
+            thread_name_prefix="analysis"
+        )
+        
         logger.info("✅ Analysis Service initialized")
     
     def analyze_full_report(
@@ -112,28 +139,29 @@ class AnalysisService:
                 "error": "No data available"
             }
         
-        # Calculate technical indicators
-        df_with_indicators = self.ta_service.calculate_all_indicators(df)
-        
-        # Calculate risk metrics
-        risk_metrics = self.risk_service.calculate_all_metrics(df['close'])
-        
-        # Classify regime
-        regime_features = self.ta_service.extract_features_for_regime_classification(
-            df_with_indicators
+        # Indicators, risk metrics and regime features each only read the
+        # OHLCV frame, so the three passes run concurrently
+        indicators_future = self._executor.submit(
+            self.ta_service.calculate_all_indicators, df
+        )
+        risk_future = self._executor.submit(
+            self.risk_service.calculate_all_metrics, df['close']
         )
+        features_future = self._executor.submit(
+            self.ta_service.extract_features_for_regime_classification, df
+        )
+        df_with_indicators = indicators_future.result()
+        risk_metrics = risk_future.result()
+        regime_features = features_future.result()
         
-        # Train regime classifier if not fitted
-        if not hasattr(self.regime_service, 'is_fitted') or not self.regime_service.is_fitted:
-            logger.info("🔧 Training regime classifier...")
-            self.regime_service.fit(regime_features)
+        self._ensure_fitted(regime_features)
         
-        # Classify current regime
-        current_regime = self.regime_service.classify_latest(regime_features)
-        regime_probs = self.regime_service.predict_proba(regime_features)
+        # One classification pass: each MarketRegime carries its
+        # probabilities, and the latest one is the current regime
+        regime_history = self.regime_service.classify(regime_features)
+        current_regime = regime_history[-1]
         
         # Detect regime transitions
-        regime_history = self.regime_service.classify(regime_features)
         transitions = self.regime_service.detect_transitions(regime_history)
         
         report = {
@@ -264,6 +292,54 @@ class AnalysisService:
         
         return risk_metrics
     
+    def analyze_risk_metric(
+        self,
+        symbol: str,
+        interval: str,
+        start: datetime,
+        end: datetime,
+        metric: str,
+        confidence_level: float = 0.95
+    ) -> Optional[float]:
+        """
+        Calculate a single risk metric.
+        
+        Computes only the requested value instead of every metric of
+        analyze_risk(); values match the corresponding RiskMetrics field.
+        
+        Args:
+            symbol: Trading pair
+            interval: Time interval
+            start: Start datetime
+            end: End datetime
+            metric: One of RISK_METRICS
+            confidence_level: Confidence level for 'var'
+            
+        Returns:
+            Metric value, or None if no data is available
+        """
+        if metric not in RISK_METRICS:
+            raise ValueError(f"Unknown risk metric: {metric}")
+        
+        df = self.market_data_service.get_data_as_dataframe(
+            symbol, interval, start, end
+        )
+        
+        if df.empty:
+            logger.warning("⚠️ No data available")
+            return None
+        
+        prices = df['close']
+        if metric == 'max_drawdown':
+            return self.risk_service.calculate_max_drawdown(prices)
+        
+        returns = prices.pct_change().dropna()
+        if metric == 'volatility':
+            return self.risk_service.calculate_volatility(returns)
+        if metric == 'sharpe_ratio':
+            return self.risk_service.calculate_sharpe_ratio(returns)
+        return self.risk_service.calculate_var(returns, confidence_level=confidence_level)
+    
     def classify_regimes(
         self,
         symbol: str,
@@ -301,47 +377,7 @@ class AnalysisService:
         # Extract features
         features = self.ta_service.extract_features_for_regime_classification(df)
         
-        # Train or use existing model
-        if retrain or not hasattr(self.regime_service, 'is_fitted') or not self.regime_service.is_fitted:
-            logger.info("🔧 Training regime classifier...")
-            self.regime_service.fit(features)
-        
-        # Classify all periods
-        regimes = self.regime_service.classify(features)
-        probabilities = self.regime_service.predict_proba(features)
-        
-        # Get current regime
-        current_regime = regimes[-1]
-        current_probs = probabilities[-1]
-        
-        # Detect transitions
-        transitions = self.regime_service.detect_transitions(regimes)
-        
-        result = {
-            "symbol": symbol,
-            "interval": interval,
-            "current_regime": int(current_regime),
-            "current_regime_name": self._get_regime_name(current_regime),
-            "regime_probabilities": {
-                f"regime_{i}": float(prob)
-                for i, prob in enumerate(current_probs)
-            },
-            "regime_history": [int(r) for r in regimes],
-            "num_transitions": len(transitions),
-            "transitions": transitions,
-            "regime_distribution": {
-                f"regime_{i}": int((regimes == i).sum())
-                for i in range(4)
-            }
-        }
-        
-        logger.info(
-            "✅ Regime classification complete",
-            current_regime=current_regime,
-            num_transitions=len(transitions)
-        )
-        
-        return result
+        return self._classify_features(symbol, interval, features, retrain)
     
     def get_regime_stats(
         self,
@@ -362,23 +398,21 @@ class AnalysisService:
         Returns:
             DataFrame with regime statistics
         """
-        # Get regimes
-        regime_info = self.classify_regimes(symbol, interval, start, end)
+        # Indicators and features are computed once and shared with the
+        # classification (classify_regimes() would fetch them itself)
+        df = self.analyze_technical(symbol, interval, start, end)
         
-        if not regime_info:
+        if df.empty:
             return pd.DataFrame()
         
-        # Get price data
-        df = self.market_data_service.get_data_as_dataframe(
-            symbol, interval, start, end
-        )
+        features = self.ta_service.extract_features_for_regime_classification(df)
+        regime_info = self._classify_features(symbol, interval, features)
         
-        # Add regimes to dataframe
+        # Returns over the full series, kept for the classified (warmed-up) rows
+        df = df[["close", "volume"]].assign(returns=df["close"].pct_change())
+        df = df.loc[features.index]
         df["regime"] = regime_info["regime_history"]
         
-        # Calculate returns
-        df["returns"] = df["close"].pct_change()
-        
         # Group by regime and calculate stats
         stats = df.groupby("regime").agg({
             "close": ["count", "mean"],
@@ -401,39 +435,66 @@ class AnalysisService:
     
     # ==================== Helper Methods ====================
     
-    def _get_latest_indicators(self, df: pd.DataFrame) -> Dict[str, float]:
-        """Extract latest values of all indicators."""
-        latest = df.iloc[-1]
-        
-        indicators = {}
+    def _ensure_fitted(self, features: pd.DataFrame, retrain: bool = False) -> None:
+        """Train the regime classifier unless it is fitted already."""
+        if retrain or not self.regime_service.is_fitted:
+            logger.info("🔧 Training regime classifier...")
+            self.regime_service.fit(features)
+    
+    def _classify_features(
+        self,
+        symbol: str,
+        interval: str,
+        features: pd.DataFrame,
+        retrain: bool = False
+    ) -> Dict[str, Any]:
+        """Regime info for extracted features (see classify_regimes)."""
+        self._ensure_fitted(features, retrain)
         
-        # Price-based
-        if "rsi" in df.columns:
-            indicators["rsi"] = float(latest["rsi"])
+        # Classify all periods
+        regimes = self.regime_service.classify(features)
+        probabilities = self.regime_service.predict_proba(features)
         
-        # MACD
-        if "macd" in df.columns:
-            indicators["macd"] = float(latest["macd"])
-            indicators["macd_signal"] = float(latest["macd_signal"])
-            indicators["macd_histogram"] = float(latest["macd_histogram"])
+        # Get current regime
+        current_regime = regimes[-1]
+        current_probs = probabilities[-1]
         
-        # Bollinger Bands
-        if "bb_upper" in df.columns:
-            indicators["bb_upper"] = float(latest["bb_upper"])
-            indicators["bb_middle"] = float(latest["bb_middle"])
-            indicators["bb_lower"] = float(latest["bb_lower"])
-            indicators["bb_width"] = float(latest["bb_bandwidth"])
+        # Detect transitions
+        transitions = self.regime_service.detect_transitions(regimes)
         
-        # ATR
-        if "atr" in df.columns:
-            indicators["atr"] = float(latest["atr"])
+        result = {
+            "symbol": symbol,
+            "interval": interval,
+            "current_regime": int(current_regime),
+            "current_regime_name": self._get_regime_name(current_regime),
+            "regime_probabilities": {
+                f"regime_{i}": float(prob)
+                for i, prob in enumerate(current_probs)
+            },
+            "regime_history": [int(r) for r in regimes],
+            "num_transitions": len(transitions),
+            "transitions": transitions,
+            "regime_distribution": {
+                f"regime_{i}": int((regimes == i).sum())
+                for i in range(4)
+            }
+        }
         
-        # Moving Averages
-        if "sma_20" in df.columns:
-            indicators["sma_20"] = float(latest["sma_20"])
-            indicators["ema_20"] = float(latest["ema_20"])
+        logger.info(
+            "✅ Regime classification complete",
+            current_regime=current_regime,
+            num_transitions=len(transitions)
+        )
         
-        return indicators
+        return result
+    
+    def _get_latest_indicators(self, df: pd.DataFrame) -> Dict[str, float]:
+        """Extract latest values of all indicators."""
+        return {
+            name: float(df[column].to_numpy()[-1])
+            for name, column in LATEST_INDICATORS.items()
+            if column in df.columns
+        }
     
     def _get_regime_name(self, regime: int) -> str:
         """Get human-readable regime name."""
@@ -13,8 +13,13 @@ Responsibilities:
 This is the bridge between domain logic and infrastructure.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Optional
+import threading
+import time
+import numpy as np
 import pandas as pd
 
 from src.domain.models.market_data import MarketData
@@ -29,6 +34,15 @@ from src.shared.utils.datetime_utils import to_utc
 
 logger = get_logger(__name__)
 
+# DataFrame columns, in MarketData attribute names
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+# get_data_as_dataframe() results kept per (symbol, interval, start, end);
+# writes through this service clear them, the TTL bounds staleness from
+# writers outside it
+FRAME_CACHE_SIZE = 8
+FRAME_CACHE_TTL = 300  # seconds
+
 
 class MarketDataService:
     """
@@ -56,6 +70,10 @@ class MarketDataService:
         self.repository = repository
         self.binance_client = binance_client or BinanceDataClient()
         
+        # (symbol, interval, start, end) -> (fetched_at, DataFrame), LRU order
+        self._frame_cache = OrderedDict()
+        self._frame_cache_lock = threading.Lock()
+        
         logger.info("✅ Market Data Service initialized")
     
     def download_historical_data(
@@ -126,6 +144,7 @@ class MarketDataService:
             
             # Save to repository
             count = self.repository.save(market_data_list)
+            self.clear_cache()
             
             logger.info(
                 "✅ Historical download complete",
@@ -216,6 +235,7 @@ class MarketDataService:
             # Convert and save
             market_data_list = self._dataframe_to_domain(df, symbol, interval)
             count = self.repository.save(market_data_list)
+            self.clear_cache()
             
             logger.info(
                 "✅ Update complete",
@@ -306,6 +326,9 @@ class MarketDataService:
         """
         Get market data as DataFrame (convenient for analysis).
         
+        Recent results are cached (see FRAME_CACHE_TTL), so the analyze_*
+        calls of one report share a single repository read.
+        
         Args:
             symbol: Trading pair
             interval: Time interval
@@ -315,14 +338,28 @@ class MarketDataService:
         Returns:
             DataFrame with OHLCV data
         """
-        data = self.get_data(symbol, interval, start, end)
-        
-        if not data:
-            return pd.DataFrame(columns=[
-                "timestamp", "open", "high", "low", "close", "volume"
-            ])
-        
-        return self._domain_to_dataframe(data)
+        key = (symbol, interval, start, end)
+        with self._frame_cache_lock:
+            entry = self._frame_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < FRAME_CACHE_TTL:
+                self._frame_cache.move_to_end(key)
+                # Shallow copy: callers may add columns without touching the cache
+                return entry[1].copy(deep=False)
+        
+        df = self._domain_to_dataframe(self.get_data(symbol, interval, start, end))
+        
+        with self._frame_cache_lock:
+            self._frame_cache[key] = (time.monotonic(), df)
+            self._frame_cache.move_to_end(key)
+            while len(self._frame_cache) > FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        
+        return df.copy(deep=False)
+    
+    def clear_cache(self) -> None:
+        """Drop cached get_data_as_dataframe() results."""
+        with self._frame_cache_lock:
+            self._frame_cache.clear()
     
     def delete_old_data(
         self,
@@ -351,6 +388,7 @@ class MarketDataService:
             cutoff=cutoff.isoformat()
         )
         
+        self.clear_cache()
         count = self.repository.delete_by_date_range(
             symbol, interval, start, cutoff
         )
@@ -409,38 +447,43 @@ class MarketDataService:
         interval: str
     ) -> List[MarketData]:
         """Convert DataFrame to domain objects."""
-        market_data_list = []
+        # Columns are pulled out once (floats as Python floats) and zipped
+        # row-wise, instead of building a Series per row with iterrows()
+        timestamps = df["timestamp"].tolist()
+        opens, highs, lows, closes, volumes = (
+            df[column].to_numpy(dtype=np.float64).tolist()
+            for column in OHLCV_COLUMNS[1:]
+        )
         
-        for _, row in df.iterrows():
-            market_data = MarketData(
+        return [
+            MarketData(
                 symbol=symbol,
                 interval=interval,
-                timestamp=row["timestamp"],
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-                volume=float(row["volume"])
+                timestamp=timestamp,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume
             )
-            market_data_list.append(market_data)
-        
-        return market_data_list
+            for timestamp, open_, high, low, close, volume
+            in zip(timestamps, opens, highs, lows, closes, volumes)
+        ]
     
     def _domain_to_dataframe(
         self,
         data: List[MarketData]
     ) -> pd.DataFrame:
         """Convert domain objects to DataFrame."""
-        records = []
-        
-        for md in data:
-            records.append({
-                "timestamp": md.timestamp,
-                "open": md.open,
-                "high": md.high,
-                "low": md.low,
-                "close": md.close,
-                "volume": md.volume
-            })
-        
-        return pd.DataFrame(records)
+        if not data:
+            return pd.DataFrame(columns=list(OHLCV_COLUMNS))
+        
+        # One pass over the objects, transposed into one buffer per column;
+        # prices/volumes get their dtype up front instead of being inferred
+        timestamps, *values = zip(*map(attrgetter(*OHLCV_COLUMNS), data))
+        
+        columns = {"timestamp": pd.array(timestamps)}
+        for name, column in zip(OHLCV_COLUMNS[1:], values):
+            columns[name] = np.array(column, dtype=np.float64)
+        
+        return pd.DataFrame(columns, copy=False)
@@ -8,9 +8,12 @@ This service manages scheduled tasks for:
 - Monthly data migration (hot → warm storage)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Callable, Dict, Any, List
 import logging
+import threading
+import uuid
 from dataclasses import dataclass, field
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -24,6 +27,11 @@ from src.shared.exceptions.custom_exceptions import AppException
 
 logger = logging.getLogger(__name__)
 
+# Pipelines submitted through submit_job() run on this many worker threads;
+# finished ones beyond SUBMITTED_JOB_HISTORY are forgotten, oldest first
+PIPELINE_WORKERS = 2
+SUBMITTED_JOB_HISTORY = 100
+
 
 @dataclass
 class ScheduledJob:
@@ -81,6 +89,14 @@ class SchedulerService:
         # Job tracking
         self.jobs: Dict[str, ScheduledJob] = {}
         
+        # One-off pipeline runs (submit_job)
+        self.submitted_jobs: Dict[str, ScheduledJob] = {}
+        self._submitted_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=PIPELINE_WORKERS,
+            thread_name_prefix="pipeline"
+        )
+        
         logger.info(f"✅ Scheduler initialized (timezone={timezone})")
     
     def start(self) -> None:
@@ -365,6 +381,58 @@ class SchedulerService:
         logger.info(f"🔥 Manually triggering job: {job_id}")
         job.modify(next_run_time=datetime.now()) if hasattr(job, 'modify') else None
     
+    def submit_job(self, name: str, func: Callable[..., Any], **params) -> str:
+        """
+        Run a pipeline once in the background.
+        
+        The call returns immediately; func(**params) runs on a worker
+        thread and its return value is kept in the job's metadata under
+        "result" (or the error message under "error").
+        
+        Args:
+            name: Pipeline name (prefix of the job ID)
+            func: Callable to run
+            **params: Keyword arguments for func
+            
+        Returns:
+            Job ID for get_submitted_job()
+        """
+        job_id = f"{name}_{uuid.uuid4().hex[:12]}"
+        job = ScheduledJob(
+            job_id=job_id,
+            name=name,
+            trigger="manual",
+            description=f"One-off {name} run",
+            metadata={"params": params}
+        )
+        
+        with self._submitted_lock:
+            self.submitted_jobs[job_id] = job
+            finished = [
+                key for key, value in self.submitted_jobs.items()
+                if value.status in ("completed", "failed")
+            ]
+            excess = len(self.submitted_jobs) - SUBMITTED_JOB_HISTORY
+            for key in finished[:max(0, excess)]:
+                del self.submitted_jobs[key]
+        
+        self._executor.submit(self._run_submitted_job, job, func, params)
+        logger.info(f"📥 Submitted job: {job_id}")
+        
+        return job_id
+    
+    def get_submitted_job(self, job_id: str) -> Optional[ScheduledJob]:
+        """
+        Get status of a job started with submit_job().
+        
+        Args:
+            job_id: Job identifier
+            
+        Returns:
+            Job metadata or None if not found
+        """
+        return self.submitted_jobs.get(job_id)
+    
     def remove_job(self, job_id: str) -> None:
         """
         Remove a scheduled job.
@@ -433,6 +501,27 @@ class SchedulerService:
     
     # ==================== Job Implementations ====================
     
+    def _run_submitted_job(
+        self,
+        job: ScheduledJob,
+        func: Callable[..., Any],
+        params: Dict[str, Any]
+    ) -> None:
+        """Execute a submitted job and record its outcome."""
+        job.status = "running"
+        job.last_run = datetime.now()
+        
+        try:
+            job.metadata["result"] = func(**params)
+            job.status = "completed"
+            logger.info(f"✅ Completed: {job.job_id}")
+            
+        except Exception as e:
+            job.metadata["error"] = str(e)
+            job.error_count += 1
+            job.status = "failed"
+            logger.error(f"❌ Failed: {job.job_id}, error={str(e)}")
+    
     def _run_download_job(
         self,
         symbol: str,
@@ -14,6 +14,17 @@ import pandas as pd
 import numpy as np
 from enum import Enum
 
+# Columns the factor analyses read; they are taken out of the DataFrame
+# once as float64 arrays so each factor works on plain NumPy slices
+# instead of building pandas Series for every tail/iloc lookup
+ADVISOR_COLUMNS = (
+    'close', 'high', 'low', 'volume', 'sma_20', 'sma_50',
+    'rsi', 'macd', 'macd_signal', 'macd_histogram'
+)
+REGIME_PROB_COLUMNS = ('bull_prob', 'bear_prob', 'neutral_prob', 'high_volatility_prob')
+# Order of the factor score/weight vectors
+FACTOR_NAMES = ('trend', 'technical', 'risk', 'regime', 'drawdown')
+
 
 class InvestmentSignal(str, Enum):
     """Investment signal levels."""
@@ -53,24 +64,27 @@ class InvestmentAdvisorService:
         Returns:
             Dictionary with signal, score, confidence, detailed factors, and actionable insights
         """
+        cols = {
+            name: df[name].to_numpy(dtype=np.float64)
+            for name in ADVISOR_COLUMNS if name in df.columns
+        }
+        
         # Calculate individual factor scores (0-100)
-        trend_score, trend_details = self._analyze_trend(df)
-        technical_score, technical_details = self._analyze_technical_indicators(df)
-        risk_score, risk_details = self._analyze_risk_metrics(df)
+        trend_score, trend_details = self._analyze_trend(cols)
+        technical_score, technical_details = self._analyze_technical_indicators(cols)
+        risk_score, risk_details = self._analyze_risk_metrics(cols)
         regime_score, regime_details = self._analyze_regime(regime_data) if regime_data is not None else (50.0, {})
-        drawdown_score, drawdown_details = self._analyze_drawdown(df)
+        drawdown_score, drawdown_details = self._analyze_drawdown(cols)
         
         # Calculate market context
-        market_context = self._analyze_market_context(df)
-        
-        # Calculate weighted composite score
-        composite_score = (
-            self.weights['trend'] * trend_score +
-            self.weights['technical'] * technical_score +
-            self.weights['risk'] * risk_score +
-            self.weights['regime'] * regime_score +
-            self.weights['drawdown'] * drawdown_score
-        )
+        market_context = self._analyze_market_context(cols)
+        
+        # Weighted composite score: one multiply over the factor vector
+        # (FACTOR_NAMES order), summed in the same order as before
+        weights = np.array([self.weights[name] for name in FACTOR_NAMES])
+        scores = np.array([trend_score, technical_score, risk_score, regime_score, drawdown_score])
+        contributions = weights * scores
+        composite_score = contributions.sum()
         
         # Determine signal based on score thresholds
         signal, confidence = self._score_to_signal(composite_score)
@@ -87,37 +101,17 @@ class InvestmentAdvisorService:
         )
         
         # Build detailed breakdown
+        details = (trend_details, technical_details, risk_details, regime_details, drawdown_details)
         factors = {
-            'trend': {
-                'score': round(trend_score, 2),
-                'weight': self.weights['trend'],
-                'contribution': round(self.weights['trend'] * trend_score, 2),
-                'details': trend_details
-            },
-            'technical': {
-                'score': round(technical_score, 2),
-                'weight': self.weights['technical'],
-                'contribution': round(self.weights['technical'] * technical_score, 2),
-                'details': technical_details
-            },
-            'risk': {
-                'score': round(risk_score, 2),
-                'weight': self.weights['risk'],
-                'contribution': round(self.weights['risk'] * risk_score, 2),
-                'details': risk_details
-            },
-            'regime': {
-                'score': round(regime_score, 2),
-                'weight': self.weights['regime'],
-                'contribution': round(self.weights['regime'] * regime_score, 2),
-                'details': regime_details
-            },
-            'drawdown': {
-                'score': round(drawdown_score, 2),
-                'weight': self.weights['drawdown'],
-                'contribution': round(self.weights['drawdown'] * drawdown_score, 2),
-                'details': drawdown_details
+            name: {
+                'score': round(score, 2),
+                'weight': weight,
+                'contribution': round(contribution, 2),
+                'details': factor_details
             }
+            for name, score, weight, contribution, factor_details in zip(
+                FACTOR_NAMES, scores.tolist(), weights.tolist(), contributions.tolist(), details
+            )
         }
         
         return {
@@ -130,23 +124,24 @@ class InvestmentAdvisorService:
             'timestamp': df['timestamp'].iloc[-1] if 'timestamp' in df.columns else pd.Timestamp.now()
         }
     
-    def _analyze_trend(self, df: pd.DataFrame) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_trend(self, cols: Dict[str, np.ndarray]) -> Tuple[float, Dict[str, Any]]:
         """
         Analyze price trend and momentum (0-100).
         
         Returns:
             (score, details_dict)
         """
-        if len(df) < 20:
+        close = cols['close']
+        if len(close) < 20:
             return 50.0, {'status': 'insufficient_data'}
         
         score = 50.0  # Neutral baseline
         details = {}
         
         # Short-term vs long-term price comparison
-        recent_prices = df['close'].tail(7).mean()
-        older_prices = df['close'].tail(30).mean()
-        current_price = df['close'].iloc[-1]
+        recent_prices = np.nanmean(close[-7:])
+        older_prices = np.nanmean(close[-30:])
+        current_price = close[-1]
         
         price_change_pct = ((recent_prices - older_prices) / older_prices) * 100
         details['price_change_7d_vs_30d'] = round(price_change_pct, 2)
@@ -159,9 +154,9 @@ class InvestmentAdvisorService:
             details['trend_direction'] = 'downtrend'
         
         # Moving average alignment
-        if 'sma_20' in df.columns and 'sma_50' in df.columns:
-            sma_20 = df['sma_20'].iloc[-1]
-            sma_50 = df['sma_50'].iloc[-1]
+        if 'sma_20' in cols and 'sma_50' in cols:
+            sma_20 = cols['sma_20'][-1]
+            sma_50 = cols['sma_50'][-1]
             
             details['price'] = round(current_price, 2)
             details['sma_20'] = round(sma_20, 2)
@@ -189,8 +184,8 @@ class InvestmentAdvisorService:
                 details['ma_cross'] = 'death_cross'
         
         # Momentum strength (recent 7 days)
-        if len(df) >= 7:
-            week_ago_price = df['close'].iloc[-7]
+        if len(close) >= 7:
+            week_ago_price = close[-7]
             momentum_pct = ((current_price - week_ago_price) / week_ago_price) * 100
             details['momentum_7d'] = round(momentum_pct, 2)
             
@@ -206,22 +201,23 @@ class InvestmentAdvisorService:
         
         return final_score, details
     
-    def _analyze_technical_indicators(self, df: pd.DataFrame) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_technical_indicators(self, cols: Dict[str, np.ndarray]) -> Tuple[float, Dict[str, Any]]:
         """
         Analyze technical indicators (RSI, MACD) (0-100).
         
         Returns:
             (score, details_dict)
         """
-        if len(df) < 26:
+        close = cols['close']
+        if len(close) < 26:
             return 50.0, {'status': 'insufficient_data'}
         
         score = 50.0
         details = {}
         
         # RSI analysis
-        if 'rsi' in df.columns:
-            rsi = df['rsi'].iloc[-1]
+        if 'rsi' in cols:
+            rsi = cols['rsi'][-1]
             details['rsi'] = round(rsi, 2)
             
             if rsi < 30:
@@ -245,9 +241,9 @@ class InvestmentAdvisorService:
                 details['rsi_interpretation'] = 'Hơi quá mua'
             
             # RSI divergence check (advanced)
-            if len(df) >= 14:
-                price_trend = df['close'].iloc[-14:].is_monotonic_increasing
-                rsi_trend = df['rsi'].iloc[-14:].is_monotonic_increasing if 'rsi' in df.columns else False
+            if len(close) >= 14:
+                price_trend = _is_monotonic_increasing(close[-14:])
+                rsi_trend = _is_monotonic_increasing(cols['rsi'][-14:])
                 
                 if price_trend and not rsi_trend:
                     details['rsi_divergence'] = 'bearish_divergence'
@@ -261,9 +257,9 @@ class InvestmentAdvisorService:
             details['rsi'] = 'not_available'
         
         # MACD analysis
-        if 'macd' in df.columns and 'macd_signal' in df.columns:
-            macd = df['macd'].iloc[-1]
-            macd_signal = df['macd_signal'].iloc[-1]
+        if 'macd' in cols and 'macd_signal' in cols:
+            macd = cols['macd'][-1]
+            macd_signal = cols['macd_signal'][-1]
             macd_hist = macd - macd_signal
             
             details['macd'] = round(macd, 4)
@@ -277,9 +273,9 @@ class InvestmentAdvisorService:
                 details['macd_interpretation'] = 'MACD trên Signal - Xu hướng tăng'
                 
                 # Check for recent crossover
-                if len(df) >= 5:
-                    prev_macd = df['macd'].iloc[-5]
-                    prev_signal = df['macd_signal'].iloc[-5]
+                if len(close) >= 5:
+                    prev_macd = cols['macd'][-5]
+                    prev_signal = cols['macd_signal'][-5]
                     if prev_macd <= prev_signal:
                         score += 10
                         details['macd_crossover'] = 'recent_bullish_crossover'
@@ -291,9 +287,9 @@ class InvestmentAdvisorService:
                 details['macd_position'] = 'bearish'
                 details['macd_interpretation'] = 'MACD dưới Signal - Xu hướng giảm'
                 
-                if len(df) >= 5:
-                    prev_macd = df['macd'].iloc[-5]
-                    prev_signal = df['macd_signal'].iloc[-5]
+                if len(close) >= 5:
+                    prev_macd = cols['macd'][-5]
+                    prev_signal = cols['macd_signal'][-5]
                     if prev_macd >= prev_signal:
                         score -= 10
                         details['macd_crossover'] = 'recent_bearish_crossover'
@@ -302,7 +298,7 @@ class InvestmentAdvisorService:
                         details['macd_crossover'] = 'continued_bearish'
             
             # MACD histogram strength
-            if abs(macd_hist) > abs(df['macd_histogram'].iloc[-10:].mean()) if 'macd_histogram' in df.columns else 0:
+            if abs(macd_hist) > abs(np.nanmean(cols['macd_histogram'][-10:])) if 'macd_histogram' in cols else 0:
                 details['macd_strength'] = 'strong'
             else:
                 details['macd_strength'] = 'weak'
@@ -314,26 +310,28 @@ class InvestmentAdvisorService:
         
         return final_score, details
     
-    def _analyze_risk_metrics(self, df: pd.DataFrame) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_risk_metrics(self, cols: Dict[str, np.ndarray]) -> Tuple[float, Dict[str, Any]]:
         """
         Analyze risk metrics (VaR, Volatility, Sharpe) (0-100).
         
         Lower risk = higher score (more attractive for investment).
         """
-        if len(df) < 30:
+        close = cols['close']
+        if len(close) < 30:
             return 50.0, {'status': 'insufficient_data'}
         
         score = 50.0
         details = {}
         
         # Calculate returns
-        returns = df['close'].pct_change().dropna()
+        returns = _pct_change(close)
+        returns = returns[~np.isnan(returns)]
         
         if len(returns) < 2:
             return 50.0
         
         # Volatility analysis (lower is better)
-        volatility = returns.std() * np.sqrt(24)  # Annualized for hourly data
+        volatility = np.std(returns, ddof=1) * np.sqrt(24)  # Annualized for hourly data
         details['volatility'] = round(volatility * 100, 2)
         
         # Typical crypto volatility: 0.5-2.0 (50-200%)
@@ -354,8 +352,8 @@ class InvestmentAdvisorService:
         
         # Sharpe Ratio (higher is better)
         if len(returns) > 0:
-            mean_return = returns.mean()
-            std_return = returns.std()
+            mean_return = np.mean(returns)
+            std_return = np.std(returns, ddof=1)
             
             if std_return > 0:
                 sharpe = (mean_return / std_return) * np.sqrt(24 * 365)  # Annualized
@@ -409,13 +407,11 @@ class InvestmentAdvisorService:
         if regime_data is None or len(regime_data) == 0:
             return 50.0, {'status': 'no_regime_data'}
         
-        # Get latest regime probabilities
-        latest = regime_data.iloc[-1]
-        
-        bull_prob = latest.get('bull_prob', 0.0)
-        bear_prob = latest.get('bear_prob', 0.0)
-        neutral_prob = latest.get('neutral_prob', 0.0)
-        high_vol_prob = latest.get('high_volatility_prob', 0.0)
+        # Get latest regime probabilities (0 for missing columns)
+        bull_prob, bear_prob, neutral_prob, high_vol_prob = (
+            regime_data[name].iloc[-1] if name in regime_data.columns else 0.0
+            for name in REGIME_PROB_COLUMNS
+        )
         
         details = {
             'bull_probability': round(bull_prob * 100, 2),
@@ -442,21 +438,22 @@ class InvestmentAdvisorService:
         details['score_interpretation'] = self._interpret_score(final_score)
         return final_score, details
     
-    def _analyze_drawdown(self, df: pd.DataFrame) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_drawdown(self, cols: Dict[str, np.ndarray]) -> Tuple[float, Dict[str, Any]]:
         """
         Analyze current drawdown status (0-100).
         
         Low drawdown = high score (good entry point).
         """
-        if len(df) < 20:
+        close = cols['close']
+        if len(close) < 20:
             return 50.0, {'status': 'insufficient_data'}
         
-        # Calculate running maximum
-        running_max = df['close'].expanding().max()
-        drawdown = (df['close'] - running_max) / running_max
+        # Calculate running maximum (fmax skips NaN prices)
+        running_max = np.fmax.accumulate(close)
+        drawdown = (close - running_max) / running_max
         
-        current_drawdown = drawdown.iloc[-1]
-        max_drawdown = drawdown.min()
+        current_drawdown = drawdown[-1]
+        max_drawdown = np.nanmin(drawdown)
         
         details = {
             'current_drawdown': round(current_drawdown * 100, 2),
@@ -496,18 +493,19 @@ class InvestmentAdvisorService:
         details['score_interpretation'] = self._interpret_score(final_score)
         return final_score, details
     
-    def _analyze_market_context(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_market_context(self, cols: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Analyze overall market context and conditions."""
         context = {}
         
-        if len(df) < 20:
+        close = cols['close']
+        if len(close) < 20:
             return {'status': 'insufficient_data'}
         
-        current_price = df['close'].iloc[-1]
+        current_price = close[-1]
         
         # Support/Resistance levels (recent highs/lows)
-        recent_high = df['high'].tail(30).max()
-        recent_low = df['low'].tail(30).min()
+        recent_high = np.nanmax(cols['high'][-30:])
+        recent_low = np.nanmin(cols['low'][-30:])
         
         context['current_price'] = round(current_price, 2)
         context['recent_high_30d'] = round(recent_high, 2)
@@ -529,9 +527,9 @@ class InvestmentAdvisorService:
                 context['range_position'] = 'mid_range'
         
         # Volume analysis
-        if 'volume' in df.columns:
-            avg_volume = df['volume'].tail(20).mean()
-            recent_volume = df['volume'].tail(5).mean()
+        if 'volume' in cols:
+            avg_volume = np.nanmean(cols['volume'][-20:])
+            recent_volume = np.nanmean(cols['volume'][-5:])
             context['avg_volume_20d'] = round(avg_volume, 2)
             context['recent_volume_5d'] = round(recent_volume, 2)
             
@@ -543,10 +541,10 @@ class InvestmentAdvisorService:
                 context['volume_signal'] = 'normal'
         
         # Volatility state
-        if len(df) >= 20:
-            returns = df['close'].pct_change()
-            recent_vol = returns.tail(7).std()
-            avg_vol = returns.tail(30).std()
+        if len(close) >= 20:
+            returns = _pct_change(close)
+            recent_vol = np.nanstd(returns[-7:], ddof=1)
+            avg_vol = np.nanstd(returns[-30:], ddof=1)
             
             if recent_vol > avg_vol * 1.5:
                 context['volatility_state'] = 'high_volatility'
@@ -668,3 +666,17 @@ class InvestmentAdvisorService:
             return InvestmentSignal.SELL, min((40 - score) * 5, 100)
         else:
             return InvestmentSignal.STRONG_SELL, min((20 - score) * 5, 100)
+
+
+def _pct_change(values: np.ndarray) -> np.ndarray:
+    """Series.pct_change() on an array (NaN first element)"""
+    result = np.empty_like(values)
+    result[0] = np.nan
+    np.divide(values[1:], values[:-1], out=result[1:])
+    result[1:] -= 1.0
+    return result
+
+
+def _is_monotonic_increasing(values: np.ndarray) -> bool:
+    """Series.is_monotonic_increasing on an array (False if any NaN)"""
+    return bool(np.all(values[1:] >= values[:-1])) and not np.isnan(values).any()
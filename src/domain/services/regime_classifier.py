@@ -20,7 +20,7 @@ import pandas as pd
 from sklearn.mixture import GaussianMixture
 from sklearn.preprocessing import StandardScaler
 from hmmlearn import hmm
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 from datetime import datetime
 
 from src.domain.models.market_regime import MarketRegime, RegimeType, RegimeTransition
@@ -74,6 +74,11 @@ class RegimeClassifierService:
         # Cluster-to-regime mapping (learned after fitting)
         self.cluster_to_regime: Dict[int, RegimeType] | None = None
     
+    @property
+    def is_fitted(self) -> bool:
+        """True once fit() has trained the models."""
+        return self.cluster_to_regime is not None
+    
     def extract_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Extract features for regime classification.
@@ -120,8 +125,9 @@ class RegimeClassifierService:
                     f"Insufficient data for training (need 100+, got {len(features)})"
                 )
             
-            # 2. Standardize features
-            features_scaled = self.scaler.fit_transform(features)
+            # 2. Standardize features; the scaler returns column-major
+            # arrays for DataFrame input, GMM/HMM work row by row
+            features_scaled = np.ascontiguousarray(self.scaler.fit_transform(features))
             
             # 3. Fit GMM
             logger.info(f"Training GMM with {self.n_regimes} components")
@@ -261,7 +267,7 @@ class RegimeClassifierService:
         try:
             # Extract and scale features
             features = self.extract_features(df)
-            features_scaled = self.scaler.transform(features)
+            features_scaled = np.ascontiguousarray(self.scaler.transform(features))
             
             # GMM probabilities
             gmm_proba = self.gmm.predict_proba(features_scaled)
@@ -297,6 +303,57 @@ class RegimeClassifierService:
                 details={"data_rows": len(df)}
             )
     
+    def predict_proba_array(
+        self,
+        df: pd.DataFrame,
+        regimes: Sequence[RegimeType] = tuple(RegimeType)
+    ) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Predict regime probabilities as a plain array.
+        
+        Same values as predict_proba() without building per-regime
+        DataFrame columns; regimes with no mapped cluster get zeros.
+        
+        Args:
+            df: OHLCV DataFrame
+            regimes: Column order of the result (default: RegimeType order)
+            
+        Returns:
+            Tuple of (array of shape (n_samples, len(regimes)), feature index)
+            
+        Raises:
+            RegimeClassificationError: If model not fitted
+        """
+        if self.gmm is None or self.hmm_model is None:
+            raise RegimeClassificationError(
+                "Model not fitted. Call fit() first."
+            )
+        
+        try:
+            features = self.extract_features(df)
+            features_scaled = np.ascontiguousarray(self.scaler.transform(features))
+            
+            # Average of GMM and HMM probabilities, as in predict_proba()
+            combined_proba = (
+                self.gmm.predict_proba(features_scaled)
+                + self.hmm_model.predict_proba(features_scaled)
+            ) / 2
+            
+            # Cluster -> regime membership matrix sums clusters per regime
+            columns = {regime: j for j, regime in enumerate(regimes)}
+            membership = np.zeros((self.n_regimes, len(regimes)))
+            for cluster_id, regime in self.cluster_to_regime.items():
+                if regime in columns:
+                    membership[cluster_id, columns[regime]] = 1.0
+            
+            return combined_proba @ membership, features.index
+            
+        except Exception as e:
+            raise RegimeClassificationError(
+                f"Probability prediction failed: {str(e)}",
+                details={"data_rows": len(df)}
+            )
+    
     def classify(self, df: pd.DataFrame) -> List[MarketRegime]:
         """
         Classify market regime for each time step.
@@ -379,6 +379,23 @@ class RiskCalculatorService:
                 f"Sortino Ratio calculation failed: {str(e)}"
             )
     
+    def calculate_volatility(
+        self,
+        returns: pd.Series,
+        periods_per_year: int = 365
+    ) -> float:
+        """
+        Calculate annualized volatility.
+        
+        Args:
+            returns: Return series
+            periods_per_year: For annualization (365=daily, 8760=hourly)
+            
+        Returns:
+            Standard deviation of returns scaled by sqrt(periods_per_year)
+        """
+        return float(returns.std() * np.sqrt(periods_per_year))
+    
     def calculate_max_drawdown(self, prices: pd.Series) -> float:
         """
         Calculate Maximum Drawdown.
@@ -405,14 +422,16 @@ class RiskCalculatorService:
                     "Insufficient data for drawdown calculation (need at least 2 observations)"
                 )
             
-            # Calculate cumulative maximum (rolling peak)
-            cumulative_max = prices.expanding().max()
+            # Running peak over the raw array (fmax skips NaN like
+            # expanding().max() does)
+            values = np.asarray(prices, dtype=np.float64)
+            cumulative_max = np.fmax.accumulate(values)
             
             # Calculate drawdown from peak
-            drawdown = (prices - cumulative_max) / cumulative_max
+            drawdown = (values - cumulative_max) / cumulative_max
             
             # Maximum drawdown (most negative value)
-            max_dd = drawdown.min()
+            max_dd = np.nanmin(drawdown)
             
             logger.debug(f"Max Drawdown calculated", max_dd=max_dd)
             
@@ -469,7 +488,7 @@ class RiskCalculatorService:
             max_dd = self.calculate_max_drawdown(prices)
             
             # Volatility (annualized)
-            volatility = returns.std() * np.sqrt(periods_per_year)
+            volatility = self.calculate_volatility(returns, periods_per_year)
             
             # Mean return (daily)
             mean_return = returns.mean()
@@ -488,7 +507,7 @@ class RiskCalculatorService:
                 sharpe_ratio=sharpe,
                 sortino_ratio=sortino,
                 max_drawdown=max_dd,
-                volatility=float(volatility),
+                volatility=volatility,
                 mean_return=float(mean_return),
                 var_95_modified=var_95_modified,
                 var_99_modified=var_99_modified,
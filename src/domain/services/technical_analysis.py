@@ -18,6 +18,7 @@ Indicators:
 import numpy as np
 import pandas as pd
 from typing import Dict, Tuple
+from src.indicators.ta_kernels import NUMBA_AVAILABLE, TA_COLUMNS, ta_indicators
 from src.shared.exceptions.custom_exceptions import TechnicalIndicatorError
 from src.shared.utils.logging_utils import get_logger
 
@@ -343,46 +344,32 @@ class TechnicalAnalysisService:
             >>> df_with_indicators = ta.calculate_all_indicators(df)
             >>> df_with_indicators[['close', 'rsi', 'macd', 'bb_upper']].tail()
         """
-        result = df.copy()
-        
         try:
-            # RSI
-            result["rsi"] = self.calculate_rsi(df["close"], period=rsi_period)
-            
-            # MACD
-            macd = self.calculate_macd(
-                df["close"],
-                fast_period=macd_fast,
-                slow_period=macd_slow,
-                signal_period=macd_signal
-            )
-            result["macd"] = macd["macd"]
-            result["macd_signal"] = macd["signal"]
-            result["macd_histogram"] = macd["histogram"]
-            
-            # Bollinger Bands
-            bb = self.calculate_bollinger_bands(
-                df["close"],
-                period=bb_period,
-                std_dev=bb_std
-            )
-            result["bb_upper"] = bb["upper"]
-            result["bb_middle"] = bb["middle"]
-            result["bb_lower"] = bb["lower"]
-            result["bb_bandwidth"] = bb["bandwidth"]
-            
-            # ATR
-            result["atr"] = self.calculate_atr(
-                df["high"],
-                df["low"],
-                df["close"],
-                period=atr_period
-            )
+            if self._can_use_kernels(df, rsi_period, macd_slow, bb_period, atr_period):
+                # Compiled loops over the raw arrays (same values as below)
+                block = ta_indicators(
+                    df["high"].to_numpy(dtype=np.float64),
+                    df["low"].to_numpy(dtype=np.float64),
+                    df["close"].to_numpy(dtype=np.float64),
+                    rsi_period, macd_fast, macd_slow, macd_signal,
+                    bb_period, bb_std, atr_period
+                )
+                indicators = dict(zip(TA_COLUMNS, block))
+            else:
+                indicators = self._pandas_indicators(
+                    df, rsi_period, macd_fast, macd_slow, macd_signal,
+                    bb_period, bb_std, atr_period
+                )
             
-            # Moving averages
-            result["sma_20"] = self.calculate_sma(df["close"], period=20)
-            result["sma_50"] = self.calculate_sma(df["close"], period=50)
-            result["ema_20"] = self.calculate_ema(df["close"], period=20)
+            # Attach all indicator columns in one block instead of one
+            # insert per column (existing columns are overwritten in place)
+            indicator_df = pd.DataFrame(indicators, index=df.index)
+            if df.columns.intersection(indicator_df.columns).empty:
+                result = pd.concat([df, indicator_df], axis=1)
+            else:
+                result = df.copy()
+                for name in indicator_df.columns:
+                    result[name] = indicator_df[name]
             
             logger.info(
                 f"✅ All technical indicators calculated",
@@ -398,6 +385,80 @@ class TechnicalAnalysisService:
                 details={"rows": len(df)}
             )
     
+    @staticmethod
+    def _can_use_kernels(
+        df: pd.DataFrame,
+        rsi_period: int,
+        macd_slow: int,
+        bb_period: int,
+        atr_period: int
+    ) -> bool:
+        """
+        Whether calculate_all_indicators can take the Numba path.
+        
+        Needs Numba, NaN-free prices and enough rows; otherwise the pandas
+        path runs (and raises the usual insufficient-data errors).
+        """
+        if not NUMBA_AVAILABLE:
+            return False
+        if len(df) < max(rsi_period, macd_slow, bb_period, atr_period):
+            return False
+        return not df[["high", "low", "close"]].isna().to_numpy().any()
+    
+    def _pandas_indicators(
+        self,
+        df: pd.DataFrame,
+        rsi_period: int,
+        macd_fast: int,
+        macd_slow: int,
+        macd_signal: int,
+        bb_period: int,
+        bb_std: float,
+        atr_period: int
+    ) -> Dict[str, pd.Series]:
+        """Indicator columns for calculate_all_indicators via pandas."""
+        indicators = {}
+        
+        # RSI
+        indicators["rsi"] = self.calculate_rsi(df["close"], period=rsi_period)
+        
+        # MACD
+        macd = self.calculate_macd(
+            df["close"],
+            fast_period=macd_fast,
+            slow_period=macd_slow,
+            signal_period=macd_signal
+        )
+        indicators["macd"] = macd["macd"]
+        indicators["macd_signal"] = macd["signal"]
+        indicators["macd_histogram"] = macd["histogram"]
+        
+        # Bollinger Bands
+        bb = self.calculate_bollinger_bands(
+            df["close"],
+            period=bb_period,
+            std_dev=bb_std
+        )
+        indicators["bb_upper"] = bb["upper"]
+        indicators["bb_middle"] = bb["middle"]
+        indicators["bb_lower"] = bb["lower"]
+        indicators["bb_bandwidth"] = bb["bandwidth"]
+        
+        # ATR
+        indicators["atr"] = self.calculate_atr(
+            df["high"],
+            df["low"],
+            df["close"],
+            period=atr_period
+        )
+        
+        # Moving averages
+        indicators["sma_20"] = self.calculate_sma(df["close"], period=20)
+        indicators["sma_50"] = self.calculate_sma(df["close"], period=50)
+        indicators["ema_20"] = self.calculate_ema(df["close"], period=20)
+        
+        return indicators
+    
     def extract_features_for_regime_classification(
         self,
         df: pd.DataFrame
@@ -0,0 +1,354 @@
+"""
+Fused Technical Indicator Kernel
+Single-pass SMA / EMA / RSI / MACD / Bollinger Bands over a close-price array.
+
+The kernel is compiled with Numba when it is installed. Without Numba the
+decorators are no-ops and NUMBA_AVAILABLE is False; full passes then use
+the vectorized pandas rolling/ewm chain instead, whose Cython loops beat
+the interpreted per-candle loop, and the loop only advances a few
+appended rows.
+
+All running state lives in a small float array, so a series that only
+grows (new candles appended) can be extended in O(new rows) with
+IndicatorStream instead of being recomputed from scratch.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Output row order of update_indicators() / compute_all()
+INDICATOR_COLUMNS = (
+    'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi',
+    'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower'
+)
+
+# Running state slots
+(_EMA_F, _EMA_SL, _SIGNAL,
+ _SUM_LONG, _WIN_COUNT, _WIN_MEAN, _WIN_M2, _AVG_GAIN, _AVG_LOSS) = range(9)
+STATE_SIZE = 9
+
+# Without Numba, IndicatorStream updates covering more rows than this are
+# recomputed with the vectorized path rather than the Python loop
+LOOP_MAX_ROWS = 64
+
+
+@njit(cache=True, nogil=True)
+def _gain_loss(close, i):
+    """Gain and loss of close[i] versus the previous close (0 at i == 0)."""
+    if i == 0:
+        return 0.0, 0.0
+    delta = close[i] - close[i - 1]
+    if delta > 0:
+        return delta, 0.0
+    if delta < 0:
+        return 0.0, -delta
+    return 0.0, 0.0
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def update_indicators(close, out, state, start, sma_short=20, sma_long=50,
+                      ema_fast=12, ema_slow=26, signal_span=9, rsi_period=14,
+                      bb_k=2.0):
+    """
+    Advance the indicator state over close[start:], writing out[:, start:].
+
+    Semantics match the pandas chain used by the API:
+    - SMA / Bollinger: rolling mean and sample std (ddof=1), NaN during warmup
+    - EMA / MACD signal: ewm(span=...) with adjust=False (recursive form)
+    - RSI: Wilder smoothing, seeded with the simple mean of the first
+      rsi_period gains/losses (first value at index rsi_period)
+
+    Running state is O(1) per step: window sums for the long SMA, a rolling
+    Welford accumulator for the short SMA/std (shared with the Bollinger
+    middle band), and the previous EMA values. Values leaving a window are
+    re-read from `close`, which must therefore hold the full history.
+
+    Args:
+        close: float64 array of close prices (full history)
+        out: float64 array of shape (len(INDICATOR_COLUMNS), >= len(close))
+        state: float64 array of STATE_SIZE (zeros for a fresh series)
+        start: First index to compute (rows before it are already in `out`)
+    """
+    n = close.shape[0]
+
+    alpha_f = 2.0 / (ema_fast + 1.0)
+    alpha_sl = 2.0 / (ema_slow + 1.0)
+    alpha_sig = 2.0 / (signal_span + 1.0)
+
+    ema_f = state[_EMA_F]
+    ema_sl = state[_EMA_SL]
+    signal = state[_SIGNAL]
+    sum_long = state[_SUM_LONG]
+    win_count = state[_WIN_COUNT]
+    win_mean = state[_WIN_MEAN]
+    win_m2 = state[_WIN_M2]
+    avg_gain = state[_AVG_GAIN]
+    avg_loss = state[_AVG_LOSS]
+
+    for i in range(start, n):
+        x = close[i]
+
+        # EMA (adjust=False): ema = ema_prev + alpha * (x - ema_prev), seeded at x[0]
+        if i == 0:
+            ema_f = x
+            ema_sl = x
+        else:
+            ema_f += alpha_f * (x - ema_f)
+            ema_sl += alpha_sl * (x - ema_sl)
+        out[2, i] = ema_f
+        out[3, i] = ema_sl
+
+        # MACD
+        m = ema_f - ema_sl
+        if i == 0:
+            signal = m
+        else:
+            signal += alpha_sig * (m - signal)
+        out[5, i] = m
+        out[6, i] = signal
+        out[7, i] = m - signal
+
+        # Long SMA: running window sum
+        sum_long += x
+        if i >= sma_long:
+            sum_long -= close[i - sma_long]
+        out[1, i] = sum_long / sma_long if i >= sma_long - 1 else np.nan
+
+        # Short SMA + Bollinger std: rolling Welford update
+        win_count += 1.0
+        d = x - win_mean
+        win_mean += d / win_count
+        win_m2 += d * (x - win_mean)
+        if i >= sma_short:
+            y = close[i - sma_short]
+            win_count -= 1.0
+            d = y - win_mean
+            win_mean -= d / win_count
+            win_m2 -= d * (y - win_mean)
+        if i >= sma_short - 1:
+            std = math.sqrt(max(win_m2, 0.0) / (sma_short - 1))
+            out[0, i] = win_mean
+            out[8, i] = win_mean + bb_k * std
+            out[9, i] = win_mean
+            out[10, i] = win_mean - bb_k * std
+        else:
+            out[0, i] = np.nan
+            out[8, i] = np.nan
+            out[9, i] = np.nan
+            out[10, i] = np.nan
+
+        # RSI (Wilder): sum gains / losses until the seed, then
+        # avg = (avg * (period - 1) + current) / period
+        gain, loss = _gain_loss(close, i)
+        if i < rsi_period:
+            avg_gain += gain
+            avg_loss += loss
+        elif i == rsi_period:
+            avg_gain = (avg_gain + gain) / rsi_period
+            avg_loss = (avg_loss + loss) / rsi_period
+        else:
+            avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+        if i >= rsi_period and avg_loss > 0:
+            out[4, i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif i >= rsi_period and avg_gain > 0:
+            out[4, i] = 100.0
+        else:
+            out[4, i] = np.nan
+
+    state[_EMA_F] = ema_f
+    state[_EMA_SL] = ema_sl
+    state[_SIGNAL] = signal
+    state[_SUM_LONG] = sum_long
+    state[_WIN_COUNT] = win_count
+    state[_WIN_MEAN] = win_mean
+    state[_WIN_M2] = win_m2
+    state[_AVG_GAIN] = avg_gain
+    state[_AVG_LOSS] = avg_loss
+
+
+def _vectorized_indicators(close, out, state, sma_short=20, sma_long=50,
+                           ema_fast=12, ema_slow=26, signal_span=9,
+                           rsi_period=14, bb_k=2.0):
+    """
+    update_indicators(close, out, state, 0) with pandas rolling/ewm calls.
+
+    Fills out[:, :len(close)] and leaves `state` as the kernel would, so
+    the series can be extended with update_indicators() afterwards.
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+    series = pd.Series(close)
+
+    ema_f = series.ewm(span=ema_fast, adjust=False).mean()
+    ema_sl = series.ewm(span=ema_slow, adjust=False).mean()
+    macd = ema_f - ema_sl
+    signal = macd.ewm(span=signal_span, adjust=False).mean()
+    out[2, :n] = ema_f
+    out[3, :n] = ema_sl
+    out[5, :n] = macd
+    out[6, :n] = signal
+    out[7, :n] = macd - signal
+
+    out[1, :n] = series.rolling(sma_long).mean()
+    middle = series.rolling(sma_short).mean().to_numpy()
+    std = series.rolling(sma_short).std().to_numpy()
+    out[0, :n] = middle
+    out[8, :n] = middle + bb_k * std
+    out[9, :n] = middle
+    out[10, :n] = middle - bb_k * std
+
+    # Wilder RSI: NaN before the seed (mean of the first rsi_period
+    # changes), then avg = (avg * (period - 1) + current) / period
+    delta = np.diff(close, prepend=close[0])
+    gains = np.clip(delta, 0.0, None)
+    losses = np.clip(-delta, 0.0, None)
+    if n > rsi_period:
+        seeded = np.full((2, n), np.nan)
+        seeded[0, rsi_period:] = gains[rsi_period:]
+        seeded[1, rsi_period:] = losses[rsi_period:]
+        seeded[0, rsi_period] = gains[:rsi_period + 1].sum() / rsi_period
+        seeded[1, rsi_period] = losses[:rsi_period + 1].sum() / rsi_period
+        averages = pd.DataFrame(seeded.T).ewm(alpha=1.0 / rsi_period, adjust=False).mean().to_numpy()
+        avg_gain, avg_loss = averages[:, 0], averages[:, 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(
+                avg_loss > 0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss),
+                np.where(avg_gain > 0, 100.0, np.nan)
+            )
+        out[4, :n] = rsi
+        state[_AVG_GAIN] = avg_gain[-1]
+        state[_AVG_LOSS] = avg_loss[-1]
+    else:
+        out[4, :n] = np.nan
+        state[_AVG_GAIN] = gains.sum()
+        state[_AVG_LOSS] = losses.sum()
+
+    # Running state as left by the kernel after the last row
+    window = close[-sma_short:]
+    state[_EMA_F] = ema_f.iloc[-1]
+    state[_EMA_SL] = ema_sl.iloc[-1]
+    state[_SIGNAL] = signal.iloc[-1]
+    state[_SUM_LONG] = close[-sma_long:].sum()
+    state[_WIN_COUNT] = window.shape[0]
+    state[_WIN_MEAN] = window.mean()
+    state[_WIN_M2] = ((window - window.mean()) ** 2).sum()
+
+
+def compute_all(close):
+    """
+    Compute all indicators over a close array in one pass.
+
+    Args:
+        close: float64 numpy array of close prices
+
+    Returns:
+        Array of shape (len(INDICATOR_COLUMNS), len(close))
+    """
+    out = np.empty((len(INDICATOR_COLUMNS), close.shape[0]))
+    if NUMBA_AVAILABLE:
+        update_indicators(close, out, np.zeros(STATE_SIZE), 0)
+    else:
+        _vectorized_indicators(close, out, np.zeros(STATE_SIZE))
+    return out
+
+
+def compute_indicators(close) -> dict:
+    """
+    Compute all indicators for a close-price series.
+
+    Args:
+        close: pandas Series or array-like of close prices
+
+    Returns:
+        Dict mapping indicator name (INDICATOR_COLUMNS) to numpy array
+    """
+    values = np.ascontiguousarray(np.asarray(close, dtype=np.float64))
+    return dict(zip(INDICATOR_COLUMNS, compute_all(values)))
+
+
+class IndicatorStream:
+    """
+    Indicator arrays for an append-only close series.
+
+    update() only computes rows added since the previous call; output
+    storage grows geometrically. The last close may be rewritten between
+    calls (an in-progress candle refetched with the same timestamp): the
+    stream keeps the state from before its last row and recomputes that
+    row. Arrays returned by arrays() are never overwritten by later
+    updates, so they can be handed out safely.
+    """
+
+    def __init__(self):
+        self.length = 0
+        self._state = np.zeros(STATE_SIZE)
+        self._prev_state = np.zeros(STATE_SIZE)
+        self._last_close = np.nan
+        self._out = np.empty((len(INDICATOR_COLUMNS), 0))
+
+    def update(self, close) -> None:
+        """
+        Extend the indicators to cover `close`.
+
+        Args:
+            close: Full close history; its first `length - 1` values must be
+                unchanged since the last update
+        """
+        values = np.ascontiguousarray(np.asarray(close, dtype=np.float64))
+        n = values.shape[0]
+        if n < self.length:
+            raise ValueError("Close series shrank; create a new IndicatorStream")
+
+        start = self.length
+        rewrite = start > 0 and values[start - 1] != self._last_close
+        if rewrite:
+            # Resume from the state before the rewritten row
+            start -= 1
+            self._state = self._prev_state.copy()
+        elif n == start:
+            return
+
+        if not NUMBA_AVAILABLE and n - start > LOOP_MAX_ROWS:
+            # Too many rows for the interpreted loop: recompute from scratch
+            start = 0
+            self._state = np.zeros(STATE_SIZE)
+            rewrite = True
+
+        if n > self._out.shape[1] or rewrite:
+            # A rewritten row goes to a new buffer: published views keep
+            # their values
+            grown = np.empty((len(INDICATOR_COLUMNS), max(n, 2 * self._out.shape[1])))
+            grown[:, :start] = self._out[:, :start]
+            self._out = grown
+
+        # Stop before the last row to snapshot the state it starts from
+        if start == 0 and not NUMBA_AVAILABLE:
+            _vectorized_indicators(values[:n - 1], self._out, self._state)
+        else:
+            update_indicators(values[:n - 1], self._out, self._state, start)
+        self._prev_state = self._state.copy()
+        update_indicators(values, self._out, self._state, max(start, n - 1))
+        self._last_close = values[n - 1]
+        self.length = n
+
+    def arrays(self) -> dict:
+        """Return indicator name -> array view over the computed rows."""
+        return {
+            name: self._out[k, :self.length]
+            for k, name in enumerate(INDICATOR_COLUMNS)
+        }
@@ -0,0 +1,160 @@
+"""
+Technical Analysis Kernels
+Numba loops behind TechnicalAnalysisService.calculate_all_indicators.
+
+Each kernel reproduces the pandas call it replaces (rolling mean/std,
+ewm(adjust=False), the simple-average RSI and ATR) on float64 arrays and
+releases the GIL, so requests computing indicators in worker threads run
+in parallel. Without Numba the decorators are no-ops and NUMBA_AVAILABLE is False;
+callers then keep the pandas path, whose Cython loops beat interpreted
+Python ones.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Output row order of ta_indicators()
+TA_COLUMNS = (
+    'rsi', 'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_bandwidth',
+    'atr', 'sma_20', 'sma_50', 'ema_20'
+)
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean(x, window, out):
+    """rolling(window).mean() via a running window sum"""
+    total = 0.0
+    for i in range(x.shape[0]):
+        total += x[i]
+        if i >= window:
+            total -= x[i - window]
+        out[i] = total / window if i >= window - 1 else np.nan
+
+
+@njit(cache=True, nogil=True)
+def _rolling_std(x, window, out):
+    """rolling(window).std() (ddof=1) via a rolling Welford update"""
+    count = 0.0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(x.shape[0]):
+        count += 1.0
+        d = x[i] - mean
+        mean += d / count
+        m2 += d * (x[i] - mean)
+        if i >= window:
+            y = x[i - window]
+            count -= 1.0
+            d = y - mean
+            mean -= d / count
+            m2 -= d * (y - mean)
+        out[i] = math.sqrt(max(m2, 0.0) / (window - 1)) if i >= window - 1 else np.nan
+
+
+@njit(cache=True, nogil=True)
+def _ema(x, span, out):
+    """ewm(span=span, adjust=False).mean(), seeded at x[0]"""
+    alpha = 2.0 / (span + 1.0)
+    value = x[0]
+    out[0] = value
+    for i in range(1, x.shape[0]):
+        value += alpha * (x[i] - value)
+        out[i] = value
+
+
+@njit(cache=True, nogil=True)
+def _rsi(close, period, out):
+    """RSI from period-window simple averages of gains and losses"""
+    sum_gain = 0.0
+    sum_loss = 0.0
+    gains = np.zeros(close.shape[0])
+    losses = np.zeros(close.shape[0])
+    for i in range(close.shape[0]):
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gains[i] = delta
+            elif delta < 0:
+                losses[i] = -delta
+        sum_gain += gains[i]
+        sum_loss += losses[i]
+        if i >= period:
+            sum_gain -= gains[i - period]
+            sum_loss -= losses[i - period]
+        if i < period - 1:
+            out[i] = np.nan
+        elif sum_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + sum_gain / sum_loss)
+        elif sum_gain > 0:
+            out[i] = 100.0
+        else:
+            out[i] = np.nan
+
+
+@njit(cache=True, nogil=True)
+def _true_range(high, low, close, out):
+    """max(high - low, |high - prev_close|, |low - prev_close|)"""
+    out[0] = high[0] - low[0]
+    for i in range(1, close.shape[0]):
+        prev = close[i - 1]
+        out[i] = max(high[i] - low[i], abs(high[i] - prev), abs(low[i] - prev))
+
+
+@njit(cache=True, nogil=True)
+def ta_indicators(high, low, close, rsi_period, macd_fast, macd_slow,
+                  macd_signal, bb_period, bb_std, atr_period):
+    """
+    Compute the calculate_all_indicators columns.
+
+    Args:
+        high, low, close: NaN-free float64 arrays of equal length
+        (remaining args as in calculate_all_indicators)
+
+    Returns:
+        Array of shape (len(TA_COLUMNS), len(close))
+    """
+    n = close.shape[0]
+    out = np.empty((12, n))
+    scratch = np.empty(n)
+
+    _rsi(close, rsi_period, out[0])
+
+    # MACD: out[1] holds the fast EMA until the slow EMA is subtracted
+    _ema(close, macd_fast, out[1])
+    _ema(close, macd_slow, scratch)
+    for i in range(n):
+        out[1, i] -= scratch[i]
+    _ema(out[1], macd_signal, out[2])
+    for i in range(n):
+        out[3, i] = out[1, i] - out[2, i]
+
+    # Bollinger Bands
+    _rolling_mean(close, bb_period, out[5])
+    _rolling_std(close, bb_period, scratch)
+    for i in range(n):
+        out[4, i] = out[5, i] + scratch[i] * bb_std
+        out[6, i] = out[5, i] - scratch[i] * bb_std
+        out[7, i] = (out[4, i] - out[6, i]) / out[5, i]
+
+    # ATR: simple average of the true range
+    _true_range(high, low, close, scratch)
+    _rolling_mean(scratch, atr_period, out[8])
+
+    # Moving averages
+    _rolling_mean(close, 20, out[9])
+    _rolling_mean(close, 50, out[10])
+    _ema(close, 20, out[11])
+    return out
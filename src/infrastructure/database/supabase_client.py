@@ -170,7 +170,7 @@ class SupabaseClient:
             df = pd.DataFrame(response.data)
             
             # Convert timestamp to datetime
-            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, format="ISO8601")
             
             logger.info(
                 f"✅ Retrieved market data",
@@ -221,7 +221,7 @@ class SupabaseClient:
                 return pd.DataFrame()
             
             df = pd.DataFrame(response.data)
-            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, format="ISO8601")
             
             # Reverse to chronological order
             df = df.sort_values("timestamp").reset_index(drop=True)
@@ -9,6 +9,7 @@ This is the warm storage repository (3+ years of historical data).
 
 import pandas as pd
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional
 
@@ -35,6 +36,9 @@ class ParquetMarketDataRepository(IMarketDataRepository):
     - Long-term trend analysis
     """
     
+    # Stored columns, in MarketData attribute names
+    COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+    
     def __init__(self, base_path: Path | str = "data/processed"):
         """
         Initialize repository.
@@ -174,34 +178,20 @@ class ParquetMarketDataRepository(IMarketDataRepository):
         if not data:
             return 0
         
-        # Convert to DataFrame
-        records = []
-        
-        for md in data:
-            records.append({
-                "timestamp": md.timestamp,
-                "open": md.open,
-                "high": md.high,
-                "low": md.low,
-                "close": md.close,
-                "volume": md.volume
-            })
-        
-        df = pd.DataFrame(records)
-        
-        # Group by year-month
-        df["year"] = df["timestamp"].dt.year
-        df["month"] = df["timestamp"].dt.month
+        # One tuple per record into a single frame (no per-row dicts)
+        df = pd.DataFrame.from_records(
+            list(map(attrgetter(*self.COLUMNS), data)),
+            columns=list(self.COLUMNS)
+        )
         
         symbol = data[0].symbol
         interval = data[0].interval
         
         saved_count = 0
         
-        for (year, month), group_df in df.groupby(["year", "month"]):
-            # Drop grouping columns
-            group_df = group_df.drop(columns=["year", "month"])
-            
+        # Group by year-month; each partition is written once
+        timestamps = df["timestamp"]
+        for (year, month), group_df in df.groupby([timestamps.dt.year, timestamps.dt.month]):
             # Check if partition exists
             try:
                 existing_df = self.manager.read_partition(symbol, interval, year, month)
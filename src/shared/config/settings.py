@@ -68,6 +68,7 @@ class Settings(BaseSettings):
     
     # ===== Storage Paths =====
     STORAGE_PATH: str = Field(default="./data/parquet", description="Local Parquet storage path")
+    DUCKDB_MEMORY_LIMIT: str = Field(default="2GB", description="Memory limit for the API's DuckDB connection")
     
     # ===== Data Processing =====
     CACHE_TTL: int = Field(default=3600, description="Cache TTL in seconds")
@@ -9,7 +9,8 @@ from unittest.mock import Mock
 import pandas as pd
 import numpy as np
 
-from src.application.services.analysis_service import AnalysisService
+from src.application.services.analysis_service import AnalysisService, LATEST_INDICATORS
+from src.domain.services.regime_classifier import RegimeClassifierService
 
 
 @pytest.fixture
@@ -66,14 +67,15 @@ def service(mock_market_data_service):
     
     mock_regime_service = Mock()
     mock_regime_service.is_fitted = True
-    mock_regime_service.classify_latest.return_value = MarketRegime(
+    bull_regime = MarketRegime(
         timestamp=datetime(2024, 1, 1),
         regime=RegimeType.BULL,
         confidence=0.85,
         probabilities={RegimeType.BULL: 0.85, RegimeType.BEAR: 0.10, RegimeType.NEUTRAL: 0.05}
     )
+    mock_regime_service.classify_latest.return_value = bull_regime
     mock_regime_service.predict_proba.return_value = {RegimeType.BULL: 0.85, RegimeType.BEAR: 0.10, RegimeType.NEUTRAL: 0.05}
-    mock_regime_service.classify.return_value = [0] * 100  # 0 = BULL
+    mock_regime_service.classify.return_value = [bull_regime] * 100
     mock_regime_service.detect_transitions.return_value = []
     
     return AnalysisService(
@@ -118,6 +120,17 @@ class TestAnalysisService:
         
         # Check market data service was called
         mock_market_data_service.get_data_as_dataframe.assert_called_once()
+        
+        # Regimes come from a single classification pass
+        assert report["regime"]["current_regime"] == "bull"
+        service.regime_service.classify.assert_called_once()
+        service.regime_service.classify_latest.assert_not_called()
+        service.regime_service.predict_proba.assert_not_called()
+        
+        # Latest indicator values are plain floats under their report keys
+        indicators = report["technical_indicators"]
+        assert list(indicators) == list(LATEST_INDICATORS)
+        assert all(isinstance(v, float) for v in indicators.values())
     
     def test_analyze_full_report_no_data(self, service, mock_market_data_service):
         """Test full analysis with no data."""
@@ -211,4 +224,47 @@ class TestAnalysisService:
         
         assert isinstance(result, dict)
         assert result == {}
-
+    
+    def test_analyze_risk_metric(self, service, mock_market_data_service):
+        """Test single risk metrics call only their own calculation."""
+        service.risk_service.calculate_max_drawdown.return_value = -0.15
+        service.risk_service.calculate_var.return_value = -0.03
+        
+        end = datetime(2024, 1, 5)
+        start = end - timedelta(days=7)
+        
+        assert service.analyze_risk_metric("btcusdt", "1h", start, end, "max_drawdown") == -0.15
+        assert service.analyze_risk_metric(
+            "btcusdt", "1h", start, end, "var", confidence_level=0.99
+        ) == -0.03
+        
+        assert service.risk_service.calculate_var.call_args.kwargs["confidence_level"] == 0.99
+        service.risk_service.calculate_all_metrics.assert_not_called()
+        
+        with pytest.raises(ValueError):
+            service.analyze_risk_metric("btcusdt", "1h", start, end, "sortino")
+    
+    def test_analyze_risk_metric_no_data(self, service, mock_market_data_service):
+        """Test single risk metric with no data returns None."""
+        mock_market_data_service.get_data_as_dataframe.return_value = pd.DataFrame()
+        
+        end = datetime(2024, 1, 5)
+        start = end - timedelta(days=7)
+        
+        assert service.analyze_risk_metric("btcusdt", "1h", start, end, "volatility") is None
+    
+    def test_regime_classifier_fitted_once(self, service):
+        """Test the classifier is only trained when unfitted or on retrain."""
+        features = pd.DataFrame({"returns": [0.01, -0.02]})
+        
+        service._ensure_fitted(features)
+        service.regime_service.fit.assert_not_called()
+        
+        service._ensure_fitted(features, retrain=True)
+        service.regime_service.fit.assert_called_once_with(features)
+        
+        service.regime_service.is_fitted = False
+        service._ensure_fitted(features)
+        assert service.regime_service.fit.call_count == 2
+        
+        assert RegimeClassifierService().is_fitted is False
@@ -4,10 +4,19 @@ Basic smoke tests for FastAPI application.
 Tests API startup, health checks, and basic endpoint structure.
 """
 
+from contextlib import contextmanager
+from unittest.mock import Mock
+import asyncio
+import queue
+
+import duckdb
+import pyarrow as pa
 import pytest
 from fastapi.testclient import TestClient
 
 from src.api.main import app
+from src.api import dependencies
+from src.api.routes import market_data
 
 
 @pytest.fixture
@@ -62,6 +71,7 @@ def test_market_data_router_registered(client):
     
     # Check paths exist
     assert "/api/v1/market-data/" in schema["paths"]
+    assert "/api/v1/market-data/stream" in schema["paths"]
     assert "/api/v1/market-data/latest" in schema["paths"]
     assert "/api/v1/market-data/download" in schema["paths"]
 
@@ -88,6 +98,120 @@ def test_scheduler_router_registered(client):
     assert "/api/v1/scheduler/stop" in schema["paths"]
 
 
+# ============================================================================
+# DUCKDB QUERIES
+# ============================================================================
+
+def test_query_duckdb_returns_typed_timestamps(monkeypatch):
+    """Test timestamps come back as Arrow timestamps without conversion."""
+    conn = duckdb.connect()
+    conn.execute("""
+        CREATE TABLE market_data AS
+        SELECT TIMESTAMP '2024-01-01 00:00:00' + INTERVAL (i) HOUR AS timestamp,
+               'BTCUSDT' AS symbol, '1h' AS interval,
+               100.0 AS open, 101.0 AS high, 99.0 AS low, 100.5 AS close, 10.0 AS volume
+        FROM range(3) t(i)
+    """)
+    
+    @contextmanager
+    def cursor():
+        yield conn
+    
+    monkeypatch.setattr(market_data, "get_db_cursor", cursor)
+    monkeypatch.setattr(market_data, "get_market_view", lambda symbol, interval: None)
+    
+    table = market_data.query_duckdb("BTCUSDT", "1h", None, None)
+    
+    assert table.num_rows == 3
+    assert pa.types.is_timestamp(table.schema.field("timestamp").type)
+
+
+def test_busy_cursor_pool_returns_503(client, monkeypatch):
+    """Test a query that finds no free cursor fails fast with 503."""
+    monkeypatch.setattr(dependencies, "get_db_engine", lambda: None)
+    monkeypatch.setattr(dependencies, "_db_cursors", queue.Queue())
+    monkeypatch.setattr(dependencies, "DB_CURSOR_TIMEOUT", 0.01)
+    
+    response = client.get("/api/v1/market-data/latest", params={"symbol": "BUSYPOOL"})
+    
+    assert response.status_code == 503
+
+
+def test_latest_candle_runs_off_event_loop(client, monkeypatch):
+    """Test /latest runs the blocking DuckDB lookup in a worker thread."""
+    on_loop = []
+    
+    def latest_candle(symbol, interval):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return None
+    
+    monkeypatch.setattr(market_data, "latest_candle", latest_candle)
+    
+    response = client.get("/api/v1/market-data/latest")
+    
+    assert response.status_code == 404
+    assert on_loop == [False]
+
+
+def test_stream_uses_dedicated_cursor(client, monkeypatch):
+    """Test /stream does not hold a pooled cursor while the client reads."""
+    conn = duckdb.connect()
+    conn.execute("""
+        CREATE TABLE market_data AS
+        SELECT TIMESTAMP '2024-01-01 00:00:00' + INTERVAL (i) HOUR AS timestamp,
+               'BTCUSDT' AS symbol, '1h' AS interval,
+               100.0::DOUBLE AS open, 101.0::DOUBLE AS high, 99.0::DOUBLE AS low,
+               100.5::DOUBLE AS close, 10.0::DOUBLE AS volume
+        FROM range(3) t(i)
+    """)
+    
+    @contextmanager
+    def cursor():
+        yield conn
+    
+    def pooled():
+        raise AssertionError("stream borrowed a pooled cursor")
+    
+    monkeypatch.setattr(market_data, "get_stream_cursor", cursor)
+    monkeypatch.setattr(market_data, "get_db_cursor", pooled)
+    monkeypatch.setattr(market_data, "get_market_view", lambda symbol, interval: None)
+    
+    response = client.get("/api/v1/market-data/stream")
+    
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 3
+
+
+def test_retrain_pipeline_takes_training_days(client):
+    """Test /pipeline/retrain submits the requested window and rejects empty ones."""
+    orchestrator = Mock()
+    scheduler_service = Mock()
+    scheduler_service.submit_job.return_value = "model_retraining_abc"
+    app.dependency_overrides[dependencies.get_orchestrator] = lambda: orchestrator
+    app.dependency_overrides[dependencies.get_scheduler_service] = lambda: scheduler_service
+    try:
+        response = client.post(
+            "/api/v1/scheduler/pipeline/retrain",
+            params={"symbol": "BTCUSDT", "training_days": 180}
+        )
+        rejected = client.post(
+            "/api/v1/scheduler/pipeline/retrain",
+            params={"training_days": 0}
+        )
+    finally:
+        app.dependency_overrides.clear()
+    
+    assert response.status_code == 202
+    assert response.json()["job_id"] == "model_retraining_abc"
+    assert scheduler_service.submit_job.call_args.kwargs["training_days"] == 180
+    assert rejected.status_code == 422
+    assert scheduler_service.submit_job.call_count == 1
+
+
 # ============================================================================
 # CORS MIDDLEWARE
 # ============================================================================
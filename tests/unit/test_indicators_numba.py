@@ -0,0 +1,184 @@
+"""
+Test: Fused Indicator Kernel
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Unit tests for the single-pass indicator kernel against the pandas reference.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.indicators import indicators_numba
+from src.indicators.indicators_numba import (
+    compute_indicators, IndicatorStream, INDICATOR_COLUMNS
+)
+
+
+@pytest.fixture
+def sample_prices():
+    """Sample price data for testing."""
+    np.random.seed(42)
+    prices = pd.Series(
+        45000 + np.cumsum(np.random.randn(300) * 100),
+        name="close"
+    )
+    return prices
+
+
+@pytest.fixture
+def pandas_reference(sample_prices):
+    """Indicators computed with the pandas rolling/ewm chain."""
+    close = sample_prices
+    ref = {}
+    ref['sma_20'] = close.rolling(20).mean()
+    ref['sma_50'] = close.rolling(50).mean()
+    ref['ema_12'] = close.ewm(span=12, adjust=False).mean()
+    ref['ema_26'] = close.ewm(span=26, adjust=False).mean()
+
+    # Wilder RSI: seed with the first 14-period mean, then alpha = 1/14
+    delta = close.diff()
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+    gain.iloc[:14] = np.nan
+    loss.iloc[:14] = np.nan
+    gain.iloc[14] = delta.iloc[1:15].clip(lower=0).mean()
+    loss.iloc[14] = -delta.iloc[1:15].clip(upper=0).mean()
+    avg_gain = gain.ewm(alpha=1 / 14, adjust=False).mean()
+    avg_loss = loss.ewm(alpha=1 / 14, adjust=False).mean()
+    ref['rsi'] = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    ref['macd'] = ref['ema_12'] - ref['ema_26']
+    ref['macd_signal'] = ref['macd'].ewm(span=9, adjust=False).mean()
+    ref['macd_histogram'] = ref['macd'] - ref['macd_signal']
+
+    bb_std = close.rolling(20).std()
+    ref['bb_middle'] = ref['sma_20']
+    ref['bb_upper'] = ref['sma_20'] + bb_std * 2
+    ref['bb_lower'] = ref['sma_20'] - bb_std * 2
+    return ref
+
+
+class TestComputeIndicators:
+    """Test cases for compute_indicators."""
+
+    def test_returns_all_columns(self, sample_prices):
+        """Test that every indicator column is produced with input length."""
+        result = compute_indicators(sample_prices)
+
+        assert tuple(result.keys()) == INDICATOR_COLUMNS
+        for values in result.values():
+            assert len(values) == len(sample_prices)
+
+    def test_matches_pandas(self, sample_prices, pandas_reference):
+        """Test values and warmup NaNs match the pandas implementation."""
+        result = compute_indicators(sample_prices)
+
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(
+                result[name], pandas_reference[name].to_numpy(),
+                rtol=1e-9, atol=1e-6, equal_nan=True, err_msg=name
+            )
+
+    def test_loop_matches_vectorized(self, sample_prices, monkeypatch):
+        """Test the per-candle loop and the pandas fallback agree."""
+        monkeypatch.setattr(indicators_numba, "NUMBA_AVAILABLE", False)
+        vectorized = compute_indicators(sample_prices)
+        monkeypatch.setattr(indicators_numba, "NUMBA_AVAILABLE", True)
+        loop = compute_indicators(sample_prices)
+
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(
+                vectorized[name], loop[name], rtol=1e-9, atol=1e-6,
+                equal_nan=True, err_msg=name
+            )
+
+    def test_rsi_all_gains(self):
+        """Test RSI is 100 when prices only rise."""
+        close = np.arange(1.0, 31.0)
+        result = compute_indicators(close)
+
+        assert np.isnan(result['rsi'][:14]).all()
+        assert (result['rsi'][14:] == 100.0).all()
+
+
+class TestIndicatorStream:
+    """Test cases for incremental IndicatorStream updates."""
+
+    def test_incremental_matches_full(self, sample_prices):
+        """Test extending in chunks gives the same arrays as one full pass."""
+        full = compute_indicators(sample_prices)
+
+        stream = IndicatorStream()
+        for end in (10, 60, 61, 200, len(sample_prices)):
+            stream.update(sample_prices.iloc[:end])
+        result = stream.arrays()
+
+        assert stream.length == len(sample_prices)
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(
+                result[name], full[name], rtol=1e-9, atol=1e-6,
+                equal_nan=True, err_msg=name
+            )
+
+    @pytest.mark.parametrize("numba_available", [False, True])
+    def test_appends_after_full_build(self, sample_prices, monkeypatch, numba_available):
+        """Test single-candle appends continue from a full build's state."""
+        monkeypatch.setattr(indicators_numba, "NUMBA_AVAILABLE", numba_available)
+        full = compute_indicators(sample_prices)
+
+        stream = IndicatorStream()
+        stream.update(sample_prices.iloc[:250])
+        for end in range(251, len(sample_prices) + 1):
+            stream.update(sample_prices.iloc[:end])
+        result = stream.arrays()
+
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(
+                result[name], full[name], rtol=1e-9, atol=1e-6,
+                equal_nan=True, err_msg=name
+            )
+
+    def test_published_arrays_unchanged(self, sample_prices):
+        """Test arrays returned earlier are not modified by later updates."""
+        stream = IndicatorStream()
+        stream.update(sample_prices.iloc[:100])
+        before = {k: v.copy() for k, v in stream.arrays().items()}
+        published = stream.arrays()
+
+        stream.update(sample_prices)
+
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_array_equal(published[name], before[name])
+
+    def test_rewritten_last_close(self, sample_prices):
+        """Test a refetched last candle is recomputed, not folded into the state."""
+        prices = sample_prices.to_numpy().copy()
+        stream = IndicatorStream()
+        stream.update(prices[:100])
+        published = {k: v.copy() for k, v in stream.arrays().items()}
+        views = stream.arrays()
+
+        # Same length, new last close
+        prices[99] += 500
+        stream.update(prices[:100])
+        # Rewrite followed by more appended candles
+        stream.update(prices[:150])
+        prices[149] -= 300
+        stream.update(prices)
+
+        full = compute_indicators(prices)
+        result = stream.arrays()
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(
+                result[name], full[name], rtol=1e-9, atol=1e-6,
+                equal_nan=True, err_msg=name
+            )
+            np.testing.assert_array_equal(views[name], published[name])
+
+    def test_shrinking_series_raises(self, sample_prices):
+        """Test a shorter history is rejected."""
+        stream = IndicatorStream()
+        stream.update(sample_prices)
+
+        with pytest.raises(ValueError):
+            stream.update(sample_prices.iloc[:50])
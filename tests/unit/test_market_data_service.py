@@ -184,6 +184,21 @@ class TestMarketDataService:
         assert count["rows_added"] == 90
         assert count["symbol"] == "btcusdt"
     
+    def test_dataframe_to_domain(self, service, mock_binance_client):
+        """Test DataFrame rows become MarketData with float fields."""
+        df = mock_binance_client.download_date_range.return_value
+        df["volume"] = 100
+        
+        data = service._dataframe_to_domain(df, "btcusdt", "1h")
+        
+        assert len(data) == len(df)
+        assert data[0].timestamp == df["timestamp"].iloc[0]
+        assert data[-1].timestamp == df["timestamp"].iloc[-1]
+        assert data[0].symbol == "btcusdt"
+        assert data[0].interval == "1h"
+        assert data[0].close == 45000.0
+        assert isinstance(data[0].volume, float)
+    
     def test_get_data(self, service, mock_repository):
         """Test data retrieval."""
         sample_data = [
@@ -256,6 +271,34 @@ class TestMarketDataService:
         assert len(df) == 1
         assert "close" in df.columns
     
+    def test_get_data_as_dataframe_cached(self, service, mock_repository):
+        """Test repeated queries reuse the frame until data is written."""
+        mock_repository.get_by_date_range.return_value = [
+            MarketData(
+                symbol="btcusdt",
+                interval="1h",
+                timestamp=pd.Timestamp("2024-01-01", tz="UTC"),
+                open=45000.0,
+                high=45100.0,
+                low=44900.0,
+                close=45000.0,
+                volume=100.0
+            )
+        ]
+        args = ("btcusdt", "1h", datetime(2024, 1, 1), datetime(2024, 1, 31))
+        
+        first = service.get_data_as_dataframe(*args)
+        first["regime"] = 0
+        second = service.get_data_as_dataframe(*args)
+        
+        assert mock_repository.get_by_date_range.call_count == 1
+        assert "regime" not in second.columns
+        
+        service.download_historical_data(*args)
+        service.get_data_as_dataframe(*args)
+        
+        assert mock_repository.get_by_date_range.call_count == 2
+    
     def test_get_data_as_dataframe_empty(self, service, mock_repository):
         """Test getting empty DataFrame when no data."""
         mock_repository.get_by_date_range.return_value = []
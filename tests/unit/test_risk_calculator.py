@@ -175,6 +175,16 @@ class TestMaxDrawdown:
         
         # Should be 0 (no drawdown)
         assert max_dd == 0
+    
+    def test_max_drawdown_matches_expanding(self, risk_calc, sample_prices):
+        """Test max drawdown matches the pandas expanding-peak formula."""
+        prices = sample_prices.copy()
+        prices.iloc[[0, 10, 50]] = np.nan
+        
+        peak = prices.expanding().max()
+        expected = ((prices - peak) / peak).min()
+        
+        assert risk_calc.calculate_max_drawdown(prices) == expected
 
 
 class TestBatchCalculations:
@@ -197,6 +207,16 @@ class TestBatchCalculations:
         assert metrics.max_drawdown <= 0
         assert metrics.volatility >= 0
     
+    def test_single_metrics_match_batch(self, risk_calc, sample_prices):
+        """Test the single-metric methods give the batch values."""
+        metrics = risk_calc.calculate_all_metrics(sample_prices)
+        returns = sample_prices.pct_change().dropna()
+        
+        assert risk_calc.calculate_volatility(returns) == metrics.volatility
+        assert risk_calc.calculate_sharpe_ratio(returns) == metrics.sharpe_ratio
+        assert risk_calc.calculate_var(returns, confidence_level=0.95) == metrics.var_95
+        assert risk_calc.calculate_max_drawdown(sample_prices) == metrics.max_drawdown
+    
     def test_metrics_validation(self, risk_calc, sample_prices):
         """Test that RiskMetrics model validates data."""
         metrics = risk_calc.calculate_all_metrics(sample_prices)
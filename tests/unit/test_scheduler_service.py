@@ -187,6 +187,44 @@ class TestSchedulerService:
         assert result["regimes_classified"] == 2
         mock_analysis_service.classify_market_regime.assert_called_once()
     
+    def test_submit_job(self, scheduler_service):
+        """Test a submitted job runs in the background and keeps its result."""
+        job_id = scheduler_service.submit_job("backfill", lambda symbol: f"done {symbol}", symbol="BTCUSDT")
+        scheduler_service._executor.shutdown(wait=True)
+        
+        job = scheduler_service.get_submitted_job(job_id)
+        assert job_id.startswith("backfill_")
+        assert job.status == "completed"
+        assert job.metadata["result"] == "done BTCUSDT"
+        assert job_id not in scheduler_service.jobs
+    
+    def test_submit_job_failure(self, scheduler_service):
+        """Test a failing submitted job records its error."""
+        def fail():
+            raise ValueError("boom")
+        
+        job_id = scheduler_service.submit_job("retrain", fail)
+        scheduler_service._executor.shutdown(wait=True)
+        
+        job = scheduler_service.get_submitted_job(job_id)
+        assert job.status == "failed"
+        assert job.error_count == 1
+        assert "boom" in job.metadata["error"]
+    
+    def test_submitted_job_history(self, scheduler_service):
+        """Test finished jobs are kept until the history cap is exceeded."""
+        # Run jobs inline so each one has finished before the next submit
+        scheduler_service._executor = Mock(submit=lambda fn, *args: fn(*args))
+        
+        with patch("src.application.services.scheduler_service.SUBMITTED_JOB_HISTORY", 5):
+            job_ids = [scheduler_service.submit_job("backfill", lambda: None) for _ in range(5)]
+            assert len(scheduler_service.submitted_jobs) == 5
+            assert all(scheduler_service.get_submitted_job(j).status == "completed" for j in job_ids)
+            
+            # Over the cap, the oldest finished jobs are dropped
+            job_ids += [scheduler_service.submit_job("backfill", lambda: None) for _ in range(2)]
+            assert list(scheduler_service.submitted_jobs) == job_ids[2:]
+    
     def test_trigger_job_not_found(self, scheduler_service):
         """Test triggering non-existent job raises error."""
         with pytest.raises(AppException, match="Job not found"):
@@ -0,0 +1,76 @@
+"""
+Test: Composite Signal Scoring
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Unit tests for the table-driven composite score kernel.
+"""
+
+import itertools
+import numpy as np
+from src.api.scoring_numba import (
+    encode_signals, factors_for, score, score_batch, CODE_FIELDS
+)
+
+
+REGIMES = [('Bull', 0.9), ('Bull', 0.5), ('Bear', 0.9), ('Bear', 0.5), ('Sideways', 0.9)]
+DIRECTIONS = [1, -1, 0, float('nan')]
+FUNDING = ['EXTREME_SHORT', 'EXTREME_LONG', 'NEUTRAL', 'UNKNOWN']
+MVRV = ['ACCUMULATION', 'OVERVALUED', 'FAIR']
+
+
+def reference_score(regime, probability, kama_cross, kama_trend, funding, mvrv):
+    """Score as computed by the original if/elif chain."""
+    total = 0
+    if regime == 'Bull':
+        total += 30 if probability > 0.7 else 15
+    elif regime == 'Bear':
+        total -= 30 if probability > 0.7 else 15
+
+    if kama_cross == 1:
+        total += 30
+    elif kama_cross == -1:
+        total -= 30
+    elif kama_trend == 1:
+        total += 15
+    elif kama_trend == -1:
+        total -= 15
+
+    total += {'EXTREME_SHORT': 20, 'EXTREME_LONG': -20, 'NEUTRAL': 5}.get(funding, 0)
+    total += {'ACCUMULATION': 20, 'OVERVALUED': -10}.get(mvrv, 0)
+    return total
+
+
+def all_cases():
+    for (regime, prob), cross, trend, funding, mvrv in itertools.product(
+        REGIMES, DIRECTIONS, DIRECTIONS, FUNDING, MVRV
+    ):
+        yield regime, prob, cross, trend, funding, mvrv
+
+
+class TestScore:
+    """Test cases for score and factors_for."""
+
+    def test_matches_reference(self):
+        """Test every signal combination against the if/elif scoring."""
+        for case in all_cases():
+            codes = encode_signals(*case)
+            assert score(*codes) == reference_score(*case), case
+
+    def test_factor_weights_sum_to_score(self):
+        """Test the reported factors add up to the score."""
+        for case in all_cases():
+            codes = encode_signals(*case)
+            factors, kama_signal = factors_for(codes)
+
+            assert sum(f['weight'] for f in factors) == score(*codes)
+            assert kama_signal in ('BUY', 'SELL', 'BULLISH', 'BEARISH', 'NEUTRAL')
+            # Unknown funding signals add no factor
+            assert len(factors) == (3 if case[4] == 'UNKNOWN' else 4)
+
+    def test_batch_matches_scalar(self):
+        """Test score_batch returns the same values as score."""
+        codes = np.array([encode_signals(*case) for case in all_cases()])
+        assert codes.shape[1] == len(CODE_FIELDS)
+
+        expected = [score(*row) for row in codes.tolist()]
+        np.testing.assert_array_equal(score_batch(codes), expected)
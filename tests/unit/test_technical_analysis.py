@@ -9,6 +9,7 @@ import pytest
 import pandas as pd
 import numpy as np
 from src.domain.services.technical_analysis import TechnicalAnalysisService
+from src.indicators.ta_kernels import ta_indicators, TA_COLUMNS
 from src.shared.exceptions.custom_exceptions import TechnicalIndicatorError
 
 
@@ -201,6 +202,23 @@ class TestBatchCalculations:
         assert "close" in result.columns
         assert "volume" in result.columns
     
+    def test_kernels_match_pandas(self, ta_service, sample_ohlc):
+        """Test the Numba kernel path gives the pandas indicator values."""
+        block = ta_indicators(
+            sample_ohlc["high"].to_numpy(dtype=np.float64),
+            sample_ohlc["low"].to_numpy(dtype=np.float64),
+            sample_ohlc["close"].to_numpy(dtype=np.float64),
+            14, 12, 26, 9, 20, 2.0, 14
+        )
+        expected = ta_service._pandas_indicators(sample_ohlc, 14, 12, 26, 9, 20, 2.0, 14)
+        
+        assert tuple(expected.keys()) == TA_COLUMNS
+        for row, name in enumerate(TA_COLUMNS):
+            np.testing.assert_allclose(
+                block[row], expected[name].to_numpy(),
+                rtol=1e-9, atol=1e-8, equal_nan=True, err_msg=name
+            )
+    
     def test_extract_features_for_regime(self, ta_service, sample_ohlc):
         """Test feature extraction for regime classification."""
         features = ta_service.extract_features_for_regime_classification(sample_ohlc)